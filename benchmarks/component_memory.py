@@ -0,0 +1,111 @@
+"""
+Memory and build-time benchmark for component classes.
+
+Reports bytes per component (including its list slot) for the slotted classes
+next to a plain dict-backed object carrying the same attributes, the layout
+components had before ``__slots__``, plus the time to construct each batch.
+
+    python benchmarks/component_memory.py --count 100000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from pyladdersim.components import (
+    Contact,
+    CounterDown,
+    CounterUp,
+    FallingEdgeContact,
+    InvertedContact,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    PulseTimer,
+    RetentiveOutput,
+    RisingEdgeContact,
+)
+
+FACTORIES = {
+    # A shared name keeps string allocations out of the per-object figures.
+    "Contact": lambda i: Contact("C"),
+    "InvertedContact": lambda i: InvertedContact("C"),
+    "RisingEdgeContact": lambda i: RisingEdgeContact("C"),
+    "FallingEdgeContact": lambda i: FallingEdgeContact("C"),
+    "Output": lambda i: Output("C"),
+    "RetentiveOutput": lambda i: RetentiveOutput("C"),
+    "OnDelayTimer": lambda i: OnDelayTimer("C", PT=10),
+    "OffDelayTimer": lambda i: OffDelayTimer("C", PT=10),
+    "PulseTimer": lambda i: PulseTimer("C", PT=10),
+    "CounterUp": lambda i: CounterUp("C", preset=10),
+    "CounterDown": lambda i: CounterDown("C", preset=10),
+}
+
+
+def _dict_backed_class():
+    """Plain class with instance dicts, standing in for the old layout."""
+
+    # A fresh class per component type keeps CPython's shared-key dicts intact.
+    class DictBacked:
+        def __init__(self, fields):
+            for name, value in fields:
+                setattr(self, name, value)
+
+    return DictBacked
+
+
+def _fields(component):
+    names = []
+    for cls in reversed(type(component).__mro__):
+        for name in cls.__dict__.get("__slots__", ()):
+            if name != "_tag" and name not in names and hasattr(component, name):
+                names.append(name)
+    return [(name, getattr(component, name)) for name in names]
+
+
+def _bytes_per_object(build, count):
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    items = [build(i) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del items
+    return used / count
+
+
+def _build_seconds(build, count):
+    start = time.perf_counter()
+    items = [build(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    del items
+    return elapsed
+
+
+def run(count):
+    results = {}
+    for name, factory in FACTORIES.items():
+        fields = _fields(factory(0))
+        dict_backed = _dict_backed_class()
+        results[name] = {
+            "dict_bytes": _bytes_per_object(lambda i: dict_backed(fields), count),
+            "slots_bytes": _bytes_per_object(factory, count),
+            "build_seconds": _build_seconds(factory, count),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'component':<20}{'dict B/obj':>12}{'slots B/obj':>13}{'build s':>10}")
+    for name, row in run(args.count).items():
+        print(
+            f"{name:<20}{row['dict_bytes']:>12.1f}{row['slots_bytes']:>13.1f}"
+            f"{row['build_seconds']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
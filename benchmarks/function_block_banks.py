@@ -0,0 +1,63 @@
+"""
+Per-scan update cost of scalar function blocks versus NumPy-backed banks.
+
+Updates ``--size`` OnDelayTimer and CounterUp instances one method call at a
+time, then the same number of elements through ``TimerArray.evaluate`` and
+``CounterArray.evaluate`` with one IN vector per scan, and reports scans per
+second for each.
+
+    python benchmarks/function_block_banks.py --size 10000 --scans 200
+"""
+
+import argparse
+import random
+
+import numpy as np
+
+from pyladdersim.banks import CounterArray, TimerArray
+from pyladdersim.compiler import measure_scan_rate
+from pyladdersim.components import CounterUp, OnDelayTimer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--scans", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    inputs = [rng.random() < 0.7 for _ in range(args.size)]
+    vector = np.array(inputs)
+
+    timers = [OnDelayTimer(f"T{index}", PT=50) for index in range(args.size)]
+    counters = [CounterUp(f"C{index}", preset=50) for index in range(args.size)]
+    timer_bank = TimerArray("T", args.size, PT=50)
+    counter_bank = CounterArray("C", args.size, preset=50)
+    phase = [False]
+
+    def scalar_timers():
+        for timer, value in zip(timers, inputs):
+            timer.evaluate(value)
+
+    def scalar_counters():
+        phase[0] = not phase[0]
+        for counter, value in zip(counters, inputs):
+            counter.evaluate(value and phase[0])
+
+    def bank_counters():
+        phase[0] = not phase[0]
+        counter_bank.evaluate(vector & phase[0])
+
+    print(f"{args.size} blocks per bank")
+    print(f"{'block':<14}{'scalar scans/s':>16}{'bank scans/s':>14}{'speedup':>10}")
+    for label, scalar, bank in (
+        ("OnDelayTimer", scalar_timers, lambda: timer_bank.evaluate(vector)),
+        ("CounterUp", scalar_counters, bank_counters),
+    ):
+        scalar_rate = measure_scan_rate(scalar, args.scans)
+        bank_rate = measure_scan_rate(bank, args.scans)
+        print(f"{label:<14}{scalar_rate:>16.1f}{bank_rate:>14.1f}{bank_rate / scalar_rate:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
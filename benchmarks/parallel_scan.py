@@ -0,0 +1,72 @@
+"""
+Scan-rate scaling of rung-partition parallel evaluation.
+
+Builds a synthetic ladder of independent rungs (every tenth with a timer)
+and reports scans per second for the serial interpreter and for
+``Ladder.enable_parallel`` at increasing worker counts. Threads only scale
+on free-threaded CPython builds; with the GIL expect flat or lower numbers.
+
+    python benchmarks/parallel_scan.py --rungs 100000 --scans 20
+"""
+
+import argparse
+import os
+import sys
+
+from pyladdersim.compiler import measure_scan_rate
+from pyladdersim.components import Contact, InvertedContact, OnDelayTimer, Output
+from pyladdersim.ladder import Ladder, Rung
+
+
+def build_ladder(rungs):
+    ladder = Ladder()
+    for index in range(rungs):
+        start = Contact(f"S{index}")
+        start.state = index % 3 != 0
+        components = [start, InvertedContact(f"X{index}")]
+        if index % 10 == 0:
+            components.append(OnDelayTimer(f"T{index}", PT=5))
+        components.append(Output(f"Y{index}"))
+        ladder.add_rung(Rung(components))
+    return ladder
+
+
+def worker_counts(limit):
+    counts = []
+    workers = 1
+    while workers < limit:
+        counts.append(workers)
+        workers *= 2
+    counts.append(limit)
+    return counts
+
+
+def run(rungs, scans, max_workers):
+    ladder = build_ladder(rungs)
+    results = {"serial": measure_scan_rate(ladder.scan_once, scans)}
+    for workers in worker_counts(max_workers):
+        ladder.enable_parallel(workers=workers)
+        results[workers] = measure_scan_rate(ladder.scan_once, scans)
+        ladder.disable_parallel()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rungs", type=int, default=100_000)
+    parser.add_argument("--scans", type=int, default=20)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{args.rungs} rungs, {os.cpu_count()} cores, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'engine':<12}{'scans/s':>12}{'speedup':>10}")
+    results = run(args.rungs, args.scans, args.max_workers)
+    serial = results["serial"]
+    for engine, rate in results.items():
+        label = engine if engine == "serial" else f"workers={engine}"
+        print(f"{label:<12}{rate:>12.2f}{rate / serial:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Import speed and peak memory of the streaming PLCopen XML importer.
+
+Writes a synthetic TC6 export with one POU per ``--rungs-per-pou`` networks
+(contacts, a TON or CTU block and a coil each), imports it with
+``Ladder.from_plcopen`` and reports MB/s and traced memory. The peak is the
+resulting ladder plus the largest POU's records, not the file's DOM.
+
+    python benchmarks/plcopen_import.py --rungs 200000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from pyladdersim.ladder import Ladder
+
+_HEADER = '<?xml version="1.0"?>\n<project xmlns="http://www.plcopen.org/xml/tc6_0201"><types><pous>\n'
+_FOOTER = "</pous></types></project>\n"
+
+
+def _network(index, base):
+    start, stop, block, preset, out = (base + offset for offset in range(1, 6))
+    kind, pin, value = ("TON", "IN", "T#5s") if index % 2 else ("CTU", "CU", "3")
+    return (
+        f'<contact localId="{start}"><connectionPointIn><connection refLocalId="1"/></connectionPointIn>'
+        f"<variable>S{index}</variable></contact>"
+        f'<contact localId="{stop}" negated="true"><connectionPointIn><connection refLocalId="{start}"/>'
+        f"</connectionPointIn><variable>X{index}</variable></contact>"
+        f'<block localId="{block}" typeName="{kind}" instanceName="B{index}"><inputVariables>'
+        f'<variable formalParameter="{pin}"><connectionPointIn><connection refLocalId="{stop}"/></connectionPointIn></variable>'
+        f'<variable formalParameter="{"PT" if kind == "TON" else "PV"}"><connectionPointIn>'
+        f'<connection refLocalId="{preset}"/></connectionPointIn></variable></inputVariables></block>'
+        f'<inVariable localId="{preset}"><expression>{value}</expression></inVariable>'
+        f'<coil localId="{out}"><connectionPointIn><connection refLocalId="{block}" formalParameter="Q"/>'
+        f"</connectionPointIn><variable>Y{index}</variable></coil>\n"
+    )
+
+
+def write_export(path, rungs, rungs_per_pou):
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(_HEADER)
+        for first in range(0, rungs, rungs_per_pou):
+            handle.write(f'<pou name="P{first}" pouType="program"><body><LD><leftPowerRail localId="1"/>\n')
+            for index in range(first, min(first + rungs_per_pou, rungs)):
+                handle.write(_network(index, (index - first) * 5 + 1))
+            handle.write("</LD></body></pou>\n")
+        handle.write(_FOOTER)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rungs", type=int, default=200_000)
+    parser.add_argument("--rungs-per-pou", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "export.xml")
+        write_export(path, args.rungs, args.rungs_per_pou)
+        size = os.path.getsize(path) / 1e6
+
+        start = time.perf_counter()
+        ladder = Ladder.from_plcopen(path, cycle_time=0.1)
+        elapsed = time.perf_counter() - start
+        rungs = len(ladder.rungs)
+        del ladder
+
+        # Second, traced import: tracemalloc slows parsing, so it is not timed.
+        tracemalloc.start()
+        ladder = Ladder.from_plcopen(path, cycle_time=0.1)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"{size:.1f} MB export, {rungs} rungs")
+    print(f"import: {elapsed:.2f} s ({size / elapsed:.1f} MB/s)")
+    print(f"traced memory: {retained / 1e6:.1f} MB retained by the ladder, {peak / 1e6:.1f} MB peak")
+
+
+if __name__ == "__main__":
+    main()
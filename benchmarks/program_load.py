@@ -0,0 +1,77 @@
+"""
+Build, save and load times for very large ladders.
+
+Builds a synthetic ladder (every tenth rung with a timer, every twentieth
+with a counter) through ``add_rung``, saves it with ``Ladder.save`` and
+reports how long ``Ladder.load`` takes with and without ``compile``, and
+how long the first compiled scan takes (it compiles the generated code to
+bytecode). Each step keeps the best of ``--repeats`` runs.
+
+    python benchmarks/program_load.py --rungs 50000
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+
+from pyladdersim.components import Contact, CounterUp, InvertedContact, OnDelayTimer, Output
+from pyladdersim.ladder import Ladder, Rung
+
+
+def build_ladder(rungs):
+    ladder = Ladder()
+    for index in range(rungs):
+        components = [Contact(f"S{index}"), InvertedContact(f"X{index}")]
+        if index % 10 == 0:
+            components.append(OnDelayTimer(f"T{index}", PT=5))
+        if index % 20 == 0:
+            components.append(CounterUp(f"C{index}", preset=3))
+        components.append(Output(f"Y{index}"))
+        ladder.add_rung(Rung(components))
+    return ladder
+
+
+def timed(function, *args, repeats=1, **kwargs):
+    best = None
+    for _ in range(repeats):
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rungs", type=int, default=50_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "program.plsprog")
+        ladder, build = timed(build_ladder, args.rungs, repeats=args.repeats)
+        _, save = timed(ladder.save, path, repeats=args.repeats)
+        del ladder
+        _, load = timed(Ladder.load, path, repeats=args.repeats)
+        loaded, load_compiled = timed(Ladder.load, path, compile=True, repeats=args.repeats)
+        _, first_scan = timed(loaded.scan_once)
+        size = os.path.getsize(path)
+
+    print(f"{args.rungs} rungs, {size / 1e6:.2f} MB on disk")
+    print(f"{'step':<24}{'seconds':>10}")
+    for label, seconds in (
+        ("build (add_rung)", build),
+        ("save", save),
+        ("load", load),
+        ("load (compile=True)", load_compiled),
+        ("first compiled scan", first_scan),
+    ):
+        print(f"{label:<24}{seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Scan rate of short-circuit power flow on long contact chains.
+
+Builds rungs of ``--length`` series contacts (with a timer in every tenth
+rung) where the contact at ``--open-at`` is open, then reports scans per
+second for full evaluation and for short-circuit evaluation. Both engines
+must leave identical outputs and timer state.
+
+    python benchmarks/short_circuit.py --rungs 1000 --length 50 --open-at 5
+"""
+
+import argparse
+
+from pyladdersim.compiler import measure_scan_rate
+from pyladdersim.components import Contact, OnDelayTimer, Output
+from pyladdersim.ladder import Ladder, Rung
+
+
+def build_ladder(rungs, length, open_at, short_circuit):
+    ladder = Ladder()
+    for index in range(rungs):
+        contacts = [Contact(f"R{index}C{position}") for position in range(length)]
+        for position, contact in enumerate(contacts):
+            contact.state = position != open_at
+        components = contacts
+        if index % 10 == 0:
+            components = contacts[: length // 2] + [OnDelayTimer(f"T{index}", PT=5)] + contacts[length // 2:]
+        ladder.add_rung(Rung(components + [Output(f"Y{index}")], short_circuit=short_circuit))
+    return ladder
+
+
+def _state(ladder):
+    return [(component.state, getattr(component, "ET", None)) for component in ladder.components()]
+
+
+def run(rungs, length, open_at, scans):
+    results = {}
+    states = []
+    for label, short_circuit in (("full", False), ("short-circuit", True)):
+        ladder = build_ladder(rungs, length, open_at, short_circuit)
+        results[label] = measure_scan_rate(ladder.scan_once, scans)
+        states.append(_state(ladder))
+    if states[0] != states[1]:
+        raise AssertionError("short-circuit evaluation diverged from full evaluation")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rungs", type=int, default=1000)
+    parser.add_argument("--length", type=int, default=50)
+    parser.add_argument("--open-at", type=int, default=5)
+    parser.add_argument("--scans", type=int, default=200)
+    args = parser.parse_args()
+
+    results = run(args.rungs, args.length, args.open_at, args.scans)
+    full = results["full"]
+    print(f"{args.rungs} rungs x {args.length} contacts, open contact at {args.open_at}")
+    print(f"{'engine':<15}{'scans/s':>12}{'speedup':>10}")
+    for label, rate in results.items():
+        print(f"{label:<15}{rate:>12.1f}{rate / full:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+Benchmark suite over synthetic ladders with JSON results and regression gates.
+
+``run`` builds parameterized synthetic ladders (rung count, chain length and
+a mix of contacts, edge contacts, timers and counters), then measures build
+time, peak traced memory, scans per second and per-scan latency percentiles
+for each engine, keeps the best of ``--repeats`` runs and writes everything
+to a JSON file. ``compare`` checks a new results file against a baseline and
+exits with status 1 when a tracked metric is worse by more than the
+threshold and by more than its noise floor.
+
+    python benchmarks/suite.py run --cases tiny,small,medium --output current.json
+    python benchmarks/suite.py run --rungs 5000 --chain 12 --mix contact=0.7,timer=0.3
+    python benchmarks/suite.py compare baseline.json current.json --threshold 0.15
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from pyladdersim.components import (
+    Contact,
+    CounterDown,
+    CounterUp,
+    FallingEdgeContact,
+    InvertedContact,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    PulseTimer,
+    RisingEdgeContact,
+)
+from pyladdersim.ladder import Ladder, Rung
+
+# Named sizes, about 10 to 1M components each (chain + one output per rung).
+CASES = {
+    "tiny": {"rungs": 2, "chain": 4},
+    "small": {"rungs": 100, "chain": 9},
+    "medium": {"rungs": 10_000, "chain": 9},
+    "large": {"rungs": 100_000, "chain": 9},
+}
+DEFAULT_MIX = {"contact": 0.8, "edge": 0.08, "timer": 0.08, "counter": 0.04}
+ENGINES = ("interpreted", "compiled")
+
+# Tracked metric -> True when larger values are better.
+METRICS = {
+    "scans_per_second": True,
+    "latency_p50_ms": False,
+    "latency_p95_ms": False,
+    "build_seconds": False,
+    "peak_memory_bytes": False,
+}
+# Smallest absolute change that can count as a regression, in each metric's
+# cost unit (scans/s is compared as ms per scan). Below this, timer
+# resolution and scheduling noise dominate tiny cases.
+NOISE_FLOORS = {
+    "scans_per_second": 0.002,
+    "latency_p50_ms": 0.002,
+    "latency_p95_ms": 0.005,
+    "build_seconds": 0.005,
+    "peak_memory_bytes": 65536,
+}
+
+
+def parse_mix(text):
+    """Read ``kind=weight,...``; errors surface as argparse usage errors."""
+    mix = {}
+    for item in text.split(","):
+        kind, _, weight = item.partition("=")
+        if kind not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"unknown component kind {kind!r}; use {', '.join(DEFAULT_MIX)}")
+        try:
+            mix[kind] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"{item!r} is not kind=weight") from None
+        if not math.isfinite(mix[kind]) or mix[kind] < 0:
+            raise argparse.ArgumentTypeError(f"{item!r} needs a finite weight >= 0")
+    if sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("the mix needs a positive weight")
+    return mix
+
+
+def build_ladder(rungs, chain, mix=None, seed=0):
+    """
+    Synthetic ladder of ``rungs`` rungs with ``chain`` elements before each
+    output, drawn from ``mix`` (kind -> weight). Returns the ladder and its
+    input contacts.
+    """
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    kinds, weights = list(mix), list(mix.values())
+    ladder = Ladder()
+    inputs = []
+    for index in range(rungs):
+        components = []
+        for position, kind in enumerate(rng.choices(kinds, weights, k=chain)):
+            name = f"R{index}E{position}"
+            if kind == "contact":
+                component = (Contact if rng.random() < 0.8 else InvertedContact)(name)
+                component.state = rng.random() < 0.9
+                inputs.append(component)
+            elif kind == "edge":
+                component = (RisingEdgeContact if rng.random() < 0.5 else FallingEdgeContact)(name)
+                inputs.append(component)
+            elif kind == "timer":
+                component = rng.choice((OnDelayTimer, OffDelayTimer, PulseTimer))(name, PT=rng.randint(1, 20))
+            else:
+                component = rng.choice((CounterUp, CounterDown))(name, preset=rng.randint(1, 20))
+            components.append(component)
+        ladder.add_rung(Rung(components + [Output(f"Y{index}")]))
+    return ladder, inputs
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(ladder, inputs, scans, seed=0):
+    """Scan ``scans`` times, toggling about 1% of the inputs between scans."""
+    rng = random.Random(seed)
+    toggles = [rng.sample(inputs, max(1, len(inputs) // 100)) if inputs else [] for _ in range(min(scans, 64))]
+    latencies = []
+    scan_once = ladder.scan_once
+    clock = time.perf_counter_ns
+    for scan in range(scans):
+        for component in toggles[scan % len(toggles)]:
+            component.state = not component.state
+        start = clock()
+        scan_once()
+        latencies.append(clock() - start)
+    ordered = sorted(latencies)
+    total = sum(latencies) / 1e9
+    return {
+        "scans": scans,
+        "scans_per_second": scans / total if total else float("inf"),
+        "latency_p50_ms": _percentile(ordered, 0.50) / 1e6,
+        "latency_p95_ms": _percentile(ordered, 0.95) / 1e6,
+        "latency_p99_ms": _percentile(ordered, 0.99) / 1e6,
+        "latency_max_ms": ordered[-1] / 1e6,
+    }
+
+
+def best(runs):
+    """Best value of each metric over repeated runs, following its direction."""
+    merged = {}
+    for metric in runs[0]:
+        values = [run[metric] for run in runs]
+        merged[metric] = max(values) if METRICS.get(metric) else min(values)
+    return merged
+
+
+def run_case(rungs, chain, mix, scans, engines, memory=True, seed=0, repeats=1):
+    components = rungs * (chain + 1)
+    if scans is None:
+        scans = max(5, min(1000, 2_000_000 // components))
+
+    peak = None
+    if memory:
+        # A separate, traced build: tracemalloc slows allocation, so it is not timed.
+        gc.collect()
+        tracemalloc.start()
+        build_ladder(rungs, chain, mix, seed)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    # Every repeat builds a fresh ladder so the best run is not tied to one
+    # allocation layout.
+    builds, runs = [], {engine: [] for engine in engines}
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        ladder, inputs = build_ladder(rungs, chain, mix, seed)
+        builds.append(time.perf_counter() - start)
+        for engine in engines:
+            if engine == "compiled":
+                ladder.compile()
+                # The first compiled scan builds the bytecode; keep it untimed.
+                ladder.scan_once()
+            elif engine == "interpreted":
+                ladder.decompile()
+            else:
+                raise ValueError(f"Unknown engine {engine!r}; use {', '.join(ENGINES)}.")
+            runs[engine].append(measure(ladder, inputs, scans, seed))
+        del ladder, inputs
+
+    return {
+        "rungs": rungs,
+        "chain": chain,
+        "components": components,
+        "mix": mix,
+        "repeats": repeats,
+        "build_seconds": min(builds),
+        "peak_memory_bytes": peak,
+        "engines": {engine: best(metrics) for engine, metrics in runs.items()},
+    }
+
+
+def flatten(results):
+    """Map ``case/metric`` and ``case/engine/metric`` keys to tracked values."""
+    values = {}
+    for case, result in results["cases"].items():
+        for metric in ("build_seconds", "peak_memory_bytes"):
+            if result.get(metric) is not None:
+                values[f"{case}/{metric}"] = result[metric]
+        for engine, metrics in result["engines"].items():
+            for metric in METRICS:
+                if metric in metrics:
+                    values[f"{case}/{engine}/{metric}"] = metrics[metric]
+    return values
+
+
+def _cost(metric, value):
+    # Scans/s becomes ms per scan so that its floor is an absolute time.
+    return 1000 / value if metric == "scans_per_second" else value
+
+
+def compare(baseline, current, threshold, metrics=None, floors=NOISE_FLOORS):
+    """
+    Return ``(rows, regressions)`` where each row is
+    ``(key, baseline, current, relative_change, regressed)``. The change is
+    signed so that positive means worse, whatever the metric's direction. A
+    row regresses when the change exceeds ``threshold`` and the absolute
+    change exceeds the metric's entry in ``floors``.
+    """
+    tracked = set(metrics or METRICS)
+    old, new = flatten(baseline), flatten(current)
+    rows = []
+    for key in sorted(old.keys() & new.keys()):
+        metric = key.rpartition("/")[2]
+        if metric not in tracked or not old[key] or not new[key]:
+            continue
+        change = (new[key] - old[key]) / old[key]
+        if METRICS[metric]:
+            change = -change
+        delta = abs(_cost(metric, new[key]) - _cost(metric, old[key]))
+        rows.append((key, old[key], new[key], change, change > threshold and delta > floors.get(metric, 0)))
+    return rows, [row for row in rows if row[4]]
+
+
+def command_run(args):
+    if args.rungs is not None or args.chain is not None:
+        cases = {"custom": {"rungs": args.rungs or 1000, "chain": args.chain or 9}}
+    else:
+        names = args.cases.split(",")
+        unknown = [name for name in names if name not in CASES]
+        if unknown:
+            raise SystemExit(f"Unknown case {unknown[0]!r}; choose from {', '.join(CASES)}.")
+        cases = {name: CASES[name] for name in names}
+    if args.repeats < 1:
+        raise SystemExit("--repeats must be >= 1.")
+    mix = args.mix or dict(DEFAULT_MIX)
+    engines = args.engines.split(",")
+
+    results = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "cases": {},
+    }
+    print(f"{'case':<10}{'components':>12}{'build s':>10}{'peak MB':>10}  {'engine':<12}{'scans/s':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, case in cases.items():
+        result = run_case(
+            case["rungs"], case["chain"], mix, args.scans, engines,
+            memory=not args.no_memory, seed=args.seed, repeats=args.repeats,
+        )
+        results["cases"][name] = result
+        peak = "-" if result["peak_memory_bytes"] is None else f"{result['peak_memory_bytes'] / 1e6:.1f}"
+        for engine, metrics in result["engines"].items():
+            print(
+                f"{name:<10}{result['components']:>12}{result['build_seconds']:>10.3f}{peak:>10}  {engine:<12}"
+                f"{metrics['scans_per_second']:>12.1f}{metrics['latency_p50_ms']:>10.3f}"
+                f"{metrics['latency_p95_ms']:>10.3f}{metrics['latency_p99_ms']:>10.3f}"
+            )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+        print(f"results written to {args.output}")
+
+
+def command_compare(args):
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    with open(args.current, encoding="utf-8") as handle:
+        current = json.load(handle)
+    metrics = args.metrics.split(",") if args.metrics else None
+    if metrics:
+        unknown = [metric for metric in metrics if metric not in METRICS]
+        if unknown:
+            raise SystemExit(f"Unknown metric {unknown[0]!r}; choose from {', '.join(METRICS)}.")
+
+    rows, regressions = compare(baseline, current, args.threshold, metrics, {} if args.no_floor else NOISE_FLOORS)
+    if not rows:
+        raise SystemExit("No tracked metrics in common between the two results files.")
+    print(f"{'metric':<48}{'baseline':>14}{'current':>14}{'worse by':>10}")
+    for key, old, new, change, regressed in rows:
+        print(f"{key:<48}{old:>14.4g}{new:>14.4g}{change:>9.1%}{'  REGRESSION' if regressed else ''}")
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}.")
+        sys.exit(1)
+    print(f"no regressions beyond {args.threshold:.0%}.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="benchmark synthetic ladders and write JSON results")
+    run.add_argument("--cases", default="tiny,small,medium", help=f"comma-separated from {', '.join(CASES)}")
+    run.add_argument("--rungs", type=int, help="custom case: number of rungs")
+    run.add_argument("--chain", type=int, help="custom case: elements before each output")
+    run.add_argument("--mix", type=parse_mix, help="kind=weight list over contact, edge, timer, counter")
+    run.add_argument("--engines", default=",".join(ENGINES))
+    run.add_argument("--scans", type=int, help="scans per engine (default scales with size)")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--repeats", type=int, default=5, help="runs per engine; the best value of each metric is kept")
+    run.add_argument("--no-memory", action="store_true", help="skip the traced build")
+    run.add_argument("--output", help="path of the JSON results file")
+    run.set_defaults(handler=command_run)
+
+    check = commands.add_parser("compare", help="fail when tracked metrics regress")
+    check.add_argument("baseline")
+    check.add_argument("current")
+    check.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown (0.10 = 10%%)")
+    check.add_argument("--metrics", help=f"comma-separated from {', '.join(METRICS)}")
+    check.add_argument("--no-floor", action="store_true", help="flag changes below the noise floors too")
+    check.set_defaults(handler=command_compare)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
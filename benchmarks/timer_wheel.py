@@ -0,0 +1,56 @@
+"""
+Scan rate with scan-counted timers versus wall-clock timers on a timer wheel.
+
+Builds ``--timers`` rungs, each a closed contact driving a running TON, and
+reports scans per second for scan-counted ``OnDelayTimer`` and for
+``WallClockOnDelayTimer`` on a ``TimerWheel``, with the interpreted and the
+incremental engine. Presets are long, so no timer expires during the run
+and the incremental wheel scan only pays for the wheel tick.
+
+    python benchmarks/timer_wheel.py --timers 100000 --scans 20
+"""
+
+import argparse
+
+from pyladdersim.compiler import measure_scan_rate
+from pyladdersim.components import Contact, OnDelayTimer, Output
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.timerwheel import WallClockOnDelayTimer
+
+
+def build_ladder(timers, wall_clock):
+    ladder = Ladder()
+    for index in range(timers):
+        start = Contact(f"S{index}")
+        start.activate()
+        if wall_clock:
+            timer = WallClockOnDelayTimer(f"T{index}", PT=3_600_000 + index)
+        else:
+            timer = OnDelayTimer(f"T{index}", PT=1_000_000)
+        ladder.add_rung(Rung([start, timer, Output(f"Y{index}")]))
+    if wall_clock:
+        ladder.enable_timer_wheel()
+    return ladder
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--timers", type=int, default=100_000)
+    parser.add_argument("--scans", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.timers} running timers")
+    print(f"{'timers':<14}{'engine':<14}{'scans/s':>12}")
+    for label, wall_clock in (("scan-counted", False), ("wall-clock", True)):
+        for engine in ("interpreted", "incremental"):
+            ladder = build_ladder(args.timers, wall_clock)
+            ladder.scan_once()  # start every timer
+            if engine == "incremental":
+                ladder.enable_incremental()
+                ladder.scan_once()
+            rate = measure_scan_rate(ladder.scan_once, args.scans)
+            print(f"{label:<14}{engine:<14}{rate:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
+from pyladdersim.branches import Parallel, Series
 from pyladdersim.components import (
+    CoilContact,
     Component,
     Contact,
     CounterDown,
@@ -10,6 +12,7 @@ from pyladdersim.components import (
     OnDelayTimer,
     Output,
     PulseTimer,
+    ResetOutput,
     RetentiveOutput,
     RisingEdgeContact,
     Timer,
@@ -17,6 +20,7 @@ from pyladdersim.components import (
 from pyladdersim.ladder import Ladder, Rung
 
 __all__ = [
+    "CoilContact",
     "Component",
     "Contact",
     "CounterDown",
@@ -28,9 +32,12 @@ __all__ = [
     "OffDelayTimer",
     "OnDelayTimer",
     "Output",
+    "Parallel",
     "PulseTimer",
+    "ResetOutput",
     "RetentiveOutput",
     "RisingEdgeContact",
     "Rung",
+    "Series",
     "Timer",
 ]
@@ -0,0 +1,183 @@
+import numpy as np
+
+from pyladdersim.components import CounterDown, CounterUp, OffDelayTimer, OnDelayTimer, PulseTimer
+
+_TIMERS = (OnDelayTimer, OffDelayTimer, PulseTimer)
+_COUNTERS = (CounterUp, CounterDown)
+
+
+class _BankField:
+    """Descriptor mapping a view attribute onto one element of a bank array."""
+
+    def __init__(self, array, cast):
+        self.array = array
+        self.cast = cast
+
+    def __get__(self, view, owner):
+        if view is None:
+            return self
+        return self.cast(getattr(view._bank, self.array)[view._index])
+
+    def __set__(self, view, value):
+        getattr(view._bank, self.array)[view._index] = value
+
+
+_VIEW_CLASSES = {}
+
+
+def _view_class(base):
+    view = _VIEW_CLASSES.get(base)
+    if view is None:
+        namespace = {
+            "__slots__": ("_bank", "_index"),
+            "_view_of": base,
+            "__module__": base.__module__,
+            "__doc__": base.__doc__,
+            "Q": _BankField("Q", bool),
+            "_previous_in": _BankField("_previous_in", bool),
+        }
+        for name in ("PT", "ET") if base in _TIMERS else ("PV", "CV"):
+            namespace[name] = _BankField(name, int)
+        view = _VIEW_CLASSES[base] = type(base.__name__, (base,), namespace)
+    return view
+
+
+def _presets(value, size):
+    presets = np.array(np.broadcast_to(np.asarray(value, dtype=np.int64), (size,)))
+    if (presets < 0).any():
+        raise ValueError("Presets must be >= 0.")
+    return presets
+
+
+class _Bank:
+    """Shared element-view plumbing for TimerArray and CounterArray."""
+
+    def __init__(self, name, size, kind, kinds):
+        if kind not in kinds:
+            raise ValueError(f"kind must be one of {', '.join(cls.__name__ for cls in kinds)}.")
+        if size <= 0:
+            raise ValueError("size must be > 0.")
+        self.name = name
+        self.kind = kind
+        self.size = int(size)
+        self.Q = np.zeros(self.size, dtype=bool)
+        self._previous_in = np.zeros(self.size, dtype=bool)
+        self._views = [None] * self.size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        """
+        Element ``index`` as a component usable in a Rung. It behaves like a
+        scalar ``kind`` instance whose fields live in this bank's arrays.
+        """
+        index = range(self.size)[index]
+        view = self._views[index]
+        if view is None:
+            view = object.__new__(_view_class(self.kind))
+            view.name = f"{self.name}[{index}]"
+            view._bank = self
+            view._index = index
+            self._views[index] = view
+        return view
+
+    def __iter__(self):
+        return (self[index] for index in range(self.size))
+
+    def _inputs(self, values):
+        return np.broadcast_to(np.asarray(values, dtype=bool), (self.size,))
+
+
+class TimerArray(_Bank):
+    """
+    N timers of one kind (OnDelayTimer, OffDelayTimer or PulseTimer) held in
+    contiguous arrays ``PT``, ``ET``, ``Q`` and ``_previous_in``.
+    ``evaluate(IN)`` updates every element in one vectorized call with the
+    same per-scan semantics as the scalar class; ``bank[i]`` is a view of
+    one element that can be placed in a Rung.
+    """
+
+    def __init__(self, name, size, PT, kind=OnDelayTimer):
+        super().__init__(name, size, kind, _TIMERS)
+        self.PT = _presets(PT, self.size)
+        self.ET = np.zeros(self.size, dtype=np.int64)
+
+    def evaluate(self, IN):
+        """Advance every timer by one scan with the IN vector (or scalar); returns Q."""
+        IN = self._inputs(IN)
+        ET, Q, previous = self.ET, self.Q, self._previous_in
+        if self.kind is OnDelayTimer:
+            ET += 1
+            ET *= IN
+            Q |= ET >= self.PT
+            Q &= IN
+            previous &= IN
+        elif self.kind is OffDelayTimer:
+            ET += 1
+            ET *= ~IN
+            Q &= ET < self.PT
+            Q |= IN
+        else:
+            rising = IN & ~previous
+            running = Q & ~rising
+            ET += running
+            ET *= ~rising
+            Q[:] = rising | (running & (ET < self.PT))
+            previous[:] = IN
+        return Q
+
+    def reset(self):
+        self.ET[:] = 0
+        self.Q[:] = False
+        self._previous_in[:] = False
+
+
+class CounterArray(_Bank):
+    """
+    N counters of one kind (CounterUp or CounterDown) held in contiguous
+    arrays ``PV``, ``CV``, ``Q`` and ``_previous_in``. ``evaluate`` updates
+    every element in one vectorized call with the scalar class's semantics;
+    ``bank[i]`` is a view of one element that can be placed in a Rung.
+    """
+
+    def __init__(self, name, size, preset, kind=CounterUp, current_value=None):
+        super().__init__(name, size, kind, _COUNTERS)
+        self.PV = _presets(preset, self.size)
+        if current_value is None:
+            current_value = self.PV if kind is CounterDown else 0
+        self.CV = np.array(np.broadcast_to(np.asarray(current_value, dtype=np.int64), (self.size,)))
+        self._update_done()
+
+    def _update_done(self):
+        if self.kind is CounterUp:
+            np.greater_equal(self.CV, self.PV, out=self.Q)
+        else:
+            np.less_equal(self.CV, 0, out=self.Q)
+
+    def evaluate(self, IN, R=False, LD=False, PV=None):
+        """
+        Advance every counter by one scan; IN, R and LD (CounterDown only)
+        are vectors or scalars. A new ``PV`` applies before counting. Returns Q.
+        """
+        IN = self._inputs(IN)
+        if PV is not None:
+            self.PV = _presets(PV, self.size)
+        rising = IN & ~self._previous_in
+        CV = self.CV
+        if self.kind is CounterUp:
+            reset = self._inputs(R)
+            CV += rising
+            CV *= ~reset
+        else:
+            reset = self._inputs(R) | self._inputs(LD)
+            CV -= rising & (CV > 0)
+            np.copyto(CV, self.PV, where=reset)
+        self._update_done()
+        self._previous_in[:] = IN
+        return self.Q
+
+    def reset(self):
+        self.CV[:] = 0 if self.kind is CounterUp else self.PV
+        self._previous_in[:] = False
+        self._update_done()
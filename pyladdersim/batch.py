@@ -0,0 +1,202 @@
+import numpy as np
+
+from pyladdersim.components import (
+    Contact,
+    CounterDown,
+    CounterUp,
+    FallingEdgeContact,
+    InvertedContact,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    PulseTimer,
+    RetentiveOutput,
+    RisingEdgeContact,
+    component_type,
+)
+
+_CONTACT = 0
+_RISING = 1
+_FALLING = 2
+_TON = 3
+_TOF = 4
+_TP = 5
+_CTU = 6
+_CTD = 7
+_OUTPUT = 8
+_RETENTIVE = 9
+
+# Exact classes only: a subclass may override evaluate with different logic.
+_KINDS = {
+    Contact: _CONTACT,
+    InvertedContact: _CONTACT,
+    RisingEdgeContact: _RISING,
+    FallingEdgeContact: _FALLING,
+    OnDelayTimer: _TON,
+    OffDelayTimer: _TOF,
+    PulseTimer: _TP,
+    CounterUp: _CTU,
+    CounterDown: _CTD,
+    Output: _OUTPUT,
+    RetentiveOutput: _RETENTIVE,
+}
+
+
+class BatchLadder:
+    """
+    Run N instances of one ladder topology in lockstep.
+    Component state lives in NumPy arrays with one row per component and one
+    column per instance, initialised from the template ladder's current state.
+    """
+
+    def __init__(self, ladder, instances):
+        if instances <= 0:
+            raise ValueError("instances must be > 0.")
+
+        self.ladder = ladder
+        self.instances = int(instances)
+        self.components = []
+        self._index = {}
+        self._program = []
+
+        for rung in ladder.rungs:
+            operations = []
+            for component in rung.components:
+                index = self._register(component)
+                if component is not rung.output:
+                    operations.append((_KINDS[component_type(component)], index))
+            self._program.append(
+                (operations, _KINDS[component_type(rung.output)], self._index[id(rung.output)])
+            )
+
+        shape = (len(self.components), self.instances)
+        self.state = np.zeros(shape, dtype=bool)
+        self.previous = np.zeros(shape, dtype=bool)
+        self.ET = np.zeros(shape, dtype=np.int64)
+        self.CV = np.zeros(shape, dtype=np.int64)
+        self.PT = np.zeros(len(self.components), dtype=np.int64)
+        self.PV = np.zeros(len(self.components), dtype=np.int64)
+        self._load_template()
+
+    def _register(self, component):
+        if component_type(component) not in _KINDS:
+            raise TypeError(
+                f"BatchLadder does not support {type(component).__name__} components."
+            )
+        if id(component) not in self._index:
+            self._index[id(component)] = len(self.components)
+            self.components.append(component)
+        return self._index[id(component)]
+
+    def _load_template(self):
+        for index, component in enumerate(self.components):
+            self.state[index] = component.state
+            self.previous[index] = getattr(
+                component, "_previous_state", getattr(component, "_previous_in", False)
+            )
+            self.ET[index] = getattr(component, "ET", 0)
+            self.CV[index] = getattr(component, "CV", 0)
+            self.PT[index] = getattr(component, "PT", 0)
+            self.PV[index] = getattr(component, "PV", 0)
+
+    def resolve(self, key):
+        """Return the row index for a component object or a unique component name."""
+        if not isinstance(key, str):
+            try:
+                return self._index[id(key)]
+            except KeyError:
+                raise KeyError(f"Component {key!r} is not part of this ladder.") from None
+
+        matches = [i for i, component in enumerate(self.components) if component.name == key]
+        if not matches:
+            raise KeyError(f"No component named {key!r}.")
+        if len(matches) > 1:
+            raise ValueError(f"Component name {key!r} is ambiguous.")
+        return matches[0]
+
+    def set_input(self, key, values):
+        """Activate (TRUE) or deactivate (FALSE) a contact in every instance."""
+        index = self.resolve(key)
+        component = self.components[index]
+        values = np.broadcast_to(np.asarray(values, dtype=bool), (self.instances,))
+        if isinstance(component, InvertedContact):
+            self.state[index] = ~values
+        elif isinstance(component, Contact):
+            self.state[index] = values
+        else:
+            raise TypeError(f"{component.name!r} is not a contact.")
+
+    def get(self, key, field="state"):
+        """Return a copy of one component field across all instances."""
+        index = self.resolve(key)
+        if field in ("state", "Q"):
+            return self.state[index].copy()
+        if field in ("ET", "CV"):
+            return getattr(self, field)[index].copy()
+        if field in ("_previous_state", "_previous_in"):
+            return self.previous[index].copy()
+        raise ValueError(f"Unknown field {field!r}.")
+
+    def outputs(self):
+        """Map each rung output name to its state across all instances."""
+        return {
+            self.components[output].name: self.state[output].copy()
+            for _, _, output in self._program
+        }
+
+    def step(self, inputs=None):
+        """Apply ``inputs`` then advance every instance by one scan."""
+        if inputs:
+            for key, values in inputs.items():
+                self.set_input(key, values)
+        return self._scan()
+
+    def _scan(self):
+        state, previous, ET, CV = self.state, self.previous, self.ET, self.CV
+        PT, PV = self.PT, self.PV
+        ok = np.ones(self.instances, dtype=bool)
+
+        for operations, output_kind, output in self._program:
+            power = np.ones(self.instances, dtype=bool)
+            for kind, i in operations:
+                if kind == _CONTACT:
+                    power &= state[i]
+                elif kind == _RISING:
+                    power &= state[i] & ~previous[i]
+                    previous[i] = state[i]
+                elif kind == _FALLING:
+                    power &= previous[i] & ~state[i]
+                    previous[i] = state[i]
+                elif kind == _TON:
+                    ET[i] = np.where(power, ET[i] + 1, 0)
+                    power = power & (state[i] | (ET[i] >= PT[i]))
+                    state[i] = power
+                elif kind == _TOF:
+                    ET[i] = np.where(power, 0, ET[i] + 1)
+                    power = power | (state[i] & (ET[i] < PT[i]))
+                    state[i] = power
+                elif kind == _TP:
+                    rising = power & ~previous[i]
+                    running = ~rising & state[i]
+                    ET[i] = np.where(rising, 0, ET[i] + running)
+                    previous[i] = power
+                    power = rising | (running & (ET[i] < PT[i]))
+                    state[i] = power
+                elif kind == _CTU:
+                    CV[i] += power & ~previous[i]
+                    previous[i] = power
+                    power = CV[i] >= PV[i]
+                    state[i] = power
+                else:  # _CTD
+                    CV[i] -= power & ~previous[i] & (CV[i] > 0)
+                    previous[i] = power
+                    power = CV[i] <= 0
+                    state[i] = power
+
+            if output_kind == _OUTPUT:
+                state[output] = power
+            else:
+                state[output] |= power
+            ok &= state[output]
+
+        return ok
@@ -0,0 +1,160 @@
+from pyladdersim.components import CoilContact, FunctionBlock, Output, ResetOutput, is_stateful
+
+
+def _is_pure(element):
+    """True when an element's result depends only on contact states."""
+    if isinstance(element, Branch):
+        return element.pure
+    if isinstance(element, SharedNetwork):
+        return element.network.pure
+    return not is_stateful(element)
+
+
+def _flow(element, power):
+    # Same power-flow rule as Rung.evaluate for a single element.
+    if isinstance(element, FunctionBlock):
+        return element.evaluate(IN=power)
+    if not power and not is_stateful(element):
+        return False
+    value = element.evaluate()
+    return power and value
+
+
+class Branch(FunctionBlock):
+    """
+    Base for a nested group of contacts, function blocks and branches that
+    sits in a rung like any other function block. A network built only from
+    plain contacts is ``pure``: its result is the incoming power AND a
+    conduction value that depends only on contact states.
+    """
+
+    __slots__ = ("elements", "pure", "_conducts")
+    _separator = ""
+
+    def __init__(self, *elements):
+        if not elements:
+            raise ValueError(f"{type(self).__name__} needs at least one element.")
+        for element in elements:
+            if isinstance(element, Output):
+                raise ValueError("Outputs cannot be placed inside a branch.")
+        names = self._separator.join(element.name for element in elements)
+        super().__init__(f"({names})")
+        self.elements = list(elements)
+        self.pure = all(_is_pure(element) for element in elements)
+        self._conducts = False
+
+    def _flow(self, power):
+        raise NotImplementedError
+
+    def evaluate(self, IN=True):
+        if self.pure:
+            self._conducts = self._flow(True)
+            self.state = bool(IN) and self._conducts
+        else:
+            self.state = self._flow(IN)
+        return self.state
+
+
+class Series(Branch):
+    """Elements in series (AND power flow), evaluated left to right."""
+
+    __slots__ = ()
+    _separator = " & "
+
+    def _flow(self, power):
+        power = bool(power)
+        for element in self.elements:
+            power = _flow(element, power)
+        return bool(power)
+
+
+class Parallel(Branch):
+    """
+    Parallel branches (OR power flow). Every branch receives the incoming
+    power and is evaluated on each scan, so stateful elements never miss one.
+    """
+
+    __slots__ = ()
+    _separator = " | "
+
+    def _flow(self, power):
+        results = [_flow(element, power) for element in self.elements]
+        return any(results)
+
+
+class SharedNetwork(FunctionBlock):
+    """
+    Later appearance of a network evaluated earlier in the same scan.
+    Pure networks reuse their conduction value with this position's power;
+    networks with stateful elements are only evaluated where they first
+    appear, and later appearances pass on that result ANDed with their power.
+    """
+
+    __slots__ = ("network",)
+
+    def __init__(self, network):
+        super().__init__(network.name)
+        self.network = network
+
+    def evaluate(self, IN=True):
+        network = self.network
+        value = network._conducts if network.pure else network.state
+        self.state = bool(IN) and value
+        return self.state
+
+
+def network_key(element):
+    """Structural identity: same branch types over the same component objects."""
+    if isinstance(element, SharedNetwork):
+        return network_key(element.network)
+    if isinstance(element, Branch):
+        return (type(element), tuple(network_key(child) for child in element.elements))
+    return id(element)
+
+
+def share_networks(elements, networks):
+    """
+    Replace networks already registered in ``networks`` (key -> network) by
+    SharedNetwork references, in place, and register new ones.
+    Returns the number of references created.
+    """
+    shared = 0
+    for position, element in enumerate(elements):
+        if not isinstance(element, Branch):
+            continue
+        key = network_key(element)
+        first = networks.get(key)
+        if first is None:
+            networks[key] = element
+            shared += share_networks(element.elements, networks)
+        else:
+            elements[position] = SharedNetwork(first)
+            shared += 1
+    return shared
+
+
+def iter_elements(components):
+    """
+    Yield every element reachable from ``components``, including branches and
+    their nested elements. A SharedNetwork yields itself and its network; a
+    ResetOutput or CoilContact yields itself and the coil it clears or reads.
+    """
+    for component in components:
+        yield component
+        if isinstance(component, Branch):
+            yield from iter_elements(component.elements)
+        elif isinstance(component, SharedNetwork):
+            yield component.network
+        elif isinstance(component, ResetOutput):
+            yield component.latch
+        elif isinstance(component, CoilContact):
+            yield component.coil
+
+
+def iter_leaves(components):
+    """Yield the contacts, function blocks and outputs under ``components``."""
+    for component in components:
+        if isinstance(component, Branch):
+            yield from iter_leaves(component.elements)
+        elif not isinstance(component, SharedNetwork):
+            yield component
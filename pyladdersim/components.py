@@ -1,6 +1,26 @@
+def component_type(component):
+    """Return the component's class, looking through TagTable views."""
+    cls = type(component)
+    return getattr(cls, "_view_of", cls)
+
+
+def is_stateful(component):
+    """
+    True for components whose evaluate() changes internal state (edge
+    contacts, timers, counters, custom overrides); these must see every scan.
+    Plain contacts only report ``state`` and are stateless.
+    """
+    if isinstance(component, FunctionBlock):
+        return True
+    return type(component).evaluate is not Component.evaluate
+
+
 class Component:
     """Base class for all ladder components."""
 
+    # Slots keep large ladders compact; ``_tag`` holds a TagTable binding.
+    __slots__ = ("name", "state", "_tag")
+
     def __init__(self, name):
         self.name = name
         self.state = False
@@ -15,6 +35,8 @@ class Component:
 class Contact(Component):
     """Normally-open contact."""
 
+    __slots__ = ()
+
     def activate(self):
         self.state = True
 
@@ -25,6 +47,8 @@ class Contact(Component):
 class InvertedContact(Component):
     """Normally-closed contact."""
 
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name)
         self.state = True
@@ -39,6 +63,8 @@ class InvertedContact(Component):
 class RisingEdgeContact(Contact):
     """One-shot contact that is TRUE for one scan on a rising edge."""
 
+    __slots__ = ("_previous_state",)
+
     def __init__(self, name):
         super().__init__(name)
         self._previous_state = False
@@ -58,6 +84,8 @@ class RisingEdgeContact(Contact):
 class FallingEdgeContact(Contact):
     """One-shot contact that is TRUE for one scan on a falling edge."""
 
+    __slots__ = ("_previous_state",)
+
     def __init__(self, name):
         super().__init__(name)
         self._previous_state = False
@@ -77,6 +105,8 @@ class FallingEdgeContact(Contact):
 class Output(Component):
     """Standard output coil."""
 
+    __slots__ = ()
+
     def evaluate(self, input_state):
         self.state = bool(input_state)
         return self.state
@@ -89,6 +119,8 @@ class RetentiveOutput(Output):
     - FALSE input leaves the output unchanged.
     """
 
+    __slots__ = ()
+
     def evaluate(self, input_state=False, IN=None, reset=False, R=False):
         if IN is not None:
             input_state = IN
@@ -104,9 +136,57 @@ class RetentiveOutput(Output):
         return self.state
 
 
+class ResetOutput(Output):
+    """
+    Reset coil for a RetentiveOutput, named ``<latch>.R``.
+    - TRUE input clears ``latch``.
+    - The coil's state mirrors the latch.
+    """
+
+    __slots__ = ("latch",)
+
+    def __init__(self, latch):
+        super().__init__(f"{latch.name}.R")
+        self.latch = latch
+
+    def evaluate(self, input_state):
+        if input_state:
+            self.latch.reset()
+        self.state = self.latch.state
+        return self.state
+
+
+class CoilContact(Component):
+    """
+    Contact on a coil's own variable, as in seal-in and interlock circuits.
+    - ``state`` follows ``coil`` (negated when ``inverted``); writes are ignored.
+    - It carries the coil's name; ``Ladder.component`` returns the coil.
+    """
+
+    __slots__ = ("coil", "inverted")
+
+    def __init__(self, coil, inverted=False):
+        self.name = coil.name
+        self.coil = coil
+        self.inverted = bool(inverted)
+
+    @property
+    def state(self):
+        return self.coil.state != self.inverted
+
+    @state.setter
+    def state(self, value):
+        pass
+
+    def evaluate(self):
+        return self.coil.state != self.inverted
+
+
 class FunctionBlock(Component):
     """Base component for PLC blocks that consume an input signal."""
 
+    __slots__ = ()
+
     def update(self, IN):
         return self.evaluate(IN=IN)
 
@@ -117,6 +197,8 @@ class FunctionBlock(Component):
 class Timer(FunctionBlock):
     """Base timer class with IEC-like PT/ET/Q fields."""
 
+    __slots__ = ("PT", "ET", "Q", "_previous_in")
+
     def __init__(self, name, delay=None, PT=None):
         super().__init__(name)
         if delay is None and PT is None:
@@ -150,6 +232,8 @@ class Timer(FunctionBlock):
 class OnDelayTimer(Timer):
     """TON: Q becomes TRUE after IN is TRUE for PT scans."""
 
+    __slots__ = ()
+
     def evaluate(self, IN):
         if IN:
             self.ET += 1
@@ -163,6 +247,8 @@ class OnDelayTimer(Timer):
 class OffDelayTimer(Timer):
     """TOF: Q stays TRUE for PT scans after IN goes FALSE."""
 
+    __slots__ = ()
+
     def evaluate(self, IN):
         if IN:
             self.Q = True
@@ -177,6 +263,8 @@ class OffDelayTimer(Timer):
 class PulseTimer(Timer):
     """TP: Q pulses TRUE for PT scans on a rising edge of IN."""
 
+    __slots__ = ()
+
     def evaluate(self, IN):
         rising_edge = IN and not self._previous_in
         if rising_edge:
@@ -194,6 +282,8 @@ class PulseTimer(Timer):
 class Counter(FunctionBlock):
     """Base counter with IEC-like PV/CV/Q fields."""
 
+    __slots__ = ("PV", "CV", "Q", "_previous_in")
+
     def __init__(self, name, preset, current_value=0):
         super().__init__(name)
         if preset < 0:
@@ -223,6 +313,8 @@ class Counter(FunctionBlock):
 class CounterUp(Counter):
     """CTU: increments CV on each rising edge, Q is TRUE when CV >= PV."""
 
+    __slots__ = ()
+
     def __init__(self, name, preset, current_value=0):
         super().__init__(name=name, preset=preset, current_value=current_value)
 
@@ -259,6 +351,8 @@ class CounterUp(Counter):
 class CounterDown(Counter):
     """CTD: decrements CV on each rising edge, Q is TRUE when CV <= 0."""
 
+    __slots__ = ()
+
     def __init__(self, name, preset, current_value=None):
         start_value = preset if current_value is None else current_value
         super().__init__(name=name, preset=preset, current_value=start_value)
@@ -0,0 +1,237 @@
+import os
+from xml.sax.saxutils import escape
+
+from pyladdersim.visualize_shapes import LadderCanvas
+
+_SVG_ANCHORS = {"e": "end", "w": "start", "center": "middle"}
+_MPL_ANCHORS = {"e": "right", "w": "left", "center": "center"}
+
+
+class RecordingCanvas:
+    """
+    Minimal stand-in for ``tk.Canvas`` that records items instead of drawing.
+    Lets LadderShapes/LadderCanvas lay out a ladder with no display.
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.changed = set()
+        self._next_id = 0
+
+    def _create(self, kind, coords, options):
+        self._next_id += 1
+        self.items[self._next_id] = {"kind": kind, "coords": coords, "options": dict(options)}
+        self.changed.add(self._next_id)
+        return self._next_id
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def delete(self, tag):
+        self.items.clear()
+        self.changed.clear()
+
+    def tag_bind(self, item, event, callback):
+        pass
+
+    def itemconfig(self, item, **options):
+        self.items[item]["options"].update(options)
+        self.changed.add(item)
+
+
+def _svg_element(item):
+    kind, coords, options = item["kind"], item["coords"], item["options"]
+    fill = options.get("fill", "black") or "none"
+    width = options.get("width", 1)
+    if kind == "line":
+        x1, y1, x2, y2 = coords
+        return f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{fill}" stroke-width="{width}"/>'
+    if kind == "text":
+        x, y = coords
+        anchor = _SVG_ANCHORS[options.get("anchor", "center")]
+        text = escape(str(options.get("text", "")))
+        return (
+            f'<text x="{x}" y="{y}" fill="{fill}" text-anchor="{anchor}" '
+            f'dominant-baseline="central" font-family="sans-serif" font-size="12">{text}</text>'
+        )
+
+    x1, y1, x2, y2 = coords
+    outline = options.get("outline", "black") or "none"
+    if kind == "oval":
+        return (
+            f'<ellipse cx="{(x1 + x2) / 2}" cy="{(y1 + y2) / 2}" rx="{(x2 - x1) / 2}" '
+            f'ry="{(y2 - y1) / 2}" fill="{fill}" stroke="{outline}" stroke-width="{width}"/>'
+        )
+    return (
+        f'<rect x="{x1}" y="{y1}" width="{x2 - x1}" height="{y2 - y1}" '
+        f'fill="{fill}" stroke="{outline}" stroke-width="{width}"/>'
+    )
+
+
+class HeadlessRenderer:
+    """
+    Render ladder frames to SVG or PNG without a display.
+    The layout is drawn once with the same shapes as the Tk visualizer; each
+    frame only restyles the items whose component state changed. Frames are
+    given as state tuples aligned with ``components`` (as published by
+    ``SnapshotChannel`` or read with ``TraceReader.bool_rows``), or default to
+    the live component states.
+    """
+
+    def __init__(self, ladder, width=600, height=400):
+        self.ladder = ladder
+        self.width = width
+        self.height = height
+        self.canvas = RecordingCanvas()
+        self.view = LadderCanvas(self.canvas, ladder)
+        self._svg = {}
+        self._figure = None
+        self._artists = {}
+        self.view.build()
+
+    @property
+    def components(self):
+        return self.view.components
+
+    def _update(self, states):
+        layout = self.view._layout
+        self.view.refresh(states)
+        if self.view._layout != layout:
+            # The ladder changed shape; cached elements and artists are stale.
+            self._svg.clear()
+            self._figure = None
+
+    def render_svg(self, states=None):
+        """Return one frame as an SVG document string."""
+        self._update(states)
+        for item in self.canvas.changed:
+            self._svg[item] = _svg_element(self.canvas.items[item])
+        self.canvas.changed.clear()
+        body = "\n".join(self._svg[item] for item in sorted(self._svg))
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" '
+            f'height="{self.height}" viewBox="0 0 {self.width} {self.height}">\n'
+            f'<rect width="100%" height="100%" fill="white"/>\n{body}\n</svg>\n'
+        )
+
+    def save_svg(self, path, states=None):
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(self.render_svg(states))
+
+    def _build_figure(self):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from matplotlib.lines import Line2D
+        from matplotlib.patches import Ellipse, Rectangle
+
+        figure = Figure(figsize=(self.width / 100, self.height / 100), dpi=100)
+        FigureCanvasAgg(figure)
+        axes = figure.add_axes((0, 0, 1, 1))
+        axes.set_xlim(0, self.width)
+        axes.set_ylim(self.height, 0)
+        axes.axis("off")
+
+        self._artists = {}
+        for item_id, item in self.canvas.items.items():
+            kind, coords, options = item["kind"], item["coords"], item["options"]
+            fill = options.get("fill", "black") or "none"
+            width = options.get("width", 1)
+            if kind == "line":
+                x1, y1, x2, y2 = coords
+                artist = axes.add_line(Line2D([x1, x2], [y1, y2], color=fill, linewidth=width))
+            elif kind == "text":
+                x, y = coords
+                artist = axes.text(
+                    x, y, str(options.get("text", "")), color=fill, fontsize=8,
+                    ha=_MPL_ANCHORS[options.get("anchor", "center")], va="center",
+                )
+            else:
+                x1, y1, x2, y2 = coords
+                outline = options.get("outline", "black") or "none"
+                if kind == "oval":
+                    patch = Ellipse(((x1 + x2) / 2, (y1 + y2) / 2), x2 - x1, y2 - y1)
+                else:
+                    patch = Rectangle((x1, y1), x2 - x1, y2 - y1)
+                patch.set_facecolor(fill)
+                patch.set_edgecolor(outline)
+                patch.set_linewidth(width)
+                artist = axes.add_patch(patch)
+            self._artists[item_id] = (kind, artist)
+        self._figure = figure
+        self.canvas.changed.clear()
+
+    def save_png(self, path, states=None):
+        """Write one frame as a PNG image (requires matplotlib)."""
+        self._update(states)
+        if self._figure is None:
+            self._build_figure()
+        for item in self.canvas.changed:
+            kind, artist = self._artists[item]
+            fill = self.canvas.items[item]["options"].get("fill", "black") or "none"
+            if kind in ("line", "text"):
+                artist.set_color(fill)
+            else:
+                artist.set_facecolor(fill)
+        self.canvas.changed.clear()
+        self._figure.savefig(path, format="png")
+
+    def render_frames(self, frames, directory, fmt="svg", prefix="frame"):
+        """
+        Render an iterable of state tuples to numbered files in ``directory``.
+        Returns the number of frames written.
+        """
+        if fmt not in ("svg", "png"):
+            raise ValueError("fmt must be 'svg' or 'png'.")
+        os.makedirs(directory, exist_ok=True)
+        save = self.save_svg if fmt == "svg" else self.save_png
+        count = 0
+        for count, states in enumerate(frames, start=1):
+            save(os.path.join(directory, f"{prefix}_{count - 1:06d}.{fmt}"), states)
+        return count
+
+
+def save_timing_diagram(series, path, scans=None, title=None):
+    """
+    Draw a logic-analyzer style timing diagram of ``series``, a mapping of tag
+    name to per-scan values (booleans or integers), and save it to ``path``.
+    The image format follows the file extension (``.png``, ``.svg``, ...).
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    names = list(series)
+    if not names:
+        raise ValueError("series must contain at least one tag.")
+    values = [list(series[name]) for name in names]
+    length = max(len(column) for column in values)
+    x_values = list(scans) if scans is not None else list(range(length))
+
+    figure = Figure(figsize=(10, 0.6 * len(names) + 0.8), dpi=100)
+    FigureCanvasAgg(figure)
+    axes = figure.subplots(len(names), 1, sharex=True, squeeze=False)[:, 0]
+    for axis, name, column in zip(axes, names, values):
+        is_bool = all(isinstance(value, bool) for value in column)
+        numbers = [int(value) for value in column]
+        axis.step(x_values[: len(numbers)], numbers, where="post", color="tab:green", linewidth=1.2)
+        if is_bool:
+            axis.set_ylim(-0.2, 1.2)
+            axis.set_yticks([])
+            axis.fill_between(
+                x_values[: len(numbers)], numbers, step="post", color="tab:green", alpha=0.2
+            )
+        axis.set_ylabel(name, rotation=0, ha="right", va="center", fontsize=8)
+        axis.spines[["top", "right"]].set_visible(False)
+    axes[-1].set_xlabel("scan")
+    if title:
+        figure.suptitle(title)
+    figure.tight_layout()
+    figure.savefig(path)
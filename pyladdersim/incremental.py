@@ -0,0 +1,120 @@
+from itertools import compress
+from operator import attrgetter, ne
+
+from pyladdersim.branches import iter_elements
+from pyladdersim.components import FunctionBlock, Output, is_stateful
+from pyladdersim.timerwheel import WallClockTimer
+
+# Fields that make up the internal state of edge contacts, timers and counters.
+_STATE_FIELDS = ("ET", "CV", "PV", "_previous_state", "_previous_in")
+# Wall-clock timers: ET follows the clock, expiries come from the wheel.
+_WHEEL_FIELDS = ("_previous_in", "_deadline")
+_get_state = attrgetter("state")
+
+
+class IncrementalScanner:
+    """
+    Scan only the rungs whose inputs changed since the last scan.
+    Input contacts are compared against the states seen on the previous scan
+    and mapped to rungs through a dependency index. Rungs containing edge
+    contacts, timers or counters stay hot until an evaluation leaves their
+    internal state unchanged; rungs sharing such components are scanned
+    together. Running wall-clock timers do not keep a rung hot: it is
+    scanned again when the ladder's timer wheel fires the timer.
+    Call ``rebuild()`` after changing an existing rung.
+    """
+
+    def __init__(self, ladder):
+        self.ladder = ladder
+        self.last_evaluated = 0
+        self.rebuild()
+
+    def rebuild(self):
+        rungs = self.ladder.rungs
+        self._inputs = []
+        self._dependents = []
+        self._stateful = []
+        input_index = {}
+        owners = {}
+        self._timer_rungs = {}
+
+        for index, rung in enumerate(rungs):
+            stateful = []
+            # Rungs writing the same coil, or a latch and its reset coil, share state.
+            owners.setdefault(id(rung.output), []).append(index)
+            # Elements nested in branches are inputs and state of this rung too.
+            for component in iter_elements(rung.components):
+                if component is rung.output:
+                    continue
+                if not isinstance(component, (FunctionBlock, Output)):
+                    if id(component) not in input_index:
+                        input_index[id(component)] = len(self._inputs)
+                        self._inputs.append(component)
+                        self._dependents.append([])
+                    self._dependents[input_index[id(component)]].append(index)
+                if is_stateful(component):
+                    stateful.append(component)
+                    owners.setdefault(id(component), []).append(index)
+                if isinstance(component, WallClockTimer):
+                    self._timer_rungs.setdefault(id(component), []).append(index)
+            self._stateful.append(stateful)
+
+        # Rungs sharing a stateful component are always scanned as one group.
+        self._group = [[index] for index in range(len(rungs))]
+        for shared in owners.values():
+            group = sorted({i for index in shared for i in self._group[index]})
+            for index in group:
+                self._group[index] = group
+
+        self._last_inputs = [component.state for component in self._inputs]
+        self._results = [False] * len(rungs)
+        self._false_count = len(rungs)
+        self._hot = set(range(len(rungs)))
+
+    @staticmethod
+    def _snapshot(components):
+        return [
+            (component.state,)
+            + tuple(
+                getattr(component, field, None)
+                for field in (_WHEEL_FIELDS if isinstance(component, WallClockTimer) else _STATE_FIELDS)
+            )
+            for component in components
+        ]
+
+    def scan(self):
+        """Evaluate dirty and hot rungs and return the ladder output."""
+        rungs = self.ladder.rungs
+        dirty = set(self._hot)
+
+        states = list(map(_get_state, self._inputs))
+        if states != self._last_inputs:
+            changed = compress(range(len(states)), map(ne, states, self._last_inputs))
+            for position in changed:
+                dirty.update(self._dependents[position])
+            self._last_inputs = states
+
+        wheel = self.ladder.timer_wheel
+        if wheel is not None and wheel.fired:
+            for timer in wheel.fired:
+                dirty.update(self._timer_rungs.get(id(timer), ()))
+
+        for index in list(dirty):
+            dirty.update(self._group[index])
+
+        hot = set()
+        results = self._results
+        for index in sorted(dirty):
+            stateful = self._stateful[index]
+            if stateful:
+                before = self._snapshot(stateful)
+            result = bool(rungs[index].evaluate())
+            if stateful and self._snapshot(stateful) != before:
+                hot.add(index)
+            if result != results[index]:
+                self._false_count += 1 if results[index] and not result else -1
+                results[index] = result
+
+        self._hot = hot
+        self.last_evaluated = len(dirty)
+        return self._false_count == 0
@@ -1,15 +1,29 @@
 import threading
 import time
 
-from pyladdersim.components import FunctionBlock, Output
+from pyladdersim.branches import iter_leaves, share_networks
+from pyladdersim.components import CoilContact, FunctionBlock, Output, is_stateful
+
+# How Rung.evaluate drives each component.
+_CONTACT = 0  # stateless: only read while the rung has power
+_STATEFUL = 1  # evaluate() every scan (edge contacts, custom components)
+_BLOCK = 2  # evaluate(IN=power) every scan (timers, counters, branches)
 
 
 class Rung:
-    """Represents a rung in the ladder logic."""
+    """
+    Represents a rung in the ladder logic.
+    With ``short_circuit`` plain contacts are no longer read once power is
+    lost, while edge contacts, timers and counters are still evaluated every
+    scan, so outputs and block state match a full evaluation. It runs a plan
+    built from ``components`` on its first short-circuit scan: call
+    ``validate_rung()`` after editing them in place.
+    """
 
-    def __init__(self, components):
+    def __init__(self, components, short_circuit=False):
         self.components = components  # List of components (including one Output)
         self.output = None
+        self.short_circuit = short_circuit
         self.validate_rung()
 
     def validate_rung(self):
@@ -20,6 +34,26 @@ class Rung:
         if len(outputs) == 0:
             raise ValueError("Rung must have an output component.")
         self.output = outputs[0]
+        self._plan = None
+
+    def _plan_evaluation(self):
+        # Plain contacts after the last stateful component form the tail,
+        # which stops at the first open contact.
+        plan = []
+        for component in self.components:
+            if component is self.output:
+                continue
+            if isinstance(component, FunctionBlock):
+                plan.append((component, _BLOCK))
+            elif is_stateful(component):
+                plan.append((component, _STATEFUL))
+            else:
+                plan.append((component, _CONTACT))
+        split = len(plan)
+        while split and plan[split - 1][1] == _CONTACT:
+            split -= 1
+        self._plan = plan[:split]
+        self._tail = [component for component, _ in plan[split:]]
 
     def add_component(self, component):
         """Add a component to the rung, preserving output constraints."""
@@ -30,6 +64,32 @@ class Rung:
 
     def evaluate(self):
         """Evaluate components from left to right, then set output."""
+        if not self.short_circuit:
+            return self._evaluate_all()
+        if self._plan is None:
+            self._plan_evaluation()
+
+        result = True
+        for component, kind in self._plan:
+            if kind == _CONTACT:
+                if result:
+                    result = component.state
+            elif kind == _BLOCK:
+                result = component.evaluate(IN=result)
+            else:
+                component_result = component.evaluate()
+                result = result and component_result
+        if result:
+            for component in self._tail:
+                if not component.state:
+                    result = False
+                    break
+
+        self.output.evaluate(result)
+        return self.output.state
+
+    def _evaluate_all(self):
+        """Evaluate every component on every scan, whatever the power flow."""
         result = True
         for component in self.components:
             if component is self.output:
@@ -52,15 +112,304 @@ class Ladder:
     def __init__(self):
         self.rungs = []
         self.running = False
+        self.scan_count = 0
         self.visualizer = None
+        self.compiled = None
+        self.incremental = None
+        self.parallel = None
+        self.profiler = None
+        self.scheduler = None
+        self.runtime = None
+        self.process_image = None
+        self.timer_wheel = None
+        self._scan_hooks = []
+        self._networks = {}
+        self._scan = self.scan_rungs
+
+    def __getstate__(self):
+        # Engines are rebuilt after unpickling; hooks, windows and runtimes stay behind.
+        state = self.__dict__.copy()
+        state.update(
+            compiled=self.compiled is not None,
+            incremental=self.incremental is not None,
+            parallel=self.parallel.workers if self.parallel is not None else None,
+            profiler=None,
+            visualizer=None,
+            runtime=None,
+            process_image=None,
+            _scan_hooks=[],
+            _networks={},
+            _scan=None,
+        )
+        return state
+
+    def __setstate__(self, state):
+        compiled = state.pop("compiled")
+        incremental = state.pop("incremental")
+        parallel = state.pop("parallel", None)
+        self.__dict__.update(state, compiled=None, incremental=None, parallel=None)
+        for rung in self.rungs:
+            # Network keys are object ids, so the index is rebuilt after loading.
+            share_networks(rung.components, self._networks)
+        if compiled:
+            self.compile()
+        if incremental:
+            self.enable_incremental()
+        if parallel is not None:
+            self.enable_parallel(parallel)
+        self._select_engine()
 
     def add_rung(self, rung):
-        """Add a new rung to the ladder."""
+        """
+        Add a new rung to the ladder. Branch networks identical to one already
+        in the ladder are replaced by references, so each is computed once per scan.
+        """
+        if share_networks(rung.components, self._networks):
+            rung.validate_rung()
         self.rungs.append(rung)
+        if self.compiled is not None:
+            # The compiled program no longer covers every rung.
+            self.decompile()
+        if self.incremental is not None:
+            self.incremental.rebuild()
+        if self.parallel is not None:
+            self.parallel.rebuild()
+
+    def components(self):
+        """
+        Return every component used by the rungs once, in rung order.
+        Contacts and blocks nested in branches are included; branches are not.
+        """
+        components = []
+        seen = set()
+        for rung in self.rungs:
+            for component in iter_leaves(rung.components):
+                if id(component) not in seen:
+                    seen.add(id(component))
+                    components.append(component)
+        return components
+
+    def components_by_name(self):
+        """
+        Map each name to the components carrying it, in rung order. Coil
+        contacts are left out: their name belongs to the coil they read.
+        """
+        found = {}
+        for component in self.components():
+            if not isinstance(component, CoilContact):
+                found.setdefault(component.name, []).append(component)
+        return found
+
+    def component(self, name, by_name=None):
+        """
+        Return the component called ``name``. Raises KeyError when there is
+        none and ValueError when several components share the name. Pass a
+        ``components_by_name()`` map as ``by_name`` to reuse it across lookups.
+        """
+        matches = (self.components_by_name() if by_name is None else by_name).get(name)
+        if not matches:
+            raise KeyError(f"No component named {name!r}.")
+        if len(matches) > 1:
+            raise ValueError(f"Component name {name!r} is ambiguous.")
+        return matches[0]
+
+    def compile(self):
+        """
+        Compile the rungs into a straight-line scan function used by scan_once.
+        Call again after changing the components of an existing rung.
+        """
+        from pyladdersim.compiler import compile_ladder
+
+        self.compiled = compile_ladder(self.rungs)
+        self._select_engine()
+        return self.compiled
+
+    def decompile(self):
+        """Return to the interpreted engine."""
+        self.compiled = None
+        self._select_engine()
+
+    def save(self, path):
+        """Write the program and its current state to ``path``; see ``load``."""
+        from pyladdersim.program import save
+
+        save(self, path)
+
+    @classmethod
+    def load(cls, path, compile=False):
+        """
+        Load a program written by ``save``, restoring timer ET, counter CV and
+        every other component state. ``compile`` returns it already compiled.
+        """
+        from pyladdersim.program import load
+
+        return load(path, compile=compile, cls=cls)
+
+    @classmethod
+    def from_plcopen(cls, source, pou=None, cycle_time=1.0):
+        """Import LD bodies from a PLCopen TC6 XML export; see ``plcopen.read_plcopen``."""
+        from pyladdersim.plcopen import read_plcopen
+
+        return read_plcopen(source, pou=pou, cycle_time=cycle_time)
+
+    def optimize(self, inputs=None, outputs=None):
+        """
+        Return ``(optimized_ladder, report)`` with constant contacts folded and
+        unobservable rungs removed; see ``pyladdersim.optimizer.optimize``.
+        """
+        from pyladdersim.optimizer import optimize
+
+        return optimize(self, inputs=inputs, outputs=outputs)
+
+    def enable_incremental(self):
+        """
+        Scan only rungs whose input contacts changed, plus rungs whose edge
+        contacts, timers or counters are still changing state.
+        """
+        from pyladdersim.incremental import IncrementalScanner
+
+        self.incremental = IncrementalScanner(self)
+        self._select_engine()
+        return self.incremental
+
+    def disable_incremental(self):
+        """Return to scanning every rung on every cycle."""
+        self.incremental = None
+        self._select_engine()
+
+    def enable_parallel(self, workers=None):
+        """
+        Evaluate independent groups of rungs on a thread pool within each scan.
+        Results match the serial scan; speedups need a free-threaded build.
+        Takes precedence over the compiled engine.
+        """
+        from pyladdersim.parallel import ParallelScanner
+
+        self.disable_parallel()
+        self.parallel = ParallelScanner(self, workers=workers)
+        self._select_engine()
+        return self.parallel
+
+    def disable_parallel(self):
+        """Return to evaluating rungs on the calling thread."""
+        parallel = self.parallel
+        self.parallel = None
+        self._select_engine()
+        if parallel is not None:
+            parallel.close()
+
+    def enable_profiling(self, trace_limit=100_000):
+        """
+        Swap in an instrumented scan that records rung and function block timing.
+        Returns the ScanProfiler holding the results.
+        """
+        from pyladdersim.profiling import ScanProfiler
+
+        self.profiler = ScanProfiler(self, trace_limit=trace_limit)
+        self._select_engine()
+        return self.profiler
+
+    def disable_profiling(self):
+        """Restore the uninstrumented scan and return the collected profiler."""
+        profiler = self.profiler
+        self.profiler = None
+        self._select_engine()
+        return profiler
+
+    def enable_process_image(self, name=None):
+        """
+        Publish contact inputs and output coils in a shared memory block so
+        other processes can drive and read them (see ProcessImageClient).
+        Returns the SharedProcessImage; its ``name`` identifies the block.
+        """
+        from pyladdersim.sharedimage import SharedProcessImage
+
+        self.disable_process_image()
+        self.process_image = SharedProcessImage(self, name=name)
+        self._select_engine()
+        return self.process_image
+
+    def disable_process_image(self):
+        """Stop publishing the process image and remove its shared memory block."""
+        image = self.process_image
+        self.process_image = None
+        self._select_engine()
+        if image is not None:
+            image.close()
+
+    def enable_timer_wheel(self, wheel=None):
+        """
+        Advance a TimerWheel at the start of every scan so wall-clock timers
+        expire on time. Wall-clock timers without a wheel are attached to it.
+        Returns the wheel (a new one on ``time.monotonic`` by default).
+        """
+        from pyladdersim.timerwheel import TimerWheel, WallClockTimer
+
+        if wheel is None:
+            wheel = TimerWheel()
+        for component in self.components():
+            if isinstance(component, WallClockTimer) and component.wheel is None:
+                component.wheel = wheel
+        self.timer_wheel = wheel
+        self._select_engine()
+        return wheel
+
+    def disable_timer_wheel(self):
+        """Stop advancing the timer wheel; running wall-clock timers are frozen."""
+        self.timer_wheel = None
+        self._select_engine()
+
+    def add_scan_hook(self, hook):
+        """Call ``hook(output)`` after every scan_once with the ladder output."""
+        self._scan_hooks.append(hook)
+        self._select_engine()
+
+    def remove_scan_hook(self, hook):
+        """Stop calling a hook registered with add_scan_hook."""
+        self._scan_hooks.remove(hook)
+        self._select_engine()
+
+    def _select_engine(self):
+        # Resolve the scan function once so scan_once pays no per-scan checks.
+        if self.profiler is not None:
+            engine = self.profiler.scan
+        elif self.incremental is not None:
+            engine = self.incremental.scan
+        elif self.parallel is not None:
+            engine = self.parallel.scan
+        elif self.compiled is not None:
+            engine = self.compiled.scan
+        else:
+            engine = self.scan_rungs
+
+        if self.timer_wheel is not None:
+            engine = self.timer_wheel.wrap(engine)
+
+        if self.process_image is not None:
+            engine = self.process_image.wrap(engine)
+
+        if self._scan_hooks:
+            hooks = tuple(self._scan_hooks)
+
+            def scan_with_hooks():
+                output = engine()
+                for hook in hooks:
+                    hook(output)
+                return output
+
+            self._scan = scan_with_hooks
+        else:
+            self._scan = engine
+
+    def scan_rungs(self):
+        """Evaluate every rung once with the interpreted engine."""
+        results = [rung.evaluate() for rung in self.rungs]
+        return all(results)
 
     def scan_once(self, visualize=False):
         """Execute one PLC scan cycle and return the ladder output."""
-        overall_output = all(rung.evaluate() for rung in self.rungs)
+        self.scan_count += 1
+        overall_output = self._scan()
 
         if visualize:
             if self.visualizer is None:
@@ -71,10 +420,70 @@ class Ladder:
 
         return overall_output
 
-    def run(self, visualize=False, cycle_time=1.0):
-        """Run the ladder continuously until stopped."""
+    @property
+    def scan_statistics(self):
+        """Jitter, scan time and overrun statistics from the last scheduled run."""
+        if self.scheduler is None:
+            return None
+        return self.scheduler.statistics
+
+    def advance(self, scans):
+        """
+        Run ``scans`` scans with inputs held constant, skipping idle stretches
+        where only timers are counting. Returns the last ladder output.
+        """
+        from pyladdersim.fastforward import advance
+
+        return advance(self, scans)
+
+    def run_until(self, scan):
+        """Advance until ``scan_count`` reaches ``scan``; see ``advance``."""
+        if scan < self.scan_count:
+            raise ValueError("scan must be >= scan_count.")
+        return self.advance(scan - self.scan_count)
+
+    def run_stimulus(self, stream, outputs=None, golden=None, output_path=None):
+        """
+        Replay per-scan input vectors as fast as possible.
+        ``stream`` is an iterable of ``{contact name: bool}`` dicts or a CSV /
+        JSON-lines file of them. Returns a StimulusRun that yields each scan's
+        outputs, optionally writes them to ``output_path`` and records the first
+        scan that diverges from ``golden``.
+        """
+        from pyladdersim.stimulus import StimulusRun
+
+        return StimulusRun(self, stream, outputs=outputs, golden=golden, output_path=output_path)
+
+    async def run_async(self, cycle_time=1.0, overrun_policy="skip", max_scans=None):
+        """
+        Run the ladder as a coroutine on the current event loop until
+        ``stop()`` is called, the task is cancelled or ``max_scans`` scans ran.
+        The AsyncLadderRuntime is available as ``runtime`` for exchanging
+        inputs and snapshots with other coroutines. Returns the scan statistics.
+        """
+        from pyladdersim.runtime import AsyncLadderRuntime
+
+        self.runtime = AsyncLadderRuntime(self, cycle_time=cycle_time, overrun_policy=overrun_policy)
+        self.scheduler = self.runtime.scheduler
+        return await self.runtime.run(max_scans=max_scans)
+
+    def run(self, visualize=False, cycle_time=1.0, overrun_policy=None, frame_rate=None):
+        """
+        Run the ladder continuously until stopped.
+        With ``overrun_policy`` ("catch_up" or "skip") scans are kept on
+        absolute deadlines instead of sleeping ``cycle_time`` after each scan.
+        With ``visualize`` and ``frame_rate``, scans run on a worker thread and
+        the window redraws the newest scan snapshot at ``frame_rate`` FPS.
+        """
         if cycle_time <= 0:
             raise ValueError("cycle_time must be > 0.")
+        if frame_rate is not None and frame_rate <= 0:
+            raise ValueError("frame_rate must be > 0.")
+
+        if overrun_policy is not None:
+            from pyladdersim.scheduler import ScanScheduler
+
+            self.scheduler = ScanScheduler(cycle_time, policy=overrun_policy)
 
         self.running = True
         print("Ladder is running. Press 'Q' to quit.")
@@ -88,11 +497,37 @@ class Ladder:
         quit_thread = threading.Thread(target=self.wait_for_quit, daemon=True)
         quit_thread.start()
 
+        channel = None
+        if visualize and frame_rate is not None:
+            from pyladdersim.render import SnapshotChannel
+
+            channel = SnapshotChannel(self)
+
+        def cycle():
+            if channel is not None:
+                channel.apply_toggles()
+            overall_output = self.scan_once(visualize=visualize and channel is None)
+            if channel is not None:
+                channel.publish(overall_output)
+            print(f"Ladder Output: {'TRUE' if overall_output else 'FALSE'}")
+
+        def scan_loop():
+            if overrun_policy is not None:
+                self.scheduler.run(cycle, keep_running=lambda: self.running)
+            else:
+                while self.running:
+                    cycle()
+                    time.sleep(cycle_time)
+
         try:
-            while self.running:
-                overall_output = self.scan_once(visualize=visualize)
-                print(f"Ladder Output: {'TRUE' if overall_output else 'FALSE'}")
-                time.sleep(cycle_time)
+            if channel is not None:
+                # Tk must stay on this thread, so scans move to a worker.
+                scan_thread = threading.Thread(target=scan_loop, daemon=True)
+                scan_thread.start()
+                self.visualizer.run_render_loop(channel, frame_rate, on_close=self.stop)
+                scan_thread.join()
+            else:
+                scan_loop()
         except KeyboardInterrupt:
             print("\nLadder simulation interrupted.")
             self.stop()
@@ -107,4 +542,6 @@ class Ladder:
     def stop(self):
         """Stop the ladder simulation and ensure all threads close."""
         self.running = False
+        if self.runtime is not None:
+            self.runtime.stop()
         print("Ladder stopped.")
@@ -0,0 +1,141 @@
+from pyladdersim.branches import Branch, SharedNetwork
+from pyladdersim.components import FunctionBlock, is_stateful
+from pyladdersim.parallel import partition_rungs
+
+
+class OptimizationReport:
+    """What ``optimize`` folded and removed; rung indexes refer to the original ladder."""
+
+    def __init__(self):
+        self.constant_contacts = {}
+        self.folded_contacts = 0
+        self.short_circuited_rungs = []
+        self.dead_rungs = []
+        self.rungs_before = 0
+        self.rungs_after = 0
+        self.elements_before = 0
+        self.elements_after = 0
+
+    def as_dict(self):
+        return {
+            "constant_contacts": dict(self.constant_contacts),
+            "folded_contacts": self.folded_contacts,
+            "short_circuited_rungs": list(self.short_circuited_rungs),
+            "dead_rungs": list(self.dead_rungs),
+            "rungs_before": self.rungs_before,
+            "rungs_after": self.rungs_after,
+            "elements_before": self.elements_before,
+            "elements_after": self.elements_after,
+        }
+
+    def __str__(self):
+        return "\n".join(
+            [
+                f"rungs: {self.rungs_before} -> {self.rungs_after}",
+                f"elements per scan: {self.elements_before} -> {self.elements_after}",
+                f"constant contacts: {len(self.constant_contacts)}",
+                f"folded contacts: {self.folded_contacts}",
+                f"short-circuited rungs: {self.short_circuited_rungs}",
+                f"dead rungs: {self.dead_rungs}",
+            ]
+        )
+
+
+def _fold(rung, constants, report, index):
+    """Return the rung's components with constant contacts folded."""
+    components = []
+    powered_off = False
+    cut = False
+    for component in rung.components:
+        if component is rung.output:
+            continue
+        value = constants.get(id(component))
+        if powered_off:
+            # Power stays FALSE up to the next function block; only stateful
+            # elements still need the scan.
+            if is_stateful(component):
+                components.append(component)
+                # A block's Q (TOF, CTU, CTD) can be TRUE with IN FALSE.
+                powered_off = not isinstance(component, FunctionBlock)
+            else:
+                report.folded_contacts += 1
+                cut = True
+        elif value is True:
+            report.folded_contacts += 1
+        else:
+            components.append(component)
+            powered_off = value is False
+    if cut:
+        report.short_circuited_rungs.append(index)
+    components.append(rung.output)
+    return components
+
+
+def optimize(ladder, inputs=None, outputs=None):
+    """
+    Build an optimized copy of ``ladder`` and report what changed.
+    - ``inputs``: names of contacts that are driven externally. Every other
+      plain contact is treated as a constant at its current state; TRUE ones
+      are dropped from series chains and a FALSE one cuts the plain contacts
+      up to the next function block, whose output may still be TRUE. Only
+      contacts in a rung's main series are folded; contacts inside
+      Series/Parallel networks stay live. None treats every contact as an
+      input.
+    - ``outputs``: names of observable output coils. Rungs driving anything
+      else are dropped unless they share stateful components (timers,
+      counters, coils, branch networks) with a kept rung. None keeps all.
+    The new rungs reuse the original component objects, so the optimized
+    ladder drives the same outputs; it stays equivalent only while the
+    constant contacts are left alone.
+    Returns ``(optimized_ladder, report)``.
+    """
+    from pyladdersim.ladder import Ladder, Rung
+
+    rungs = ladder.rungs
+    report = OptimizationReport()
+    report.rungs_before = len(rungs)
+    report.elements_before = sum(len(rung.components) for rung in rungs)
+    names = {component.name for component in ladder.components()}
+
+    constants = {}
+    if inputs is not None:
+        live = set(inputs)
+        unknown = live - names
+        if unknown:
+            raise KeyError(f"No component named {sorted(unknown)[0]!r}.")
+        for rung in rungs:
+            for component in rung.components:
+                if (
+                    component is rung.output
+                    or isinstance(component, (Branch, SharedNetwork))
+                    or is_stateful(component)
+                    or component.name in live
+                    or id(component) in constants
+                ):
+                    continue
+                constants[id(component)] = bool(component.evaluate())
+                report.constant_contacts[component.name] = constants[id(component)]
+
+    keep = [True] * len(rungs)
+    if outputs is not None:
+        observed = set(outputs)
+        unknown = observed - {rung.output.name for rung in rungs}
+        if unknown:
+            raise KeyError(f"No output named {sorted(unknown)[0]!r}.")
+        keep = [rung.output.name in observed for rung in rungs]
+        # Unobserved rungs that share state with an observed one must still run.
+        for group in partition_rungs(rungs):
+            if any(keep[index] for index in group):
+                for index in group:
+                    keep[index] = True
+
+    optimized = Ladder()
+    for index, rung in enumerate(rungs):
+        if not keep[index]:
+            report.dead_rungs.append(index)
+            continue
+        optimized.add_rung(Rung(_fold(rung, constants, report, index), rung.short_circuit))
+
+    report.rungs_after = len(optimized.rungs)
+    report.elements_after = sum(len(rung.components) for rung in optimized.rungs)
+    return optimized, report
@@ -0,0 +1,81 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from pyladdersim.branches import iter_elements
+from pyladdersim.components import is_stateful
+
+
+def partition_rungs(rungs):
+    """
+    Split rung indexes into groups that can be evaluated independently.
+    Rungs are joined when they share a component whose evaluation writes
+    state (outputs, edge contacts, timers, counters); plain contacts are only
+    read and may be shared freely. Each group lists its rungs in ladder order.
+    """
+    parent = list(range(len(rungs)))
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    owners = {}
+    for index, rung in enumerate(rungs):
+        for component in iter_elements(rung.components):
+            if is_stateful(component):
+                first = owners.setdefault(id(component), index)
+                if first != index:
+                    parent[find(index)] = find(first)
+
+    groups = {}
+    for index in range(len(rungs)):
+        groups.setdefault(find(index), []).append(index)
+    return list(groups.values())
+
+
+class ParallelScanner:
+    """
+    Evaluate independent rung partitions on a thread pool within each scan.
+    Groups from ``partition_rungs`` are balanced across ``workers`` tasks; a
+    task evaluates its rungs in ladder order, so every component sees the same
+    sequence of evaluations as a serial scan. Threads only run rungs truly in
+    parallel on free-threaded CPython builds. Call ``rebuild()`` after changing
+    an existing rung and ``close()`` to release the threads.
+    """
+
+    def __init__(self, ladder, workers=None):
+        self.ladder = ladder
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif workers < 1:
+            raise ValueError("workers must be >= 1.")
+        self.workers = workers
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ladder-scan")
+        self.rebuild()
+
+    def rebuild(self):
+        rungs = self.ladder.rungs
+        self.groups = partition_rungs(rungs)
+        loads = [[0, []] for _ in range(min(self.workers, len(self.groups)))]
+        for group in sorted(self.groups, key=len, reverse=True):
+            target = min(loads, key=lambda load: load[0])
+            target[0] += len(group)
+            target[1].extend(group)
+        self._tasks = [[rungs[index].evaluate for index in sorted(indexes)] for _, indexes in loads]
+
+    @staticmethod
+    def _run_task(evaluators):
+        results = [evaluate() for evaluate in evaluators]
+        return all(results)
+
+    def scan(self):
+        """Evaluate every rung and return the ladder output."""
+        tasks = self._tasks
+        if len(tasks) <= 1:
+            return all([self._run_task(task) for task in tasks])
+        results = list(self._pool.map(self._run_task, tasks))
+        return all(results)
+
+    def close(self):
+        self._pool.shutdown(wait=True)
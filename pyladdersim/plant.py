@@ -0,0 +1,195 @@
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+
+from pyladdersim.components import Contact, InvertedContact
+from pyladdersim.scheduler import ScanScheduler, ScanStatistics
+
+
+def _resolve_links(ladder, links):
+    by_name = ladder.components_by_name()
+    return [(slot, ladder.component(name, by_name)) for slot, name in links]
+
+
+def _partition(ladders, workers):
+    # Largest programs first onto the least loaded worker.
+    loads = [[0, []] for _ in range(workers)]
+    for name, ladder in sorted(ladders.items(), key=lambda item: -len(item[1].rungs)):
+        target = min(loads, key=lambda load: load[0])
+        target[0] += max(1, len(ladder.rungs))
+        target[1].append(name)
+    return [names for _, names in loads if names]
+
+
+def _run_worker(entries, scans, period, synchronized, links, barrier, results):
+    """Scan a group of ladders in one process; see PlantRunner.run."""
+    try:
+        count = len(links) // 2
+        programs = []
+        for name, ladder, reads, writes in entries:
+            programs.append(
+                (ladder, _resolve_links(ladder, reads), _resolve_links(ladder, writes), ScanStatistics())
+            )
+
+        scheduler = ScanScheduler(period or 1.0, policy="skip")
+        clock = scheduler.clock
+        deadline = clock()
+        for cycle in range(scans):
+            cycle_start = clock()
+            # Synchronized runs double-buffer the link image by cycle parity, so
+            # every ladder sees the outputs its peers produced in the last cycle.
+            read_base = (cycle % 2) * count if synchronized else 0
+            write_base = ((cycle + 1) % 2) * count if synchronized else 0
+
+            for ladder, reads, writes, stats in programs:
+                start = clock()
+                for slot, contact in reads:
+                    contact.activate() if links[read_base + slot] else contact.deactivate()
+                ladder.scan_once()
+                for slot, component in writes:
+                    links[write_base + slot] = component.state
+                end = clock()
+                stats.record(end - start, max(0.0, start - deadline) if period else 0.0)
+
+            if synchronized:
+                barrier.wait()
+            end = clock()
+            if period is None:
+                scheduler.statistics.record(end - cycle_start, 0.0)
+                continue
+            scheduler.statistics.record(end - cycle_start, max(0.0, cycle_start - deadline))
+            deadline = scheduler.next_deadline(deadline, end)
+            delay = deadline - clock()
+            if delay > 0:
+                time.sleep(delay)
+
+        names = [entry[0] for entry in entries]
+        ladders = [program[0] for program in programs]
+        ladder_stats = [program[3] for program in programs]
+        results.put((os.getpid(), None, names, ladders, ladder_stats, scheduler.statistics))
+    except BaseException:
+        if barrier is not None:
+            barrier.abort()
+        results.put((os.getpid(), traceback.format_exc(), None, None, None, None))
+
+
+class PlantRunner:
+    """
+    Scan many independent ladders across worker processes.
+    Ladders are split between workers by rung count. Cross-ladder links copy a
+    source component's state into a target contact once per cycle through one
+    shared byte image, so there is no per-tag messaging between processes.
+    - ``synchronized=True``: all ladders scan in lockstep cycles and a linked
+      contact sees its source's state from the previous cycle, which makes
+      runs deterministic.
+    - ``synchronized=False``: each worker keeps its own cycle and links carry
+      whatever value the source last wrote.
+    """
+
+    def __init__(self, workers=None, synchronized=True, start_method=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.synchronized = synchronized
+        self.start_method = start_method
+        self.ladders = {}
+        self.links = []
+        self.statistics = {}
+        self.worker_statistics = []
+
+    def add(self, name, ladder):
+        """Add a ladder under a unique plant-wide name."""
+        if name in self.ladders:
+            raise ValueError(f"Ladder {name!r} already added.")
+        self.ladders[name] = ladder
+
+    def _split(self, tag):
+        ladder_name, _, component_name = tag.partition(".")
+        if ladder_name not in self.ladders or not component_name:
+            raise KeyError(f"{tag!r} is not '<ladder>.<component>' for an added ladder.")
+        component = self.ladders[ladder_name].component(component_name)
+        return ladder_name, component_name, component
+
+    def link(self, source, target):
+        """
+        Feed ``source`` (``"ladder.component"``, usually an output coil) into
+        the contact ``target`` (``"ladder.contact"``) once per cycle.
+        """
+        source_ladder, source_name, _ = self._split(source)
+        target_ladder, target_name, contact = self._split(target)
+        if not isinstance(contact, (Contact, InvertedContact)):
+            raise TypeError(f"{target!r} is not a contact.")
+        self.links.append((source_ladder, source_name, target_ladder, target_name))
+
+    def run(self, scans, cycle_time=None):
+        """
+        Run every ladder for ``scans`` cycles, ``cycle_time`` seconds apart
+        (as fast as possible when None). The ladders in ``self.ladders`` are
+        replaced by their final state from the workers. Returns per-ladder
+        ScanStatistics; per-worker cycle timing is kept in ``worker_statistics``.
+        """
+        if scans < 0:
+            raise ValueError("scans must be >= 0.")
+        if cycle_time is not None and cycle_time <= 0:
+            raise ValueError("cycle_time must be > 0.")
+        if not self.ladders:
+            return {}
+
+        context = multiprocessing.get_context(self.start_method)
+        groups = _partition(self.ladders, min(self.workers, len(self.ladders)))
+        count = len(self.links)
+        links = context.RawArray("b", 2 * count)
+        for slot, (source_ladder, source_name, _, _) in enumerate(self.links):
+            component = self.ladders[source_ladder].component(source_name)
+            links[slot] = links[count + slot] = component.state
+
+        reads = {name: [] for name in self.ladders}
+        writes = {name: [] for name in self.ladders}
+        for slot, (source_ladder, source_name, target_ladder, target_name) in enumerate(self.links):
+            writes[source_ladder].append((slot, source_name))
+            reads[target_ladder].append((slot, target_name))
+
+        barrier = context.Barrier(len(groups)) if self.synchronized else None
+        results = context.Queue()
+        processes = []
+        for names in groups:
+            entries = [(name, self.ladders[name], reads[name], writes[name]) for name in names]
+            process = context.Process(
+                target=_run_worker,
+                args=(entries, scans, cycle_time, self.synchronized, links, barrier, results),
+                daemon=True,
+            )
+            process.start()
+            processes.append(process)
+
+        errors = []
+        self.statistics = {}
+        self.worker_statistics = []
+        pending = set(processes)
+        while pending:
+            try:
+                worker_pid, error, names, ladders, ladder_stats, worker_stats = results.get(timeout=0.1)
+            except queue.Empty:
+                # A worker that dies without reporting (killed, os._exit) never answers.
+                for process in [process for process in pending if process.exitcode not in (None, 0)]:
+                    pending.discard(process)
+                    errors.append(f"Worker process {process.pid} exited with code {process.exitcode}.")
+                    if barrier is not None:
+                        barrier.abort()
+                continue
+            pending = {process for process in pending if process.pid != worker_pid}
+            if error is not None:
+                errors.append(error)
+                continue
+            for name, ladder, stats in zip(names, ladders, ladder_stats):
+                self.ladders[name] = ladder
+                self.statistics[name] = stats
+            self.worker_statistics.append(worker_stats)
+        for process in processes:
+            process.join()
+
+        if errors:
+            # Peers of a failed worker only report the aborted barrier.
+            errors.sort(key=lambda error: "BrokenBarrierError" in error)
+            raise RuntimeError(f"Plant worker failed:\n{errors[0]}")
+        return {name: self.statistics[name] for name in self.ladders}
@@ -0,0 +1,350 @@
+import functools
+import math
+import re
+import xml.etree.ElementTree as ET
+
+from pyladdersim.branches import Parallel, Series, iter_elements
+from pyladdersim.components import (
+    CoilContact,
+    Contact,
+    CounterDown,
+    CounterUp,
+    FallingEdgeContact,
+    InvertedContact,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    PulseTimer,
+    ResetOutput,
+    RetentiveOutput,
+    RisingEdgeContact,
+    is_stateful,
+)
+
+# LD body elements kept as records; everything else is dropped as it is parsed.
+_ELEMENTS = {"leftPowerRail", "rightPowerRail", "contact", "coil", "block", "inVariable"}
+
+# Block type -> (class, power input pin, preset pin).
+_BLOCKS = {
+    "TON": (OnDelayTimer, "IN", "PT"),
+    "TOF": (OffDelayTimer, "IN", "PT"),
+    "TP": (PulseTimer, "IN", "PT"),
+    "CTU": (CounterUp, "CU", "PV"),
+    "CTD": (CounterDown, "CD", "PV"),
+}
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(d|h|ms|m|s|us|ns)")
+_UNITS = {"d": 86400.0, "h": 3600.0, "m": 60.0, "s": 1.0, "ms": 1e-3, "us": 1e-6, "ns": 1e-9}
+
+
+@functools.lru_cache(maxsize=None)
+def _local(tag):
+    return tag.rpartition("}")[2]
+
+
+def _parse_duration(text):
+    """Seconds in an IEC TIME literal such as ``T#1m30s`` or ``TIME#250ms``."""
+    prefix, _, body = text.partition("#")
+    if prefix.upper() not in ("T", "TIME"):
+        return None
+    body = body.replace("_", "").lower()
+    parts = _DURATION.findall(body)
+    if not parts or "".join(value + unit for value, unit in parts) != body:
+        raise ValueError(f"Cannot read {text!r} as a TIME literal.")
+    return sum(float(value) * _UNITS[unit] for value, unit in parts)
+
+
+def _parse_integer(text):
+    """Value of an IEC integer literal such as ``10``, ``INT#10`` or ``16#FF``."""
+    text = text.replace("_", "")
+    prefix, sep, value = text.rpartition("#")
+    if sep and prefix.isdigit():
+        return int(value, int(prefix))
+    return int(value if sep else text)
+
+
+def _connections(point):
+    return [
+        (connection.get("refLocalId"), connection.get("formalParameter"))
+        for connection in point
+        if _local(connection.tag) == "connection"
+    ]
+
+
+def _record(element):
+    """Compact (kind, attributes, text, pins) tuple for one LD element."""
+    kind = _local(element.tag)
+    text = None
+    pins = {}
+    for child in element:
+        name = _local(child.tag)
+        if name in ("variable", "expression"):
+            text = (child.text or "").strip()
+        elif name == "connectionPointIn":
+            pins[None] = _connections(child)
+        elif name == "inputVariables":
+            for variable in child:
+                for point in variable:
+                    if _local(point.tag) == "connectionPointIn":
+                        pins[variable.get("formalParameter")] = _connections(point)
+    return kind, dict(element.attrib), text, pins
+
+
+class _Body:
+    """Turns the records of one LD body into rungs, one per coil."""
+
+    def __init__(self, importer, records):
+        self.importer = importer
+        self.records = records
+        self.consumers = {}
+        for _, _, _, pins in records.values():
+            for connections in pins.values():
+                for source, _ in connections:
+                    self.consumers[source] = self.consumers.get(source, 0) + 1
+        self.flows = {}
+        self.visiting = set()
+        for kind, attributes, variable, _ in records.values():
+            if kind == "coil":
+                importer.declare_coil(attributes, variable)
+
+    def rungs(self):
+        for local_id, (kind, attributes, variable, pins) in self.records.items():
+            if kind == "coil":
+                components = self.inputs(pins.get(None, []), local_id)
+                yield components + [self.importer.coil(attributes, variable)]
+
+    def inputs(self, connections, local_id):
+        """Series elements for the power arriving over ``connections``."""
+        if not connections:
+            raise ValueError(f"LD element {local_id} has no input connection.")
+        branches = [self.flow(source, pin) for source, pin in connections]
+        if len(branches) == 1:
+            return list(branches[0])
+        if any(not branch for branch in branches):
+            # One branch comes straight from the power rail, so the OR always conducts.
+            if any(is_stateful(element) for element in iter_elements(sum(branches, []))):
+                raise ValueError(f"LD element {local_id} ORs the power rail with stateful elements.")
+            return []
+        return [Parallel(*[branch[0] if len(branch) == 1 else Series(*branch) for branch in branches])]
+
+    def flow(self, local_id, pin):
+        """Series elements whose result is the power leaving ``local_id``."""
+        key = (local_id, pin)
+        if key in self.flows:
+            return self.flows[key]
+        if local_id in self.visiting:
+            raise ValueError(f"LD network loops back through element {local_id}.")
+        record = self.records.get(local_id)
+        if record is None:
+            raise ValueError(f"Connection to unknown LD element {local_id}.")
+
+        self.visiting.add(local_id)
+        kind, attributes, text, pins = record
+        importer = self.importer
+        if kind == "leftPowerRail":
+            flow = []
+        elif kind == "contact":
+            flow = self.inputs(pins.get(None, []), local_id) + [importer.contact(attributes, text)]
+        elif kind == "coil":
+            # Coils pass their input power on to whatever follows them.
+            flow = self.inputs(pins.get(None, []), local_id)
+        elif kind == "inVariable":
+            flow = importer.variable(text)
+        elif kind == "block":
+            if pin not in (None, "Q"):
+                raise ValueError(f"Block output {pin!r} of element {local_id} cannot carry power.")
+            flow = self.block(local_id, attributes, pins)
+        else:
+            raise ValueError(f"{kind} element {local_id} cannot drive power flow.")
+        self.visiting.discard(local_id)
+
+        if self.consumers.get(local_id, 0) > 1 and any(is_stateful(e) for e in iter_elements(flow)):
+            # One network object for every consumer, so its blocks see each scan once.
+            if len(flow) != 1 or not isinstance(flow[0], Series):
+                flow = [Series(*flow)]
+        self.flows[key] = flow
+        return flow
+
+    def block(self, local_id, attributes, pins):
+        type_name = attributes.get("typeName", "").upper()
+        if type_name not in _BLOCKS:
+            raise ValueError(f"Unsupported block type {attributes.get('typeName')!r}.")
+        cls, power_pin, preset_pin = _BLOCKS[type_name]
+
+        for pin, connections in pins.items():
+            if pin in (power_pin, preset_pin) or not connections:
+                continue
+            if pin == "EN" and all(self.flow(source, p) == [] for source, p in connections):
+                continue
+            if pin in ("R", "LD") and all(self.constant(source) is False for source, _ in connections):
+                continue
+            raise ValueError(f"Block input {pin!r} of element {local_id} is not supported.")
+
+        preset = self.constant(self._single(pins, preset_pin, local_id))
+        flow = self.inputs(pins.get(power_pin, []), local_id)
+        return flow + [self.importer.block(cls, attributes.get("instanceName") or f"{type_name}{local_id}", preset)]
+
+    def _single(self, pins, pin, local_id):
+        connections = pins.get(pin, [])
+        if len(connections) != 1:
+            raise ValueError(f"Block input {pin!r} of element {local_id} needs one connection.")
+        return connections[0][0]
+
+    def constant(self, local_id):
+        """An inVariable's literal: TRUE/FALSE as a bool, others as text; None for variables."""
+        kind, _, text, _ = self.records.get(local_id, (None, None, None, None))
+        if kind != "inVariable" or not text:
+            return None
+        if text.upper() in ("TRUE", "FALSE"):
+            return text.upper() == "TRUE"
+        if text[0].isdigit() or "#" in text:
+            return text
+        return None
+
+
+class _Importer:
+    """Component objects shared across every body of one import."""
+
+    def __init__(self, cycle_time):
+        if cycle_time <= 0:
+            raise ValueError("cycle_time must be > 0.")
+        self.cycle_time = cycle_time
+        self.shared = {}
+        self.coils = {}
+        self.inputs = set()
+
+    def _get(self, cls, name, *args):
+        key = (cls, name)
+        component = self.shared.get(key)
+        if component is None:
+            component = self.shared[key] = cls(name, *args)
+        return component
+
+    def declare_coil(self, attributes, variable):
+        """Register the coil object for ``variable`` so contacts on it can read it."""
+        storage = attributes.get("storage", "none")
+        if storage not in ("none", "set", "reset") or variable in self.coils:
+            return
+        if variable in self.inputs:
+            raise ValueError(f"Contacts on {variable!r} come before the body driving its coil.")
+        self.coils[variable] = self._get(Output if storage == "none" else RetentiveOutput, variable)
+
+    def _input(self, variable, negated=False):
+        """Contact on ``variable``; it reads the coil when one drives the variable."""
+        coil = self.coils.get(variable)
+        if coil is None:
+            self.inputs.add(variable)
+            return self._get(InvertedContact if negated else Contact, variable)
+        key = (CoilContact, variable, negated)
+        if key not in self.shared:
+            self.shared[key] = CoilContact(coil, inverted=negated)
+        return self.shared[key]
+
+    def contact(self, attributes, variable):
+        negated = attributes.get("negated", "false") == "true"
+        edge = attributes.get("edge", "none")
+        if edge == "none":
+            return self._input(variable, negated)
+        if negated:
+            raise ValueError(f"Negated edge contacts on {variable!r} are not supported.")
+        # Edge contacts keep their own history, one per occurrence like a PLC's R_TRIG.
+        if edge in ("rising", "falling") and variable in self.coils:
+            raise ValueError(f"Edge contacts on coil {variable!r} are not supported.")
+        self.inputs.add(variable)
+        if edge == "rising":
+            return RisingEdgeContact(variable)
+        if edge == "falling":
+            return FallingEdgeContact(variable)
+        raise ValueError(f"Unknown contact edge {edge!r}.")
+
+    def coil(self, attributes, variable):
+        if attributes.get("negated", "false") == "true":
+            raise ValueError(f"Negated coil {variable!r} is not supported.")
+        storage = attributes.get("storage", "none")
+        if storage == "none":
+            return self._get(Output, variable)
+        if storage == "set":
+            return self._get(RetentiveOutput, variable)
+        if storage == "reset":
+            return ResetOutput(self._get(RetentiveOutput, variable))
+        raise ValueError(f"Unknown coil storage {storage!r}.")
+
+    def variable(self, text):
+        """Power flow from an inVariable: a boolean literal or a contact on a variable."""
+        if text and text.upper() == "TRUE":
+            return []
+        if not text or text.upper() == "FALSE" or text[0].isdigit() or "#" in text:
+            raise ValueError(f"inVariable {text!r} cannot carry power flow.")
+        return [self._input(text)]
+
+    def block(self, cls, name, preset):
+        if preset is None or preset is True or preset is False:
+            raise ValueError(f"Block {name!r} needs a literal preset.")
+        if cls in (CounterUp, CounterDown):
+            value = _parse_integer(preset)
+        else:
+            seconds = _parse_duration(preset)
+            # Bare numbers are taken as a scan count.
+            value = _parse_integer(preset) if seconds is None else math.ceil(seconds / self.cycle_time - 1e-9)
+        block = self._get(cls, name, value)
+        if (block.PV if cls in (CounterUp, CounterDown) else block.PT) != value:
+            raise ValueError(f"Block {name!r} is used with different presets.")
+        return block
+
+
+def read_plcopen(source, pou=None, cycle_time=1.0):
+    """
+    Import the LD bodies of a PLCopen TC6 XML file (path or binary file
+    object) as a Ladder, one rung per coil in document order.
+    - ``pou`` restricts the import to one program organisation unit.
+    - ``cycle_time`` (seconds per scan) converts TIME presets such as
+      ``T#5s`` into the scan counts timers use.
+    The file is read incrementally: only the compact records of the LD body
+    being parsed are held, so memory follows the largest body, not the file.
+    Contacts and coils become Contact/InvertedContact/edge contacts and
+    Output/RetentiveOutput/ResetOutput; TON/TOF/TP and CTU/CTD blocks become
+    timers and counters named after their instance. A contact on a variable
+    driven by a coil in the same or an earlier body is a CoilContact reading
+    that coil, so seal-in and interlock circuits hold; other contact
+    variables are independent inputs. Edge contacts on coil variables and
+    contacts that precede the body driving their coil raise ValueError.
+    """
+    from pyladdersim.ladder import Ladder, Rung
+
+    importer = _Importer(cycle_time)
+    ladder = Ladder()
+    found = False
+    current = None
+    records = None
+    depth = 0
+    body_depth = None
+
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            tag = _local(element.tag)
+            if tag == "pou":
+                current = element.get("name")
+            elif tag == "LD" and (pou is None or current == pou):
+                records, body_depth = {}, depth
+            continue
+
+        depth -= 1
+        if records is not None:
+            if depth > body_depth:
+                continue  # Part of an LD element; read when that element ends.
+            if depth == body_depth:
+                if _local(element.tag) in _ELEMENTS:
+                    records[element.get("localId")] = _record(element)
+            elif depth == body_depth - 1:
+                for components in _Body(importer, records).rungs():
+                    ladder.add_rung(Rung(components))
+                found, records = True, None
+        # Drop parsed children; only empty shells stay in their parents.
+        element.clear()
+
+    if not found:
+        if pou is None:
+            raise ValueError("No LD bodies found in the PLCopen file.")
+        raise KeyError(f"No LD body in POU {pou!r}.")
+    return ladder
@@ -0,0 +1,148 @@
+import json
+import time
+
+from pyladdersim.components import FunctionBlock
+
+
+class TimingStats:
+    """Call count, min/max and a power-of-two nanosecond histogram of durations."""
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.histogram = {}
+
+    def record(self, duration_ns):
+        self.calls += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        bucket = duration_ns.bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def percentile(self, fraction):
+        """Upper bound in nanoseconds of the histogram bucket holding ``fraction``."""
+        if not self.calls:
+            return 0
+        threshold = fraction * self.calls
+        seen = 0
+        for bucket in sorted(self.histogram):
+            seen += self.histogram[bucket]
+            if seen >= threshold:
+                return min((1 << bucket) - 1, self.max_ns)
+        return self.max_ns
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "total": self.total_ns / 1e9,
+            "mean": self.total_ns / self.calls / 1e9 if self.calls else 0.0,
+            "min": (self.min_ns or 0) / 1e9,
+            "max": self.max_ns / 1e9,
+            "p99": self.percentile(0.99) / 1e9,
+        }
+
+
+class ScanProfiler:
+    """
+    Instrumented scan used by ``Ladder.enable_profiling``.
+    Records per-rung and per-function-block timings and, up to ``trace_limit``
+    events, the scan/rung spans for a Chrome trace export.
+    """
+
+    def __init__(self, ladder, trace_limit=100_000):
+        self.ladder = ladder
+        self.trace_limit = trace_limit
+        self.scan_stats = TimingStats()
+        self.rung_stats = {}
+        self.block_stats = {}
+        self.events = []
+        self._origin_ns = time.perf_counter_ns()
+
+    def scan(self):
+        """Evaluate every rung like ``Ladder.scan_rungs`` while timing it."""
+        clock = time.perf_counter_ns
+        scan_start = clock()
+        results = []
+        for index, rung in enumerate(self.ladder.rungs):
+            rung_start = clock()
+            results.append(self._evaluate_rung(rung, clock))
+            rung_end = clock()
+            self._stats(self.rung_stats, index).record(rung_end - rung_start)
+            self._trace(f"rung {index}", rung_start, rung_end, "rung")
+        scan_end = clock()
+        self.scan_stats.record(scan_end - scan_start)
+        self._trace("scan", scan_start, scan_end, "scan")
+        return all(results)
+
+    def _evaluate_rung(self, rung, clock):
+        # Mirrors Rung.evaluate with timing around each function block.
+        result = True
+        for component in rung.components:
+            if component is rung.output:
+                continue
+            if isinstance(component, FunctionBlock):
+                start = clock()
+                result = component.evaluate(IN=result)
+                self._stats(self.block_stats, component).record(clock() - start)
+            else:
+                component_result = component.evaluate()
+                result = result and component_result
+
+        rung.output.evaluate(result)
+        return rung.output.state
+
+    @staticmethod
+    def _stats(table, key):
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = TimingStats()
+        return stats
+
+    def _trace(self, name, start_ns, end_ns, category):
+        if len(self.events) < self.trace_limit:
+            self.events.append((name, category, start_ns, end_ns))
+
+    def rung_summary(self):
+        """Per-rung timing, slowest total first."""
+        rows = [dict(rung=index, **stats.as_dict()) for index, stats in self.rung_stats.items()]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def block_summary(self):
+        """Per-function-block timing, slowest total first."""
+        rows = [
+            dict(name=component.name, type=type(component).__name__, **stats.as_dict())
+            for component, stats in self.block_stats.items()
+        ]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def reset(self):
+        self.scan_stats = TimingStats()
+        self.rung_stats.clear()
+        self.block_stats.clear()
+        self.events.clear()
+
+    def chrome_trace(self):
+        """Return recorded spans in Chrome trace format (also read by speedscope)."""
+        events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin_ns) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": 1,
+                "tid": 1,
+            }
+            for name, category, start, end in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ns"}
+
+    def export_chrome_trace(self, path):
+        """Write the recorded spans to ``path`` as Chrome trace JSON."""
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.chrome_trace(), handle)
@@ -0,0 +1,263 @@
+import json
+import struct
+import sys
+from array import array
+
+from pyladdersim.branches import Branch, Parallel, Series, SharedNetwork, share_networks
+from pyladdersim.components import (
+    CoilContact,
+    Contact,
+    Counter,
+    CounterDown,
+    CounterUp,
+    FallingEdgeContact,
+    InvertedContact,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    PulseTimer,
+    ResetOutput,
+    RetentiveOutput,
+    RisingEdgeContact,
+    Timer,
+    component_type,
+)
+
+_MAGIC = b"PLSPROG1\n"
+_LENGTH = struct.Struct("<I")
+
+# Type codes are part of the file format; append new classes at the end.
+_TYPES = (
+    Contact,
+    InvertedContact,
+    RisingEdgeContact,
+    FallingEdgeContact,
+    Output,
+    RetentiveOutput,
+    OnDelayTimer,
+    OffDelayTimer,
+    PulseTimer,
+    CounterUp,
+    CounterDown,
+    Series,
+    Parallel,
+    SharedNetwork,
+    ResetOutput,
+    CoilContact,
+)
+_CODES = {cls: code for code, cls in enumerate(_TYPES)}
+_EDGE_CODES = {_CODES[RisingEdgeContact], _CODES[FallingEdgeContact]}
+_TIMER_CODES = {_CODES[OnDelayTimer], _CODES[OffDelayTimer], _CODES[PulseTimer]}
+_COUNTER_CODES = {_CODES[CounterUp], _CODES[CounterDown]}
+_BRANCH_CODES = {_CODES[Series], _CODES[Parallel]}
+_OUTPUT_CODES = {_CODES[Output], _CODES[RetentiveOutput], _CODES[ResetOutput]}
+_SHARED_CODE = _CODES[SharedNetwork]
+_RESET_CODE = _CODES[ResetOutput]
+_COIL_CONTACT_CODE = _CODES[CoilContact]
+
+# Per-element flag bits.
+_B0 = 1  # state / Q
+_B1 = 2  # _previous_state / _previous_in / branch is pure / coil contact is inverted
+_B2 = 4  # branch conduction
+
+# Arrays follow the header in this order; see save().
+_ARRAYS = (
+    ("types", "B"),
+    ("names", "I"),
+    ("flags", "B"),
+    ("values", "q"),
+    ("presets", "q"),
+    ("child_offsets", "I"),
+    ("children", "I"),
+    ("rung_offsets", "I"),
+    ("rung_elements", "I"),
+    ("rung_flags", "B"),
+)
+
+
+class _Writer:
+    def __init__(self):
+        self.index = {}
+        self.strings = {}
+        self.columns = {name: array(code) for name, code in _ARRAYS}
+        self.columns["child_offsets"].append(0)
+        self.columns["rung_offsets"].append(0)
+
+    def add(self, element):
+        """Assign ``element`` an index after everything it refers to."""
+        key = id(element)
+        if key in self.index:
+            return self.index[key]
+
+        cls = component_type(element)
+        code = _CODES.get(cls)
+        if code is None:
+            raise TypeError(f"Cannot save {cls.__name__} components.")
+
+        flags = _B0 if element.state else 0
+        value = preset = 0
+        children = []
+        if isinstance(element, Branch):
+            children = [self.add(child) for child in element.elements]
+            flags |= (_B1 if element.pure else 0) | (_B2 if element._conducts else 0)
+        elif isinstance(element, SharedNetwork):
+            value = self.add(element.network)
+        elif isinstance(element, ResetOutput):
+            value = self.add(element.latch)
+        elif isinstance(element, CoilContact):
+            flags |= _B1 if element.inverted else 0
+            value = self.add(element.coil)
+        elif isinstance(element, Timer):
+            flags |= _B1 if element._previous_in else 0
+            value, preset = element.ET, element.PT
+        elif isinstance(element, Counter):
+            flags |= _B1 if element._previous_in else 0
+            value, preset = element.CV, element.PV
+        elif isinstance(element, (RisingEdgeContact, FallingEdgeContact)):
+            flags |= _B1 if element._previous_state else 0
+
+        columns = self.columns
+        columns["types"].append(code)
+        columns["names"].append(self.strings.setdefault(element.name, len(self.strings)))
+        columns["flags"].append(flags)
+        columns["values"].append(value)
+        columns["presets"].append(preset)
+        columns["children"].extend(children)
+        columns["child_offsets"].append(len(columns["children"]))
+        index = self.index[key] = len(self.index)
+        return index
+
+
+def save(ladder, path):
+    """
+    Write ``ladder``'s program and current state to ``path``.
+    The file holds a JSON header (counts, name table, scan count) followed by
+    flat little-endian columns: one record per element (type code, name,
+    flag bits, ET/CV, PT/PV), branch children and rung element lists.
+    """
+    writer = _Writer()
+    columns = writer.columns
+    for rung in ladder.rungs:
+        columns["rung_elements"].extend(writer.add(component) for component in rung.components)
+        columns["rung_offsets"].append(len(columns["rung_elements"]))
+        columns["rung_flags"].append(1 if rung.short_circuit else 0)
+
+    header = json.dumps(
+        {
+            "scan_count": ladder.scan_count,
+            "strings": list(writer.strings),
+            "lengths": {name: len(columns[name]) for name, _ in _ARRAYS},
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    with open(path, "wb") as handle:
+        handle.write(_MAGIC + _LENGTH.pack(len(header)) + header)
+        for name, _ in _ARRAYS:
+            column = columns[name]
+            if sys.byteorder != "little":
+                column.byteswap()
+            column.tofile(handle)
+
+
+def _read(path):
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if not data.startswith(_MAGIC):
+        raise ValueError(f"{path!r} is not a pyladdersim program file.")
+    (length,) = _LENGTH.unpack_from(data, len(_MAGIC))
+    start = len(_MAGIC) + _LENGTH.size
+    header = json.loads(data[start:start + length])
+    offset = start + length
+    columns = {}
+    for name, code in _ARRAYS:
+        column = array(code)
+        size = header["lengths"][name] * column.itemsize
+        column.frombytes(data[offset:offset + size])
+        if sys.byteorder != "little":
+            column.byteswap()
+        columns[name] = column
+        offset += size
+    return header, columns
+
+
+def _build_elements(header, columns):
+    new = object.__new__
+    strings = header["strings"]
+    child_offsets = columns["child_offsets"]
+    children = columns["children"]
+    elements = []
+    append = elements.append
+
+    # Objects are filled in directly; saved programs were validated when built.
+    for index, (code, name, flags, value, preset) in enumerate(
+        zip(columns["types"], columns["names"], columns["flags"], columns["values"], columns["presets"])
+    ):
+        element = new(_TYPES[code])
+        element.name = strings[name]
+        element.state = bool(flags & _B0)
+        if code in _TIMER_CODES:
+            element._previous_in = bool(flags & _B1)
+            element.ET, element.PT = value, preset
+        elif code in _COUNTER_CODES:
+            element._previous_in = bool(flags & _B1)
+            element.CV, element.PV = value, preset
+        elif code in _EDGE_CODES:
+            element._previous_state = bool(flags & _B1)
+        elif code in _BRANCH_CODES:
+            element.pure = bool(flags & _B1)
+            element._conducts = bool(flags & _B2)
+            start, stop = child_offsets[index], child_offsets[index + 1]
+            element.elements = [elements[child] for child in children[start:stop]]
+        elif code == _SHARED_CODE:
+            element.network = elements[value]
+        elif code == _RESET_CODE:
+            element.latch = elements[value]
+        elif code == _COIL_CONTACT_CODE:
+            element.coil = elements[value]
+            element.inverted = bool(flags & _B1)
+        append(element)
+    return elements
+
+
+def load(path, compile=False, cls=None):
+    """
+    Read a program written by ``save`` and return a ``cls`` (default Ladder)
+    in the saved state. Rungs are built without re-validation and planned on
+    their first short-circuit scan; with ``compile`` the ladder is compiled
+    straight away and each chunk of rungs becomes bytecode on its first scan.
+    """
+    from pyladdersim.ladder import Ladder, Rung
+
+    header, columns = _read(path)
+    elements = _build_elements(header, columns)
+    rung_offsets = columns["rung_offsets"]
+    rung_elements = columns["rung_elements"]
+    types = columns["types"]
+    is_output = [code in _OUTPUT_CODES for code in range(len(_TYPES))]
+
+    new = object.__new__
+    rungs = []
+    append = rungs.append
+    start = 0
+    for stop, short_circuit in zip(rung_offsets[1:], columns["rung_flags"]):
+        indexes = rung_elements[start:stop]
+        start = stop
+        rung = new(Rung)
+        rung.components = [elements[element] for element in indexes]
+        for element in indexes:
+            if is_output[types[element]]:
+                rung.output = elements[element]
+                break
+        rung.short_circuit = short_circuit == 1
+        rung._plan = None
+        append(rung)
+
+    ladder = (cls or Ladder)()
+    ladder.rungs = rungs
+    ladder.scan_count = header["scan_count"]
+    if any(code in _BRANCH_CODES for code in set(types)):
+        for rung in rungs:
+            share_networks(rung.components, ladder._networks)
+    if compile:
+        ladder.compile()
+    return ladder
@@ -0,0 +1,46 @@
+import queue
+from collections import namedtuple
+from operator import attrgetter
+
+LadderSnapshot = namedtuple("LadderSnapshot", ["scan", "output", "states"])
+LadderSnapshot.__doc__ = "Immutable ladder state published after a scan."
+
+_get_state = attrgetter("state")
+
+
+class SnapshotChannel:
+    """
+    Hand ladder state from a scan loop to a renderer without blocking either.
+    The scan side publishes a snapshot after each scan and only the newest is
+    kept. GUI contact toggles are queued and applied by the scan side at the
+    next cycle boundary. ``states`` align with ``components``, which is fixed
+    when the channel is created.
+    """
+
+    def __init__(self, ladder):
+        self.ladder = ladder
+        self.components = tuple(ladder.components())
+        self.latest = None
+        self._toggles = queue.SimpleQueue()
+
+    def publish(self, output):
+        """Replace the latest snapshot; called by the scan loop after a scan."""
+        # A single attribute assignment, so readers always see a whole snapshot.
+        self.latest = LadderSnapshot(
+            self.ladder.scan_count, output, tuple(map(_get_state, self.components))
+        )
+
+    def request_toggle(self, contact):
+        """Queue a contact toggle from the GUI for the next scan."""
+        self._toggles.put(contact)
+
+    def apply_toggles(self):
+        """Apply queued toggles; called by the scan loop before a scan."""
+        applied = 0
+        while True:
+            try:
+                contact = self._toggles.get_nowait()
+            except queue.Empty:
+                return applied
+            contact.state = not contact.state
+            applied += 1
@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+from pyladdersim.components import Contact, InvertedContact
+from pyladdersim.render import SnapshotChannel
+from pyladdersim.scheduler import ScanScheduler
+
+
+class AsyncLadderRuntime:
+    """
+    Run a ladder as an asyncio task on absolute cycle deadlines.
+    Other coroutines exchange data with the scan loop at cycle boundaries:
+    ``set_input`` queues contact values that are applied before the next scan,
+    and ``subscribe`` / ``snapshots`` deliver a ``LadderSnapshot`` after each
+    scan. Everything runs on the event loop thread, so no locks are needed.
+    ``stop()`` or cancelling the task ends the run without waiting out the
+    current cycle.
+    """
+
+    def __init__(self, ladder, cycle_time=1.0, overrun_policy="skip"):
+        self.ladder = ladder
+        self.scheduler = ScanScheduler(cycle_time, policy=overrun_policy, clock=time.monotonic)
+        self.channel = SnapshotChannel(ladder)
+        self._components = ladder.components_by_name()
+        self._pending = {}
+        self._subscribers = []
+        self._stop_requested = False
+        self._stop_event = None
+
+    @property
+    def statistics(self):
+        return self.scheduler.statistics
+
+    @property
+    def latest(self):
+        """The snapshot published after the most recent scan, or None."""
+        return self.channel.latest
+
+    def _contact(self, contact):
+        if isinstance(contact, str):
+            contact = self.ladder.component(contact, self._components)
+        if not isinstance(contact, (Contact, InvertedContact)):
+            raise TypeError(f"{contact.name!r} is not a contact.")
+        return contact
+
+    def set_input(self, contact, value):
+        """
+        Drive a contact (or contact name) at the next scan boundary.
+        The last value written before a scan wins.
+        """
+        self._pending[self._contact(contact)] = bool(value)
+
+    def subscribe(self, maxsize=1):
+        """
+        Return an ``asyncio.Queue`` that receives a snapshot after every scan.
+        When the queue is full the oldest snapshot is dropped, so a slow
+        consumer never delays the scan loop. ``None`` is queued when the run ends.
+        """
+        queue = asyncio.Queue(maxsize)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self._subscribers.remove(queue)
+
+    async def snapshots(self, maxsize=1):
+        """Async iterator over scan snapshots until the run ends."""
+        queue = self.subscribe(maxsize)
+        try:
+            while True:
+                snapshot = await queue.get()
+                if snapshot is None:
+                    return
+                yield snapshot
+        finally:
+            if queue in self._subscribers:
+                self.unsubscribe(queue)
+
+    def stop(self):
+        """Ask the run to end; the sleeping scan loop wakes immediately."""
+        self._stop_requested = True
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def _apply_inputs(self):
+        pending = self._pending
+        for contact, value in pending.items():
+            # activate()/deactivate() keep normally-closed polarity intact.
+            contact.activate() if value else contact.deactivate()
+        pending.clear()
+
+    def _publish(self, snapshot):
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
+
+    async def run(self, max_scans=None):
+        """Scan once per cycle until stopped, cancelled or ``max_scans`` is reached."""
+        ladder = self.ladder
+        scheduler = self.scheduler
+        stats = scheduler.statistics
+        clock = scheduler.clock
+        channel = self.channel
+        stop_event = self._stop_event = asyncio.Event()
+        if self._stop_requested:
+            stop_event.set()
+
+        ladder.running = True
+        deadline = clock()
+        try:
+            while ladder.running and not stop_event.is_set():
+                if max_scans is not None and stats.scans >= max_scans:
+                    break
+
+                start = clock()
+                self._apply_inputs()
+                channel.publish(ladder.scan_once())
+                end = clock()
+                stats.record(end - start, max(0.0, start - deadline))
+                deadline = scheduler.next_deadline(deadline, end)
+                self._publish(channel.latest)
+
+                delay = deadline - clock()
+                if delay <= 0:
+                    # Overrunning; still let other coroutines run between scans.
+                    await asyncio.sleep(0)
+                    continue
+                try:
+                    await asyncio.wait_for(stop_event.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            ladder.running = False
+            self._stop_event = None
+            self._stop_requested = False
+            self._publish(None)
+        return stats
@@ -0,0 +1,101 @@
+import time
+
+OVERRUN_POLICIES = ("catch_up", "skip")
+
+
+class ScanStatistics:
+    """Timing statistics collected by a :class:`ScanScheduler`."""
+
+    def __init__(self):
+        self.scans = 0
+        self.overruns = 0
+        self.skipped_cycles = 0
+        self.total_scan_time = 0.0
+        self.min_scan_time = None
+        self.max_scan_time = 0.0
+        self.total_jitter = 0.0
+        self.max_jitter = 0.0
+
+    def record(self, scan_time, jitter):
+        self.scans += 1
+        self.total_scan_time += scan_time
+        self.max_scan_time = max(self.max_scan_time, scan_time)
+        if self.min_scan_time is None or scan_time < self.min_scan_time:
+            self.min_scan_time = scan_time
+        self.total_jitter += jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+
+    @property
+    def mean_scan_time(self):
+        return self.total_scan_time / self.scans if self.scans else 0.0
+
+    @property
+    def mean_jitter(self):
+        return self.total_jitter / self.scans if self.scans else 0.0
+
+    def as_dict(self):
+        return {
+            "scans": self.scans,
+            "overruns": self.overruns,
+            "skipped_cycles": self.skipped_cycles,
+            "min_scan_time": self.min_scan_time or 0.0,
+            "mean_scan_time": self.mean_scan_time,
+            "max_scan_time": self.max_scan_time,
+            "mean_jitter": self.mean_jitter,
+            "max_jitter": self.max_jitter,
+        }
+
+
+class ScanScheduler:
+    """
+    Run scans on absolute deadlines so the period does not drift.
+    - ``catch_up``: missed cycles run back-to-back until the schedule is met.
+    - ``skip``: missed cycles are dropped and counted in ``skipped_cycles``.
+    An overrun is a scan that finishes after the next cycle's deadline.
+    Jitter is how late each scan started relative to its deadline.
+    """
+
+    def __init__(self, period, policy="skip", clock=time.perf_counter, sleep=time.sleep):
+        if period <= 0:
+            raise ValueError("period must be > 0.")
+        if policy not in OVERRUN_POLICIES:
+            raise ValueError(f"policy must be one of {OVERRUN_POLICIES}.")
+
+        self.period = period
+        self.policy = policy
+        self.clock = clock
+        self.sleep = sleep
+        self.statistics = ScanStatistics()
+
+    def run(self, scan, keep_running=lambda: True, max_scans=None):
+        """Call ``scan`` once per period while ``keep_running()`` is TRUE."""
+        stats = self.statistics
+        deadline = self.clock()
+
+        while keep_running():
+            if max_scans is not None and stats.scans >= max_scans:
+                break
+
+            start = self.clock()
+            scan()
+            end = self.clock()
+            stats.record(end - start, max(0.0, start - deadline))
+            deadline = self.next_deadline(deadline, end)
+
+            delay = deadline - self.clock()
+            if delay > 0:
+                self.sleep(delay)
+
+        return stats
+
+    def next_deadline(self, deadline, end):
+        """Return the deadline after ``deadline`` for a scan that finished at ``end``."""
+        deadline += self.period
+        if end > deadline:
+            stats = self.statistics
+            stats.overruns += 1
+            if self.policy == "skip":
+                missed = int((end - deadline) // self.period) + 1
+                stats.skipped_cycles += missed
+                deadline += missed * self.period
+        return deadline
@@ -0,0 +1,176 @@
+import json
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from operator import attrgetter
+
+from pyladdersim.components import Contact, InvertedContact, Output
+
+MAGIC = b"PLSIMG1\0"
+HEADER = struct.Struct("<8sQQIIII")
+_SEQUENCE = struct.Struct("<QQ")
+_SEQUENCE_OFFSET = 8
+DATA_OFFSET = HEADER.size
+
+_get_state = attrgetter("state")
+
+
+def _unique_names(components, kind):
+    names = [component.name for component in components]
+    if len(set(names)) != len(names):
+        raise ValueError(f"{kind} names must be unique to publish a process image.")
+    return names
+
+
+class SharedProcessImage:
+    """
+    Ladder I/O image in a ``multiprocessing.shared_memory`` block, installed
+    with ``Ladder.enable_process_image``. Block layout (little-endian)::
+
+        offset      size  field
+        0           8     magic b"PLSIMG1\\0"
+        8           8     u64 sequence, odd while the ladder is committing outputs
+        16          8     u64 scan_count of the committed outputs
+        24          4     u32 input count N
+        28          4     u32 output count M
+        32          4     u32 name directory length L
+        36          4     reserved
+        40          N     input bytes, 0/1 per contact, written by other processes
+        40+N        M     output bytes, 0/1 per output coil, written by the ladder
+        40+N+M      L     UTF-8 JSON {"inputs": [names], "outputs": [names]}
+
+    An input byte is the signal driving the contact (1 activates it, so a
+    normally-closed contact opens). Inputs are latched when a scan starts and
+    outputs are committed when it ends; readers copy the outputs between two
+    equal, even sequence values to get a consistent snapshot. The tag lists
+    are fixed when the image is created, so re-enable it after changing rungs.
+    """
+
+    def __init__(self, ladder, name=None):
+        self.ladder = ladder
+        components = ladder.components()
+        self.inputs = [c for c in components if isinstance(c, (Contact, InvertedContact))]
+        self.outputs = [c for c in components if isinstance(c, Output)]
+        directory = json.dumps(
+            {
+                "inputs": _unique_names(self.inputs, "Input"),
+                "outputs": _unique_names(self.outputs, "Output"),
+            }
+        ).encode("utf-8")
+
+        count_in, count_out = len(self.inputs), len(self.outputs)
+        self._input_slice = slice(DATA_OFFSET, DATA_OFFSET + count_in)
+        self._output_slice = slice(DATA_OFFSET + count_in, DATA_OFFSET + count_in + count_out)
+        size = DATA_OFFSET + count_in + count_out + len(directory)
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.name = self.shm.name
+        self._sequence = 0
+
+        buf = self.shm.buf
+        HEADER.pack_into(buf, 0, MAGIC, 0, ladder.scan_count, count_in, count_out, len(directory), 0)
+        buf[self._output_slice.stop:size] = directory
+        buf[self._input_slice] = bytes(
+            int(contact.state != isinstance(contact, InvertedContact)) for contact in self.inputs
+        )
+        self._setters = [(contact.deactivate, contact.activate) for contact in self.inputs]
+        self.commit()
+
+    def latch_inputs(self):
+        """
+        Copy the whole input image into the contacts, so contacts changed
+        locally since the last scan follow the image again.
+        """
+        for setter, value in zip(self._setters, bytes(self.shm.buf[self._input_slice])):
+            setter[1 if value else 0]()
+
+    def commit(self):
+        """Publish the output coils and scan count under the sequence counter."""
+        buf = self.shm.buf
+        self._sequence += 1
+        _SEQUENCE.pack_into(buf, _SEQUENCE_OFFSET, self._sequence, self.ladder.scan_count)
+        buf[self._output_slice] = bytes(map(_get_state, self.outputs))
+        self._sequence += 1
+        struct.pack_into("<Q", buf, _SEQUENCE_OFFSET, self._sequence)
+
+    def wrap(self, engine):
+        """Return ``engine`` with the input latch before it and the commit after it."""
+        latch = self.latch_inputs
+        commit = self.commit
+
+        def scan_with_image():
+            latch()
+            output = engine()
+            commit()
+            return output
+
+        return scan_with_image
+
+    def close(self):
+        """Release and remove the shared memory block."""
+        self.shm.close()
+        self.shm.unlink()
+
+
+class ProcessImageClient:
+    """Attach to a ladder's process image from any process by block name."""
+
+    def __init__(self, name):
+        if sys.version_info >= (3, 13):
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            # Only the owner may unlink the block when this process exits.
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+
+        buf = self.shm.buf
+        magic, _, _, count_in, count_out, length, _ = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{name!r} is not a pyladdersim process image.")
+        self._input_offset = DATA_OFFSET
+        self._output_slice = slice(DATA_OFFSET + count_in, DATA_OFFSET + count_in + count_out)
+        directory = json.loads(bytes(buf[self._output_slice.stop:self._output_slice.stop + length]))
+        self.inputs = directory["inputs"]
+        self.outputs = directory["outputs"]
+        self._input_index = {tag: index for index, tag in enumerate(self.inputs)}
+
+    def set_input(self, tag, value):
+        """Drive an input contact; it is latched at the next scan start."""
+        try:
+            index = self._input_index[tag]
+        except KeyError:
+            raise KeyError(f"No input named {tag!r}.") from None
+        self.shm.buf[self._input_offset + index] = 1 if value else 0
+
+    def write_inputs(self, values):
+        """Write a whole input image of 0/1 bytes in one copy."""
+        if len(values) != len(self.inputs):
+            raise ValueError(f"Expected {len(self.inputs)} input values.")
+        self.shm.buf[self._input_offset:self._input_offset + len(values)] = bytes(values)
+
+    def read_output_bytes(self):
+        """Return ``(scan_count, output bytes)`` from one consistent commit."""
+        buf = self.shm.buf
+        outputs = self._output_slice
+        while True:
+            sequence, scan = _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)
+            if sequence & 1:
+                time.sleep(0)
+                continue
+            data = bytes(buf[outputs])
+            if struct.unpack_from("<Q", buf, _SEQUENCE_OFFSET)[0] == sequence:
+                return scan, data
+
+    def read_outputs(self):
+        """Return ``(scan_count, {output name: state})`` from one consistent commit."""
+        scan, data = self.read_output_bytes()
+        return scan, {tag: bool(value) for tag, value in zip(self.outputs, data)}
+
+    def close(self):
+        self.shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
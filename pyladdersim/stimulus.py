@@ -0,0 +1,135 @@
+import csv
+import json
+import os
+
+from pyladdersim.components import Contact, InvertedContact
+
+_TRUE = {"1", "true", "on", "yes"}
+_FALSE = {"0", "false", "off", "no", ""}
+# Bookkeeping columns written next to the tags, never compared or applied.
+_BOOKKEEPING = {"scan"}
+
+
+def _parse_bool(value):
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+        raise ValueError(f"Cannot read {value!r} as TRUE/FALSE.")
+    return bool(value)
+
+
+def read_vectors(path):
+    """
+    Yield per-scan vectors from a CSV file (header row of tag names) or a
+    JSON-lines file (one object per scan). A ``scan`` column is ignored.
+    """
+    with open(path, newline="", encoding="utf-8") as handle:
+        if os.fspath(path).endswith((".jsonl", ".ndjson")):
+            rows = (json.loads(line) for line in handle if line.strip())
+        else:
+            rows = csv.DictReader(handle)
+        for row in rows:
+            yield {name: _parse_bool(value) for name, value in row.items() if name not in _BOOKKEEPING}
+
+
+def _vectors(source):
+    if isinstance(source, (str, os.PathLike)):
+        return read_vectors(source)
+    return iter(source)
+
+
+class StimulusRun:
+    """
+    Iterator over the outputs of a stimulus replay.
+    Each item maps output names to their state after one scan. The first scan
+    whose outputs differ from the golden vectors is kept in ``divergence`` as
+    ``(scan_index, expected, actual)``; scan indexes start at 0.
+    """
+
+    def __init__(self, ladder, stream, outputs=None, golden=None, output_path=None):
+        self.ladder = ladder
+        self.scans = 0
+        self.divergence = None
+        self._stream = _vectors(stream)
+        self._golden = None if golden is None else _vectors(golden)
+        self._output_path = output_path
+        self._components = ladder.components_by_name()
+
+        if outputs is None:
+            output_components = [rung.output for rung in ladder.rungs]
+        else:
+            output_components = [self._resolve(name) for name in outputs]
+        self.output_names = [component.name for component in output_components]
+        self._output_components = output_components
+        self._setters = {}
+        self._iterator = self._run()
+
+    def _resolve(self, name):
+        return self.ladder.component(name, self._components)
+
+    def _setter(self, name):
+        setter = self._setters.get(name)
+        if setter is None:
+            contact = self._resolve(name)
+            if not isinstance(contact, (Contact, InvertedContact)):
+                raise TypeError(f"{name!r} is not a contact.")
+            # activate()/deactivate() keep normally-closed polarity intact.
+            setter = self._setters[name] = (contact.deactivate, contact.activate)
+        return setter
+
+    def _run(self):
+        scan = self.ladder.scan_once
+        setter = self._setter
+        names = self.output_names
+        components = self._output_components
+        writer = None
+        handle = None
+
+        try:
+            if self._output_path is not None:
+                handle = open(self._output_path, "w", newline="", encoding="utf-8")
+                writer = csv.writer(handle)
+                writer.writerow(["scan"] + names)
+
+            for vector in self._stream:
+                for name, value in vector.items():
+                    setter(name)[1 if value else 0]()
+                scan()
+
+                states = [component.state for component in components]
+                result = dict(zip(names, states))
+                if writer is not None:
+                    writer.writerow([self.scans] + [int(state) for state in states])
+                if self._golden is not None and self.divergence is None:
+                    self._check(result)
+                self.scans += 1
+                yield result
+        finally:
+            if handle is not None:
+                handle.close()
+
+    def _check(self, result):
+        try:
+            expected = next(self._golden)
+        except StopIteration:
+            self._golden = None
+            return
+        expected = {name: _parse_bool(value) for name, value in expected.items() if name not in _BOOKKEEPING}
+        actual = {name: result.get(name) for name in expected}
+        if actual != expected:
+            self.divergence = (self.scans, expected, actual)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._iterator)
+
+    def run(self):
+        """Consume the whole stream and return this run."""
+        for _ in self._iterator:
+            pass
+        return self
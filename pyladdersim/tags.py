@@ -0,0 +1,192 @@
+import hashlib
+from array import array
+
+from pyladdersim.components import (
+    CoilContact,
+    Counter,
+    FallingEdgeContact,
+    FunctionBlock,
+    RisingEdgeContact,
+    Timer,
+)
+
+
+def _layout(base):
+    """
+    Map attribute names onto (kind, offset) slots for a component class.
+    Booleans ("b") take one byte each; integers ("i") live in a signed 64-bit
+    array so long-running ET values cannot overflow.
+    """
+    if issubclass(base, Timer):
+        return {"Q": ("b", 0), "_previous_in": ("b", 1), "ET": ("i", 0), "PT": ("i", 1)}
+    if issubclass(base, Counter):
+        return {"Q": ("b", 0), "_previous_in": ("b", 1), "CV": ("i", 0), "PV": ("i", 1)}
+    if issubclass(base, (RisingEdgeContact, FallingEdgeContact)):
+        return {"state": ("b", 0), "_previous_state": ("b", 1)}
+    if issubclass(base, CoilContact):
+        return {}  # Reads its coil, which holds the state.
+    if issubclass(base, FunctionBlock):
+        # Custom blocks: only a bare state and an optional _previous_in fit the table.
+        slots = {slot for cls in base.__mro__ for slot in getattr(cls, "__slots__", ())}
+        if any("__dict__" in vars(cls) for cls in base.__mro__):
+            slots.add("__dict__")
+        extra = slots - {"name", "state", "_tag"}
+        if extra == {"_previous_in"}:
+            return {"state": ("b", 0), "_previous_in": ("b", 1)}
+        if extra:
+            raise TypeError(f"TagTable cannot hold the state of {base.__name__} components.")
+    return {"state": ("b", 0)}
+
+
+class _BoolTag:
+    def __init__(self, offset):
+        self.offset = offset
+
+    def __get__(self, component, owner):
+        if component is None:
+            return self
+        table, bools, _ = component._tag
+        return table.bools[bools + self.offset] != 0
+
+    def __set__(self, component, value):
+        table, bools, _ = component._tag
+        table.bools[bools + self.offset] = 1 if value else 0
+
+
+class _IntTag:
+    def __init__(self, offset):
+        self.offset = offset
+
+    def __get__(self, component, owner):
+        if component is None:
+            return self
+        table, _, ints = component._tag
+        return table.ints[ints + self.offset]
+
+    def __set__(self, component, value):
+        table, _, ints = component._tag
+        table.ints[ints + self.offset] = value
+
+
+_VIEW_CLASSES = {}
+
+
+def _view_class(base):
+    view = _VIEW_CLASSES.get(base)
+    if view is None:
+        namespace = {
+            "__slots__": (),
+            "_view_of": base,
+            "__module__": base.__module__,
+            "__doc__": base.__doc__,
+        }
+        for name, (kind, offset) in _layout(base).items():
+            namespace[name] = _BoolTag(offset) if kind == "b" else _IntTag(offset)
+        view = _VIEW_CLASSES[base] = type(base.__name__, (base,), namespace)
+    return view
+
+
+class TagTable:
+    """
+    Process image holding component state in flat arrays.
+    Bound components keep their public API (``activate()``, ``timer.Q``,
+    ``counter.CV``) but read and write their fields through the table, so the
+    whole image can be copied, hashed or compared in one operation.
+    """
+
+    def __init__(self, components=()):
+        self.components = []
+        self.bools = bytearray()
+        self.ints = array("q")
+        self._bound = set()
+        for component in components:
+            self.bind(component)
+
+    @classmethod
+    def from_ladder(cls, ladder):
+        """Bind every component used by ``ladder``."""
+        return cls(ladder.components())
+
+    def bind(self, component):
+        """Move ``component``'s state into the table and turn it into a view."""
+        if id(component) in self._bound:
+            return component
+        if hasattr(type(component), "_view_of"):
+            raise ValueError(f"{component.name!r} is already bound to a TagTable.")
+
+        base = type(component)
+        layout = _layout(base)
+        values = {name: getattr(component, name) for name in layout}
+
+        component._tag = (self, len(self.bools), len(self.ints))
+        kinds = [kind for kind, _ in layout.values()]
+        self.bools.extend(bytes(kinds.count("b")))
+        self.ints.extend([0] * kinds.count("i"))
+        component.__class__ = _view_class(base)
+        for name, value in values.items():
+            setattr(component, name, value)
+
+        self._bound.add(id(component))
+        self.components.append(component)
+        return component
+
+    def release(self):
+        """Copy state back onto the components and detach them from the table."""
+        for component in self.components:
+            view = type(component)
+            values = {name: getattr(component, name) for name in _layout(view._view_of)}
+            component.__class__ = view._view_of
+            del component._tag
+            for name, value in values.items():
+                setattr(component, name, value)
+        self.components = []
+        self._bound.clear()
+
+    def snapshot(self):
+        """Return the whole process image as immutable bytes."""
+        return bytes(self.bools) + self.ints.tobytes()
+
+    def _split(self, image):
+        if len(image) != len(self.bools) + len(self.ints) * self.ints.itemsize:
+            raise ValueError("Process image does not match this TagTable layout.")
+        split = len(self.bools)
+        ints = array("q")
+        ints.frombytes(image[split:])
+        return image[:split], ints
+
+    def restore(self, image):
+        """Load a process image produced by ``snapshot``."""
+        self.bools[:], self.ints[:] = self._split(image)
+
+    def digest(self):
+        """Hash of the current process image."""
+        return hashlib.blake2b(self.snapshot(), digest_size=16).hexdigest()
+
+    def tags(self):
+        """Yield ``(component, field)`` for every stored field."""
+        for component in self.components:
+            for name in _layout(type(component)._view_of):
+                yield component, name
+
+    def diff(self, image, other=None):
+        """
+        List ``(component, field, old, new)`` for fields that differ between
+        ``image`` and ``other`` (default: the current state).
+        """
+        other = self.snapshot() if other is None else other
+        if image == other:
+            return []
+
+        old_bools, old_ints = self._split(image)
+        new_bools, new_ints = self._split(other)
+        changes = []
+        for component in self.components:
+            _, bools, ints = component._tag
+            for name, (kind, offset) in _layout(type(component)._view_of).items():
+                if kind == "b":
+                    before, after = old_bools[bools + offset] != 0, new_bools[bools + offset] != 0
+                else:
+                    before, after = old_ints[ints + offset], new_ints[ints + offset]
+                if before != after:
+                    changes.append((component, name, before, after))
+        return changes
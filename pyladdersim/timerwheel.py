@@ -0,0 +1,263 @@
+import time
+
+from pyladdersim.components import FunctionBlock
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel counting milliseconds of a monotonic clock.
+    Level 0 has one slot per tick; each higher level covers a whole turn of
+    the level below and is cascaded down when that level wraps, so a running
+    timer costs nothing until its slot comes up. ``advance()`` moves the
+    wheel to the current clock time and expires due timers; ``fired`` lists
+    the timers expired by the last call. ``clock`` returns seconds.
+    """
+
+    def __init__(self, clock=time.monotonic, slot_bits=8, levels=4):
+        if slot_bits < 1 or levels < 1:
+            raise ValueError("slot_bits and levels must be >= 1.")
+        self.clock = clock
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels = [[set() for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self._counts = [0] * levels
+        self.now = self.time()
+        self.fired = []
+
+    def __len__(self):
+        return sum(self._counts)
+
+    def time(self):
+        """Current clock reading in whole milliseconds."""
+        return int(self.clock() * 1000)
+
+    def schedule(self, timer, delay):
+        """Expire ``timer`` (calling its ``_expire()``) ``delay`` ms from ``now``."""
+        if delay < 1:
+            raise ValueError("delay must be >= 1 ms.")
+        self.cancel(timer)
+        timer._deadline = self.now + int(delay)
+        self._insert(timer)
+
+    def cancel(self, timer):
+        slot = timer._slot
+        if slot is not None:
+            slot.discard(timer)
+            self._counts[timer._level] -= 1
+            timer._slot = None
+        timer._deadline = None
+
+    def _insert(self, timer):
+        bits = self._bits
+        top = len(self._levels) - 1
+        delta = timer._deadline - self.now
+        level = 0
+        while level < top and delta >> (bits * (level + 1)):
+            level += 1
+        if delta >> (bits * (level + 1)):
+            # Beyond the top level: park in the slot cascaded last, then re-insert.
+            index = ((self.now >> (bits * level)) - 1) & self._mask
+        else:
+            index = (timer._deadline >> (bits * level)) & self._mask
+        slot = self._levels[level][index]
+        slot.add(timer)
+        timer._slot = slot
+        timer._level = level
+        self._counts[level] += 1
+
+    def _cascade(self, tick):
+        bits, mask, counts = self._bits, self._mask, self._counts
+        for level in range(1, len(self._levels)):
+            shift = bits * level
+            if tick & ((1 << shift) - 1):
+                break
+            slot = self._levels[level][(tick >> shift) & mask]
+            if slot:
+                timers = list(slot)
+                slot.clear()
+                counts[level] -= len(timers)
+                for timer in timers:
+                    self._insert(timer)
+
+    def advance(self, now=None):
+        """
+        Move the wheel to ``now`` (default: the clock) and expire due timers.
+        Stretches without pending timers on the low levels are skipped, so
+        the cost follows expiring timers, not elapsed ticks. Returns ``fired``.
+        """
+        target = self.time() if now is None else int(now)
+        fired = self.fired = []
+        bits, mask, counts, wheel = self._bits, self._mask, self._counts, self._levels[0]
+        while self.now < target:
+            level = next((level for level, count in enumerate(counts) if count), None)
+            if level is None:
+                self.now = target
+                break
+            if level:
+                # Nothing due before the next boundary of the lowest occupied level.
+                tick = ((self.now >> (bits * level)) + 1) << (bits * level)
+                if tick > target:
+                    self.now = target
+                    break
+            else:
+                tick = self.now + 1
+            self.now = tick
+            if not tick & mask:
+                self._cascade(tick)
+            slot = wheel[tick & mask]
+            if slot:
+                timers = list(slot)
+                slot.clear()
+                counts[0] -= len(timers)
+                for timer in timers:
+                    if timer._deadline > tick:
+                        # Parked beyond the top level, which can be level 0.
+                        self._insert(timer)
+                        continue
+                    timer._slot = timer._deadline = None
+                    timer._expire()
+                    fired.append(timer)
+        return fired
+
+    def wrap(self, engine):
+        """Return a scan function that advances the wheel before ``engine``."""
+        advance = self.advance
+
+        def scan():
+            advance()
+            return engine()
+
+        return scan
+
+
+class WallClockTimer(FunctionBlock):
+    """
+    Base for timers with PT and ET in milliseconds of a TimerWheel clock.
+    A running timer registers its expiry in the wheel instead of counting
+    scans, and ET is computed from the wheel's time when read. ``wheel`` may
+    be left empty and attached by ``Ladder.enable_timer_wheel``.
+    """
+
+    __slots__ = ("PT", "wheel", "_previous_in", "_start", "_elapsed", "_deadline", "_slot", "_level")
+
+    def __init__(self, name, PT, wheel=None):
+        super().__init__(name)
+        if PT < 0:
+            raise ValueError("Timer preset must be >= 0.")
+        self.PT = int(PT)
+        self.wheel = wheel
+        self._previous_in = False
+        self._start = None
+        self._elapsed = 0
+        self._deadline = None
+        self._slot = None
+        self._level = 0
+
+    @property
+    def Q(self):
+        return self.state
+
+    @Q.setter
+    def Q(self, value):
+        self.state = bool(value)
+
+    @property
+    def ET(self):
+        if self._start is None:
+            return self._elapsed
+        return min(self.wheel.now - self._start, self.PT)
+
+    @property
+    def running(self):
+        """True while an expiry is registered in the wheel."""
+        return self._deadline is not None
+
+    def _begin(self, delay):
+        wheel = self.wheel
+        if wheel is None:
+            raise ValueError(f"Timer {self.name!r} is not attached to a TimerWheel.")
+        self._start = wheel.now
+        wheel.schedule(self, delay)
+
+    def _stop(self, elapsed):
+        if self._deadline is not None:
+            self.wheel.cancel(self)
+        self._start = None
+        self._elapsed = elapsed
+
+    def _expire(self):
+        raise NotImplementedError
+
+    def reset(self):
+        self._stop(0)
+        self.state = False
+        self._previous_in = False
+
+
+class WallClockOnDelayTimer(WallClockTimer):
+    """TON: Q becomes TRUE once IN has been TRUE for PT ms."""
+
+    __slots__ = ()
+
+    def evaluate(self, IN):
+        if IN:
+            if not self._previous_in:
+                if self.PT:
+                    self._begin(self.PT)
+                else:
+                    self.state = True
+        elif self._previous_in or self.state:
+            self._stop(0)
+            self.state = False
+        self._previous_in = bool(IN)
+        return self.state
+
+    def _expire(self):
+        self._start = None
+        self._elapsed = self.PT
+        self.state = True
+
+
+class WallClockOffDelayTimer(WallClockTimer):
+    """TOF: Q stays TRUE for PT ms after IN goes FALSE."""
+
+    __slots__ = ()
+
+    def evaluate(self, IN):
+        if IN:
+            if not self._previous_in:
+                self._stop(0)
+                self.state = True
+        elif self._previous_in:
+            if self.PT:
+                self._begin(self.PT)
+            else:
+                self.state = False
+        self._previous_in = bool(IN)
+        return self.state
+
+    def _expire(self):
+        self._start = None
+        self._elapsed = self.PT
+        self.state = False
+
+
+class WallClockPulseTimer(WallClockTimer):
+    """
+    TP: Q pulses TRUE for PT ms (at least one tick) on a rising edge of IN.
+    Like PulseTimer, every rising edge restarts the pulse with ET at 0.
+    """
+
+    __slots__ = ()
+
+    def evaluate(self, IN):
+        if IN and not self._previous_in:
+            self.state = True
+            self._begin(max(self.PT, 1))
+        self._previous_in = bool(IN)
+        return self.state
+
+    def _expire(self):
+        self._start = None
+        self._elapsed = self.PT
+        self.state = False
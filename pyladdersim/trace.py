@@ -0,0 +1,193 @@
+import json
+import mmap
+import struct
+from operator import attrgetter
+
+import numpy as np
+
+from pyladdersim.components import Counter, Timer
+from pyladdersim.timerwheel import WallClockTimer
+
+_MAGIC = b"PLSTRACE1\n"
+_BLOCK_HEADER = struct.Struct("<qq")  # first scan number, scans in block
+_LENGTH = struct.Struct("<I")
+
+
+def _trace_tags(ladder):
+    """Unique components of ``ladder`` and the tag names recorded for them."""
+    components = ladder.components()
+    bool_tags = [(component, "state") for component in components]
+    int_tags = [(component, "ET") for component in components if isinstance(component, (Timer, WallClockTimer))]
+    int_tags += [(component, "CV") for component in components if isinstance(component, Counter)]
+    return bool_tags, int_tags
+
+
+class TraceRecorder:
+    """
+    Record every scan's process image to a bit-packed columnar trace file.
+    The file is written in fixed-size blocks of ``block_scans`` scans. Inside a
+    block each boolean tag is one packed bit column and each integer tag (timer
+    ET, counter CV) one int64 column, so the file can be memory-mapped and read
+    one tag at a time. ``Ladder.advance`` scans every cycle while a recorder
+    is attached, so no scan is missing.
+    """
+
+    def __init__(self, ladder, path, block_scans=4096):
+        if block_scans <= 0 or block_scans % 8:
+            raise ValueError("block_scans must be a positive multiple of 8.")
+
+        self.ladder = ladder
+        self.path = path
+        self.block_scans = block_scans
+        bool_tags, int_tags = _trace_tags(ladder)
+        self._bool_components = [component for component, _ in bool_tags]
+        self._int_getters = [
+            (component, attrgetter(field)) for component, field in int_tags
+        ]
+        self._rows = []
+        self._ints = []
+        self._scans = []
+        self._get_state = attrgetter("state")
+
+        header = json.dumps(
+            {
+                "block_scans": block_scans,
+                "bool_tags": [f"{component.name}.{field}" for component, field in bool_tags],
+                "int_tags": [f"{component.name}.{field}" for component, field in int_tags],
+            }
+        ).encode("utf-8")
+        self._file = open(path, "wb")
+        self._file.write(_MAGIC + _LENGTH.pack(len(header)) + header)
+        ladder.add_scan_hook(self._record)
+
+    def _record(self, output):
+        self._scans.append(self.ladder.scan_count)
+        self._rows.append(list(map(self._get_state, self._bool_components)))
+        if self._int_getters:
+            self._ints.append([getter(component) for component, getter in self._int_getters])
+        if len(self._scans) == self.block_scans:
+            self._flush_block()
+
+    def _flush_block(self):
+        count = len(self._scans)
+        if not count:
+            return
+
+        scans = np.zeros(self.block_scans, dtype="<i8")
+        scans[:count] = self._scans
+        bools = np.zeros((self.block_scans, len(self._bool_components)), dtype=bool)
+        bools[:count] = self._rows
+        ints = np.zeros((self.block_scans, len(self._int_getters)), dtype="<i8")
+        if self._int_getters:
+            ints[:count] = self._ints
+
+        self._file.write(_BLOCK_HEADER.pack(self._scans[0], count))
+        self._file.write(scans.tobytes())
+        self._file.write(np.packbits(bools.T, axis=1).tobytes())
+        self._file.write(np.ascontiguousarray(ints.T).tobytes())
+        self._rows.clear()
+        self._ints.clear()
+        self._scans.clear()
+
+    def close(self):
+        """Flush buffered scans, detach from the ladder and close the file."""
+        if self._file.closed:
+            return
+        self.ladder.remove_scan_hook(self._record)
+        self._flush_block()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TraceReader:
+    """Memory-mapped reader for files written by :class:`TraceRecorder`."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(_MAGIC)] != _MAGIC:
+            self.close()
+            raise ValueError(f"{path!r} is not a pyladdersim trace file.")
+
+        (length,) = _LENGTH.unpack_from(self._map, len(_MAGIC))
+        start = len(_MAGIC) + _LENGTH.size
+        header = json.loads(self._map[start:start + length].decode("utf-8"))
+        self.block_scans = header["block_scans"]
+        self.bool_tags = header["bool_tags"]
+        self.int_tags = header["int_tags"]
+
+        self._data_start = start + length
+        self._bits_bytes = self.block_scans // 8
+        self._block_size = (
+            _BLOCK_HEADER.size
+            + self.block_scans * 8
+            + len(self.bool_tags) * self._bits_bytes
+            + len(self.int_tags) * self.block_scans * 8
+        )
+        self.blocks = (len(self._map) - self._data_start) // self._block_size
+
+    @property
+    def tags(self):
+        return self.bool_tags + self.int_tags
+
+    def _block(self, index):
+        offset = self._data_start + index * self._block_size
+        _, count = _BLOCK_HEADER.unpack_from(self._map, offset)
+        return offset + _BLOCK_HEADER.size, count
+
+    def _column(self, tag):
+        for kind, tags in (("bool", self.bool_tags), ("int", self.int_tags)):
+            if tag in tags:
+                if tags.count(tag) > 1:
+                    raise ValueError(f"Tag name {tag!r} is ambiguous.")
+                return kind, tags.index(tag)
+        raise KeyError(f"No tag named {tag!r}.")
+
+    def scans(self):
+        """Yield the scan number of every recorded scan."""
+        for block in range(self.blocks):
+            offset, count = self._block(block)
+            yield from np.frombuffer(self._map, "<i8", count, offset).tolist()
+
+    def bool_rows(self):
+        """Yield a tuple of every boolean tag's value for each recorded scan."""
+        bools_start = self.block_scans * 8
+        size = len(self.bool_tags) * self._bits_bytes
+        for block in range(self.blocks):
+            offset, count = self._block(block)
+            start = offset + bools_start
+            packed = np.frombuffer(self._map[start:start + size], np.uint8)
+            packed = packed.reshape(len(self.bool_tags), self._bits_bytes)
+            bits = np.unpackbits(packed, axis=1, count=count).astype(bool)
+            yield from map(tuple, bits.T.tolist())
+
+    def history(self, tag):
+        """Yield ``tag``'s value for every recorded scan, one block at a time."""
+        kind, column = self._column(tag)
+        bools_start = self.block_scans * 8
+        ints_start = bools_start + len(self.bool_tags) * self._bits_bytes
+        for block in range(self.blocks):
+            offset, count = self._block(block)
+            if kind == "bool":
+                start = offset + bools_start + column * self._bits_bytes
+                # Copy the block's bytes so no buffer export pins the mmap.
+                bits = np.frombuffer(self._map[start:start + self._bits_bytes], np.uint8)
+                yield from np.unpackbits(bits, count=count).astype(bool).tolist()
+            else:
+                start = offset + ints_start + column * self.block_scans * 8
+                yield from np.frombuffer(self._map, "<i8", count, start).tolist()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
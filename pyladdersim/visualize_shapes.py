@@ -1,33 +1,159 @@
+from pyladdersim.components import Contact, InvertedContact, Output, OnDelayTimer, OffDelayTimer, PulseTimer
+
+# Define colors for ON/OFF states
+ON_COLOR = "#00FF00"  # Bright green
+OFF_COLOR = "#FF0000"  # Bright red
+
+
 class LadderShapes:
+    """Draw ladder symbols on a canvas; each method returns the created item ids."""
+
     def __init__(self, canvas):
         self.canvas = canvas
 
     def draw_contact(self, x, y, color="black"):
         # Contact shape as before
-        self.canvas.create_line(x - 10, y, x + 10, y, width=2, fill=color)
-        self.canvas.create_line(x - 10, y - 10, x - 10, y + 10, width=2, fill=color)
-        self.canvas.create_line(x + 10, y - 10, x + 10, y + 10, width=2, fill=color)
+        return [
+            self.canvas.create_line(x - 10, y, x + 10, y, width=2, fill=color),
+            self.canvas.create_line(x - 10, y - 10, x - 10, y + 10, width=2, fill=color),
+            self.canvas.create_line(x + 10, y - 10, x + 10, y + 10, width=2, fill=color),
+        ]
 
     def draw_inverted_contact(self, x, y, color="black"):
         # Inverted contact with a slash
-        self.draw_contact(x, y, color)
-        self.canvas.create_line(x - 8, y - 8, x + 8, y + 8, width=2, fill=color)
+        items = self.draw_contact(x, y, color)
+        items.append(self.canvas.create_line(x - 8, y - 8, x + 8, y + 8, width=2, fill=color))
+        return items
 
     def draw_coil(self, x, y, color="black"):
         # Coil as before
-        self.canvas.create_oval(x - 10, y - 10, x + 10, y + 10, width=2, fill=color)
+        return [self.canvas.create_oval(x - 10, y - 10, x + 10, y + 10, width=2, fill=color)]
 
     def draw_timer(self, x, y, timer_type="TON", color="black"):
         """Draw a timer with labeled I/O points based on IEC 61131-3 standards."""
-        # Rectangle for timer
-        self.canvas.create_rectangle(x - 30, y - 10, x + 30, y + 30, width=2, fill=color)
-        # Label for timer type (TON, TOF, TP)
-        self.canvas.create_text(x, y - 20, text=timer_type, fill=color)
-
-        # Input labels on the left
-        self.canvas.create_text(x - 35, y - 10, text="IN", anchor="e", fill=color)
-        self.canvas.create_text(x - 35, y + 10, text="PT", anchor="e", fill=color)
-
-        # Output labels on the right
-        self.canvas.create_text(x + 35, y - 10, text="Q", anchor="w", fill=color)
-        self.canvas.create_text(x + 35, y + 10, text="ET", anchor="w", fill=color)
+        return [
+            # Rectangle for timer
+            self.canvas.create_rectangle(x - 30, y - 10, x + 30, y + 30, width=2, fill=color),
+            # Label for timer type (TON, TOF, TP)
+            self.canvas.create_text(x, y - 20, text=timer_type, fill=color),
+            # Input labels on the left
+            self.canvas.create_text(x - 35, y - 10, text="IN", anchor="e", fill=color),
+            self.canvas.create_text(x - 35, y + 10, text="PT", anchor="e", fill=color),
+            # Output labels on the right
+            self.canvas.create_text(x + 35, y - 10, text="Q", anchor="w", fill=color),
+            self.canvas.create_text(x + 35, y + 10, text="ET", anchor="w", fill=color),
+        ]
+
+
+class LadderCanvas:
+    """
+    Draws a ladder on a canvas once and then only recolors changed items.
+    Component states are read as they are, or taken from a snapshot whose
+    states align with ``components``; nothing is evaluated here.
+    """
+
+    def __init__(self, canvas, ladder, on_toggle=None):
+        self.canvas = canvas
+        self.ladder = ladder
+        self.on_toggle = on_toggle
+        self.shapes = LadderShapes(canvas)
+        self.contact_buttons = {}
+        self.components = []
+        self._index = {}
+        self._elements = []  # [component index, item ids, last drawn state]
+        self._layout = None
+
+    def _layout_key(self):
+        return tuple(tuple(id(component) for component in rung.components) for rung in self.ladder.rungs)
+
+    def build(self):
+        """Create every canvas item for the current ladder layout."""
+        self.canvas.delete("all")
+        self.contact_buttons.clear()
+        self._elements = []
+        self._layout = self._layout_key()
+        self.components = self.ladder.components()
+        self._index = {id(component): index for index, component in enumerate(self.components)}
+
+        # Draw the power rails
+        self.canvas.create_line(50, 20, 50, 380, fill="black", width=3)
+        self.canvas.create_line(550, 20, 550, 380, fill="black", width=3)
+
+        for idx, rung in enumerate(self.ladder.rungs):
+            y_position = 50 + idx * 70  # Vertical position for each rung
+            output = rung.output
+
+            # Horizontal rung line follows the output from the last scan
+            line = self.canvas.create_line(50, y_position, 550, y_position, fill=OFF_COLOR, width=2)
+            self._track(output, [line])
+
+            # Position components along the rung
+            x_position = 100
+            for component in rung.components:
+                if component is output:
+                    continue
+                items = self._draw_component(component, x_position, y_position)
+                if items:
+                    self._track(component, items)
+
+                if isinstance(component, (Contact, InvertedContact)):
+                    # Transparent rectangle with a click event directly on the canvas
+                    rect = self.canvas.create_rectangle(x_position - 15, y_position - 10, x_position + 15, y_position + 10,
+                                                        outline='', fill='')  # No fill or outline for full transparency
+                    self.canvas.tag_bind(rect, "<Button-1>", lambda event, comp=component: self._toggle(comp))
+                    self.contact_buttons[component] = rect
+                x_position += 100  # Move x position for the next component
+
+            # Align the output component to the right side
+            if isinstance(output, Output):
+                items = self.shapes.draw_coil(500, y_position, color=OFF_COLOR)
+                items.append(self.canvas.create_text(500, y_position - 20, text=output.name, fill=OFF_COLOR))
+                self._track(output, items)
+
+    def _draw_component(self, component, x, y):
+        if isinstance(component, OnDelayTimer):
+            return self.shapes.draw_timer(x, y, timer_type="TON", color=OFF_COLOR)
+        if isinstance(component, OffDelayTimer):
+            return self.shapes.draw_timer(x, y, timer_type="TOF", color=OFF_COLOR)
+        if isinstance(component, PulseTimer):
+            return self.shapes.draw_timer(x, y, timer_type="TP", color=OFF_COLOR)
+        if isinstance(component, Contact):
+            items = self.shapes.draw_contact(x, y, color=OFF_COLOR)
+        elif isinstance(component, InvertedContact):
+            items = self.shapes.draw_inverted_contact(x, y, color=OFF_COLOR)
+        else:
+            return []
+        items.append(self.canvas.create_text(x, y - 20, text=component.name, fill=OFF_COLOR))
+        return items
+
+    def _track(self, component, items):
+        # Items start drawn as OFF.
+        self._elements.append([self._index[id(component)], items, False])
+
+    def _toggle(self, contact):
+        if self.on_toggle is not None:
+            self.on_toggle(contact)
+
+    def refresh(self, states=None):
+        """
+        Recolor items whose state changed; rebuild if the layout changed.
+        ``states`` defaults to the live component states.
+        """
+        if self._layout != self._layout_key():
+            self.build()
+        if states is None:
+            states = [component.state for component in self.components]
+        elif len(states) != len(self.components):
+            return 0
+
+        itemconfig = self.canvas.itemconfig
+        updated = 0
+        for element in self._elements:
+            state = bool(states[element[0]])
+            if state != element[2]:
+                color = ON_COLOR if state else OFF_COLOR
+                for item in element[1]:
+                    itemconfig(item, fill=color)
+                element[2] = state
+                updated += 1
+        return updated
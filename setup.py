@@ -6,6 +6,7 @@ setup(
     packages=find_packages(exclude=["tests", "tests.*"]),
     install_requires=[
         'matplotlib',
+        'numpy',
     ],
     license='MIT',
     classifiers=[
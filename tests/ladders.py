@@ -0,0 +1,45 @@
+from pyladdersim.components import (
+    Contact,
+    CounterDown,
+    CounterUp,
+    FallingEdgeContact,
+    InvertedContact,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    PulseTimer,
+    RetentiveOutput,
+    RisingEdgeContact,
+)
+from pyladdersim.ladder import Ladder, Rung
+
+MIXED_INPUTS = ("Start", "Stop", "ONS", "FNS")
+
+
+def build_mixed_ladder():
+    """
+    Four rungs covering every contact, timer and counter kind, shared by the
+    engine equivalence tests. Returns the ladder and its input contacts.
+    """
+    start = Contact("Start")
+    stop = InvertedContact("Stop")
+    ons = RisingEdgeContact("ONS")
+    fns = FallingEdgeContact("FNS")
+
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, stop, OnDelayTimer("TON", PT=2), Output("A")]))
+    ladder.add_rung(Rung([start, ons, CounterUp("CTU", preset=2), Output("B")]))
+    ladder.add_rung(Rung([fns, OffDelayTimer("TOF", PT=2), RetentiveOutput("C")]))
+    ladder.add_rung(Rung([stop, PulseTimer("TP", PT=3), CounterDown("CTD", preset=2), Output("D")]))
+    return ladder, [start, stop, ons, fns]
+
+
+def snapshot(ladder):
+    """State plus timer, counter and edge fields of every rung component."""
+    values = []
+    for rung in ladder.rungs:
+        for component in rung.components:
+            values.append((component.name, component.state))
+            for field in ("ET", "CV", "_previous_state", "_previous_in"):
+                values.append(getattr(component, field, None))
+    return values
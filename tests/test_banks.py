@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyladdersim.banks import CounterArray, TimerArray
+from pyladdersim.components import (
+    Contact,
+    CounterDown,
+    CounterUp,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    PulseTimer,
+    component_type,
+)
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.tags import TagTable
+
+SIZE = 12
+
+
+def fields(component):
+    if not hasattr(component, "_previous_in"):
+        return (component.name, component.state)
+    names = ("Q", "ET", "PT") if hasattr(component, "PT") else ("Q", "CV", "PV")
+    return tuple(getattr(component, name) for name in names) + (bool(component._previous_in),)
+
+
+def random_inputs(rng, scans, probability=0.6):
+    return [[rng.random() < probability for _ in range(SIZE)] for _ in range(scans)]
+
+
+@pytest.mark.parametrize("kind", [OnDelayTimer, OffDelayTimer, PulseTimer])
+def test_timer_array_matches_scalar_timers(kind):
+    rng = random.Random(kind.__name__)
+    presets = [rng.randint(0, 4) for _ in range(SIZE)]
+    bank = TimerArray("T", SIZE, PT=presets, kind=kind)
+    scalars = [kind(f"T{index}", PT=preset) for index, preset in enumerate(presets)]
+
+    for vector in random_inputs(rng, 200):
+        q = bank.evaluate(vector)
+        expected = [timer.evaluate(IN=value) for timer, value in zip(scalars, vector)]
+        assert q.tolist() == expected
+        assert [fields(view) for view in bank] == [fields(timer) for timer in scalars]
+
+
+@pytest.mark.parametrize("kind", [CounterUp, CounterDown])
+def test_counter_array_matches_scalar_counters(kind):
+    rng = random.Random(kind.__name__)
+    bank = CounterArray("C", SIZE, preset=3, kind=kind)
+    scalars = [kind(f"C{index}", preset=3) for index in range(SIZE)]
+
+    for scan, vector in enumerate(random_inputs(rng, 200, probability=0.5)):
+        resets = [rng.random() < 0.05 for _ in range(SIZE)]
+        preset = 5 if scan == 100 else None
+        if kind is CounterUp:
+            q = bank.evaluate(vector, R=resets, PV=preset)
+            expected = [c.evaluate(IN=v, R=r, PV=preset) for c, v, r in zip(scalars, vector, resets)]
+        else:
+            q = bank.evaluate(vector, LD=resets, PV=preset)
+            expected = [c.evaluate(IN=v, LD=r, PV=preset) for c, v, r in zip(scalars, vector, resets)]
+        assert q.tolist() == expected
+        assert [fields(view) for view in bank] == [fields(counter) for counter in scalars]
+
+
+def test_element_views_run_inside_rungs():
+    rng = random.Random(3)
+    timers = TimerArray("T", SIZE, PT=2)
+    counters = CounterArray("C", SIZE, preset=2)
+    ladder, reference = Ladder(), Ladder()
+    inputs, reference_inputs = [], []
+    for index in range(SIZE):
+        for target, blocks, contacts in (
+            (ladder, (timers[index], counters[index]), inputs),
+            (reference, (OnDelayTimer(f"T{index}", PT=2), CounterUp(f"C{index}", preset=2)), reference_inputs),
+        ):
+            contact = Contact(f"S{index}")
+            contacts.append(contact)
+            target.add_rung(Rung([contact, *blocks, Output(f"Y{index}")]))
+
+    assert timers[-1] is timers[SIZE - 1]
+    assert component_type(timers[0]) is OnDelayTimer and isinstance(counters[0], CounterUp)
+    for vector in random_inputs(rng, 60, probability=0.8):
+        for contact, other, value in zip(inputs, reference_inputs, vector):
+            contact.state = other.state = value
+        assert ladder.scan_once() == reference.scan_once()
+        assert [fields(c) for c in ladder.components()] == [fields(c) for c in reference.components()]
+    assert timers.ET.tolist() == [timer.ET for timer in timers]
+
+    timers[0].PT = 9
+    assert timers.PT[0] == 9
+    with pytest.raises(ValueError):
+        TagTable([timers[0]])
+
+
+def test_rejects_bad_banks():
+    with pytest.raises(ValueError):
+        TimerArray("T", 4, PT=-1)
+    with pytest.raises(ValueError):
+        TimerArray("T", 4, PT=1, kind=CounterUp)
+    with pytest.raises(ValueError):
+        CounterArray("C", 0, preset=1)
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyladdersim.batch import BatchLadder
+from pyladdersim.components import Contact, Output, Timer
+from pyladdersim.ladder import Ladder, Rung
+from tests.ladders import MIXED_INPUTS, build_mixed_ladder
+
+
+def components_by_name(ladder):
+    return {c.name: c for rung in ladder.rungs for c in rung.components}
+
+
+def test_batch_step_matches_per_instance_scans():
+    instances = 12
+    batch = BatchLadder(build_mixed_ladder()[0], instances)
+    ladders = [build_mixed_ladder()[0] for _ in range(instances)]
+    rng = random.Random(3)
+
+    for _ in range(150):
+        vector = {name: np.array([rng.random() < 0.5 for _ in range(instances)]) for name in MIXED_INPUTS}
+        expected = []
+        for i, ladder in enumerate(ladders):
+            components = components_by_name(ladder)
+            for name in MIXED_INPUTS:
+                components[name].activate() if vector[name][i] else components[name].deactivate()
+            expected.append(ladder.scan_once())
+
+        assert batch.step(vector).tolist() == expected
+
+        for name in ("A", "B", "C", "D", "TON", "TOF", "TP", "CTU", "CTD"):
+            states = [components_by_name(ladder)[name].state for ladder in ladders]
+            assert batch.get(name).tolist() == states
+        for name, field in (("TON", "ET"), ("TOF", "ET"), ("TP", "ET"), ("CTU", "CV"), ("CTD", "CV")):
+            values = [getattr(components_by_name(ladder)[name], field) for ladder in ladders]
+            assert batch.get(name, field).tolist() == values
+
+
+def test_batch_inputs_broadcast_scalars_and_follow_contact_polarity():
+    batch = BatchLadder(build_mixed_ladder()[0], 4)
+    batch.set_input("Start", True)
+    batch.set_input("Stop", True)
+
+    assert batch.get("Start").tolist() == [True] * 4
+    assert batch.get("Stop").tolist() == [False] * 4
+
+
+def test_batch_rejects_unsupported_components():
+    class CustomTimer(Timer):
+        def evaluate(self, IN):
+            return IN
+
+    ladder = Ladder()
+    ladder.add_rung(Rung([CustomTimer("X", PT=1), Output("Y")]))
+
+    with pytest.raises(TypeError, match="CustomTimer"):
+        BatchLadder(ladder, 2)
+
+
+def test_batch_rejects_ambiguous_names():
+    ladder = Ladder()
+    ladder.add_rung(Rung([Contact("Dup"), Output("A")]))
+    ladder.add_rung(Rung([Contact("Dup"), Output("B")]))
+    batch = BatchLadder(ladder, 2)
+
+    with pytest.raises(ValueError, match="ambiguous"):
+        batch.set_input("Dup", True)
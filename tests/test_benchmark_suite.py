@@ -0,0 +1,75 @@
+import argparse
+import json
+
+import pytest
+
+from benchmarks import suite
+
+
+def results(scans_per_second, p50, build):
+    return {
+        "cases": {
+            "small": {
+                "build_seconds": build,
+                "peak_memory_bytes": None,
+                "engines": {"compiled": {"scans_per_second": scans_per_second, "latency_p50_ms": p50}},
+            }
+        }
+    }
+
+
+def test_flatten_keys_tracked_metrics():
+    assert suite.flatten(results(1000.0, 1.0, 0.5)) == {
+        "small/build_seconds": 0.5,
+        "small/compiled/scans_per_second": 1000.0,
+        "small/compiled/latency_p50_ms": 1.0,
+    }
+
+
+def test_compare_signs_changes_so_positive_is_worse():
+    rows, regressions = suite.compare(results(1000.0, 1.0, 0.5), results(500.0, 0.5, 0.5), 0.10)
+    changes = {key: change for key, _, _, change, _ in rows}
+    assert changes["small/compiled/scans_per_second"] == pytest.approx(0.5)
+    assert changes["small/compiled/latency_p50_ms"] == pytest.approx(-0.5)
+    assert changes["small/build_seconds"] == 0
+    assert [row[0] for row in regressions] == ["small/compiled/scans_per_second"]
+
+
+def test_changes_below_the_noise_floor_do_not_regress():
+    # 1 µs -> 1.5 µs per scan is +50% but well inside timer jitter.
+    baseline, current = results(1e6, 0.001, 0.001), results(2e6 / 3, 0.0015, 0.002)
+    rows, regressions = suite.compare(baseline, current, 0.10)
+    assert all(change > 0.10 for _, _, _, change, _ in rows)
+    assert regressions == []
+    assert len(suite.compare(baseline, current, 0.10, floors={})[1]) == 3
+
+
+def test_best_follows_metric_direction():
+    runs = [
+        {"scans_per_second": 10.0, "latency_p50_ms": 2.0, "latency_max_ms": 9.0},
+        {"scans_per_second": 30.0, "latency_p50_ms": 3.0, "latency_max_ms": 4.0},
+    ]
+    assert suite.best(runs) == {"scans_per_second": 30.0, "latency_p50_ms": 2.0, "latency_max_ms": 4.0}
+
+
+def test_compare_exit_status(tmp_path, capsys):
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    baseline.write_text(json.dumps(results(1000.0, 1.0, 0.5)))
+    current.write_text(json.dumps(results(950.0, 1.0, 0.5)))
+    suite.main(["compare", str(baseline), str(current)])
+    assert "no regressions" in capsys.readouterr().out
+
+    current.write_text(json.dumps(results(500.0, 1.0, 0.5)))
+    with pytest.raises(SystemExit) as exit:
+        suite.main(["compare", str(baseline), str(current)])
+    assert exit.value.code == 1
+
+
+@pytest.mark.parametrize("text", ["contact", "contact=x", "contact=-1", "contact=nan", "timer=inf", "valve=1", "contact=0"])
+def test_parse_mix_rejects_bad_weights(text):
+    with pytest.raises(argparse.ArgumentTypeError):
+        suite.parse_mix(text)
+
+
+def test_parse_mix_reads_weights():
+    assert suite.parse_mix("contact=3,timer=1") == {"contact": 3.0, "timer": 1.0}
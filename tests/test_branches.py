@@ -0,0 +1,92 @@
+import itertools
+import pickle
+
+import pytest
+
+from pyladdersim.branches import Parallel, Series, SharedNetwork
+from pyladdersim.components import Contact, FunctionBlock, InvertedContact, OnDelayTimer, Output, RisingEdgeContact
+from pyladdersim.ladder import Ladder, Rung
+
+
+class CountingBlock(FunctionBlock):
+    __slots__ = ("calls",)
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.calls = 0
+
+    def evaluate(self, IN):
+        self.calls += 1
+        self.state = bool(IN)
+        return self.state
+
+
+def test_parallel_and_series_power_flow():
+    a, b, c = Contact("A"), Contact("B"), InvertedContact("C")
+    rung = Rung([Parallel(a, Series(b, c)), Output("Y")])
+
+    for values in itertools.product([False, True], repeat=3):
+        for contact, value in zip((a, b, c), values):
+            contact.activate() if value else contact.deactivate()
+        assert rung.evaluate() is (values[0] or (values[1] and not values[2]))
+
+    with pytest.raises(ValueError):
+        Parallel(a, Output("Z"))
+
+
+def test_identical_networks_are_computed_once_per_scan():
+    start, stop, jog = Contact("Start"), InvertedContact("Stop"), Contact("Jog")
+    block = CountingBlock("Count")
+    timer = OnDelayTimer("TON", PT=3)
+    ladder = Ladder()
+    for name in ("M1", "M2", "M3"):
+        # Each rung builds its own copy of the same network.
+        ladder.add_rung(Rung([Parallel(Series(start, stop), jog), Series(block, timer), Output(name)]))
+
+    rungs = ladder.rungs
+    assert isinstance(rungs[1].components[0], SharedNetwork)
+    assert rungs[1].components[0].network is rungs[0].components[0]
+    assert isinstance(rungs[2].components[1], SharedNetwork)
+
+    start.activate()
+    for scan in range(1, 5):
+        ladder.scan_once()
+        assert block.calls == scan
+        assert timer.ET == scan
+    assert [rung.output.state for rung in rungs] == [True, True, True]
+
+    stop.activate()
+    ladder.scan_once()
+    assert [rung.output.state for rung in rungs] == [False, False, False]
+    assert ladder.components()[:3] == [start, stop, jog]
+
+
+def build_ladder():
+    a, b, c, edge = Contact("A"), Contact("B"), Contact("C"), RisingEdgeContact("E")
+    ladder = Ladder()
+    ladder.add_rung(Rung([Parallel(a, Series(b, c)), OnDelayTimer("T1", PT=2), Output("Y1")]))
+    ladder.add_rung(Rung([Parallel(Series(b, c), edge), Output("Y2")]))
+    ladder.add_rung(Rung([InvertedContact("D"), Parallel(a, Series(b, c)), Output("Y3")]))
+    return ladder
+
+
+@pytest.mark.parametrize("engine", ["compile", "enable_incremental", "enable_parallel"])
+def test_engines_match_the_interpreter_on_branches(engine):
+    reference, candidate = build_ladder(), build_ladder()
+    getattr(candidate, engine)()
+    try:
+        for scan in range(40):
+            vector = {"A": scan % 5 == 0, "B": scan % 3 != 0, "C": scan % 4 < 2, "E": scan % 6 < 3}
+            for ladder in (reference, candidate):
+                ladder.run_stimulus([vector]).run()
+            expected = [component.state for component in reference.components()]
+            assert [component.state for component in candidate.components()] == expected
+    finally:
+        candidate.disable_parallel()
+
+
+def test_pickled_ladders_keep_sharing_networks():
+    ladder = pickle.loads(pickle.dumps(build_ladder()))
+    ladder.add_rung(Rung([Series(*ladder.rungs[0].components[0].elements[1].elements), Output("Y4")]))
+
+    assert isinstance(ladder.rungs[3].components[0], SharedNetwork)
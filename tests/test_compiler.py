@@ -0,0 +1,78 @@
+import random
+
+from pyladdersim.compiler import compare_engines, compile_ladder
+from pyladdersim.components import Contact, Output, RisingEdgeContact
+from pyladdersim.ladder import Ladder, Rung
+from tests.ladders import build_mixed_ladder, snapshot
+
+
+def test_compiled_scan_matches_interpreted_scan():
+    interpreted, interpreted_inputs = build_mixed_ladder()
+    compiled, compiled_inputs = build_mixed_ladder()
+    compiled.compile()
+    rng = random.Random(7)
+
+    for _ in range(200):
+        for index in range(len(interpreted_inputs)):
+            if rng.random() < 0.3:
+                active = rng.random() < 0.5
+                for contact in (interpreted_inputs[index], compiled_inputs[index]):
+                    contact.activate() if active else contact.deactivate()
+
+        assert compiled.scan_once() is interpreted.scan_once()
+        assert snapshot(compiled) == snapshot(interpreted)
+
+
+def test_compiled_scan_drives_edge_contact_when_upstream_is_false():
+    upstream = Contact("Upstream")
+    one_shot = RisingEdgeContact("ONS")
+    lamp = Output("Lamp")
+    program = compile_ladder([Rung([upstream, one_shot, lamp])])
+
+    one_shot.activate()
+    assert program.scan_once() is False
+    upstream.activate()
+    assert program.scan_once() is False
+    assert one_shot._previous_state is True
+
+
+def test_scan_evaluates_rungs_after_a_false_rung():
+    first = Output("First")
+    second = Output("Second")
+    start = Contact("Start")
+    ladder = Ladder()
+    ladder.add_rung(Rung([Contact("Off"), first]))
+    ladder.add_rung(Rung([start, second]))
+    start.activate()
+
+    assert ladder.scan_once() is False
+    assert second.state is True
+
+    ladder.compile()
+    second.state = False
+    assert ladder.scan_once() is False
+    assert second.state is True
+
+
+def test_add_rung_falls_back_to_interpreted_engine():
+    start = Contact("Start")
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, Output("A")]))
+    ladder.compile()
+
+    lamp = Output("B")
+    ladder.add_rung(Rung([start, lamp]))
+    start.activate()
+
+    assert ladder.compiled is None
+    assert ladder.scan_once() is True
+    assert lamp.state is True
+
+
+def test_compare_engines_reports_both_rates():
+    ladder, _ = build_mixed_ladder()
+    report = compare_engines(ladder, scans=50)
+
+    assert report["interpreted"] > 0
+    assert report["compiled"] > 0
+    assert report["speedup"] > 0
@@ -27,3 +27,20 @@ def test_output_tracks_input():
     output = Output("Lamp")
     assert output.evaluate(True) is True
     assert output.evaluate(False) is False
+
+
+def test_components_use_slots_instead_of_instance_dicts():
+    from pyladdersim.components import CounterUp, OnDelayTimer, RisingEdgeContact
+
+    for component in (
+        Contact("Start"),
+        RisingEdgeContact("ONS"),
+        OnDelayTimer("TON", PT=1),
+        CounterUp("CTU", preset=1),
+        Output("Lamp"),
+    ):
+        assert not hasattr(component, "__dict__")
+
+    timer = OnDelayTimer("TON", PT=1)
+    timer.state = True
+    assert timer.Q is True
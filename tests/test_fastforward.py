@@ -0,0 +1,90 @@
+import pytest
+
+from pyladdersim.components import (
+    Contact,
+    CounterUp,
+    InvertedContact,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    PulseTimer,
+    RisingEdgeContact,
+)
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.trace import TraceReader, TraceRecorder
+
+
+def build_ladder():
+    start = Contact("Start")
+    stop = InvertedContact("Stop")
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, stop, OnDelayTimer("TON", PT=36_000), Output("A")]))
+    ladder.add_rung(Rung([start, OffDelayTimer("TOF", PT=500), Output("B")]))
+    ladder.add_rung(Rung([start, PulseTimer("TP", PT=1_200), Output("C")]))
+    ladder.add_rung(Rung([RisingEdgeContact("ONS"), CounterUp("CTU", preset=2), Output("D")]))
+    return ladder, start
+
+
+def snapshot(ladder):
+    values = []
+    for rung in ladder.rungs:
+        for component in rung.components:
+            values.append(component.state)
+            for field in ("ET", "CV", "_previous_state", "_previous_in"):
+                values.append(getattr(component, field, None))
+    return values
+
+
+@pytest.mark.parametrize("phases", [(40_000,), (10, 35_990, 1), (36_001, 700)])
+def test_advance_matches_scan_by_scan(phases):
+    stepped, stepped_start = build_ladder()
+    jumped, jumped_start = build_ladder()
+
+    for number, scans in enumerate(phases):
+        active = number % 2 == 0
+        for contact in (stepped_start, jumped_start):
+            contact.activate() if active else contact.deactivate()
+
+        expected = None
+        for _ in range(scans):
+            expected = stepped.scan_once()
+        assert jumped.advance(scans) is expected
+        assert snapshot(jumped) == snapshot(stepped)
+        assert jumped.scan_count == stepped.scan_count
+
+
+def test_advance_skips_idle_scans():
+    ladder, start = build_ladder()
+    calls = []
+    scan = ladder._scan
+    ladder._scan = lambda: calls.append(1) or scan()
+    start.activate()
+
+    ladder.advance(36_000)
+
+    assert ladder.rungs[0].components[2].Q is True
+    assert len(calls) < 20
+
+
+def test_run_until_targets_absolute_scan():
+    ladder, start = build_ladder()
+    start.activate()
+    ladder.advance(5)
+
+    ladder.run_until(36_000)
+    assert ladder.scan_count == 36_000
+    assert ladder.rungs[0].output.state is True
+
+    with pytest.raises(ValueError, match="scan"):
+        ladder.run_until(10)
+
+
+def test_advance_scans_every_cycle_while_a_trace_is_recorded(tmp_path):
+    ladder, start = build_ladder()
+    start.activate()
+    with TraceRecorder(ladder, tmp_path / "run.trace", block_scans=64):
+        ladder.advance(200)
+
+    with TraceReader(tmp_path / "run.trace") as reader:
+        assert list(reader.scans()) == list(range(1, 201))
+    assert ladder.scan_count == 200
@@ -0,0 +1,86 @@
+import pytest
+
+from pyladdersim.components import Contact, InvertedContact, OnDelayTimer, Output
+from pyladdersim.headless import HeadlessRenderer, save_timing_diagram
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.visualize_shapes import OFF_COLOR, ON_COLOR
+
+
+def build_ladder():
+    start = Contact("Start")
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, OnDelayTimer("TON", PT=2), Output("Done")]))
+    ladder.add_rung(Rung([InvertedContact("Stop"), Output("Run")]))
+    return ladder, start
+
+
+def test_svg_frames_only_restyle_changed_items():
+    ladder, start = build_ladder()
+    renderer = HeadlessRenderer(ladder)
+    initial = tuple(component.state for component in renderer.components)
+
+    first = renderer.render_svg()
+    assert first.startswith("<svg") and ">TON</text>" in first and ">Stop</text>" in first
+
+    start.activate()
+    ladder.scan_once()
+    assert renderer.render_svg().count(ON_COLOR) > first.count(ON_COLOR)
+    # Nothing changed since the last frame, so no item needs regenerating.
+    assert not renderer.canvas.changed
+
+    assert renderer.render_svg(initial) == first
+
+
+def test_render_frames_writes_one_file_per_frame(tmp_path):
+    ladder, _ = build_ladder()
+    renderer = HeadlessRenderer(ladder)
+    on = tuple(True for _ in renderer.components)
+    off = tuple(False for _ in renderer.components)
+
+    written = renderer.render_frames([off, on, off], tmp_path / "frames")
+
+    files = sorted(path.name for path in (tmp_path / "frames").iterdir())
+    assert written == 3
+    assert files == ["frame_000000.svg", "frame_000001.svg", "frame_000002.svg"]
+    assert OFF_COLOR not in (tmp_path / "frames" / files[1]).read_text()
+    assert ON_COLOR not in (tmp_path / "frames" / files[2]).read_text()
+    with pytest.raises(ValueError):
+        renderer.render_frames([off], tmp_path, fmt="gif")
+
+
+def test_frames_replayed_from_a_trace(tmp_path):
+    pytest.importorskip("numpy")
+    from pyladdersim.trace import TraceReader, TraceRecorder
+
+    ladder, start = build_ladder()
+    start.activate()
+    with TraceRecorder(ladder, tmp_path / "run.trace", block_scans=8):
+        for _ in range(10):
+            ladder.scan_once()
+
+    renderer = HeadlessRenderer(ladder)
+    with TraceReader(tmp_path / "run.trace") as reader:
+        rows = list(reader.bool_rows())
+        assert len(rows) == 10
+        assert [row[2] for row in rows] == list(reader.history("Done.state"))
+        assert renderer.render_frames(rows, tmp_path / "frames") == 10
+
+
+def test_png_and_timing_diagram(tmp_path):
+    pytest.importorskip("matplotlib")
+    ladder, start = build_ladder()
+    renderer = HeadlessRenderer(ladder)
+    renderer.save_png(tmp_path / "off.png")
+    start.activate()
+    ladder.scan_once()
+    renderer.save_png(tmp_path / "on.png")
+
+    assert (tmp_path / "on.png").read_bytes()[:4] == b"\x89PNG"
+    assert (tmp_path / "on.png").read_bytes() != (tmp_path / "off.png").read_bytes()
+
+    save_timing_diagram(
+        {"Start": [False, True, True, True], "TON.ET": [0, 1, 2, 2]}, tmp_path / "timing.svg"
+    )
+    assert "<svg" in (tmp_path / "timing.svg").read_text()
+    with pytest.raises(ValueError):
+        save_timing_diagram({}, tmp_path / "empty.png")
@@ -0,0 +1,108 @@
+import random
+
+from pyladdersim.components import Contact, OnDelayTimer, Output, ResetOutput, RetentiveOutput
+from pyladdersim.ladder import Ladder, Rung
+from tests.ladders import build_mixed_ladder, snapshot
+
+
+def build_ladder():
+    # Rungs sharing one timer are scanned as a group.
+    ladder, inputs = build_mixed_ladder()
+    start, stop = inputs[:2]
+    shared = OnDelayTimer("Shared", PT=3)
+    ladder.add_rung(Rung([start, shared, Output("E")]))
+    ladder.add_rung(Rung([stop, shared, Output("F")]))
+    ladder.add_rung(Rung([stop, Output("G")]))
+    return ladder, inputs
+
+
+def test_incremental_scan_matches_full_scan():
+    full, full_inputs = build_ladder()
+    incremental, incremental_inputs = build_ladder()
+    incremental.enable_incremental()
+    rng = random.Random(11)
+
+    for _ in range(300):
+        for index in range(len(full_inputs)):
+            if rng.random() < 0.1:
+                active = rng.random() < 0.5
+                for contact in (full_inputs[index], incremental_inputs[index]):
+                    contact.activate() if active else contact.deactivate()
+
+        assert incremental.scan_once() is full.scan_once()
+        assert snapshot(incremental) == snapshot(full)
+
+
+def test_incremental_scan_skips_quiescent_rungs():
+    inputs = [Contact(f"In{i}") for i in range(50)]
+    ladder = Ladder()
+    for contact in inputs:
+        ladder.add_rung(Rung([contact, Output(f"Out{contact.name}")]))
+    scanner = ladder.enable_incremental()
+
+    ladder.scan_once()
+    assert scanner.last_evaluated == 50
+    ladder.scan_once()
+    assert scanner.last_evaluated == 0
+
+    inputs[7].activate()
+    assert ladder.scan_once() is False
+    assert scanner.last_evaluated == 1
+    assert ladder.rungs[7].output.state is True
+
+
+def test_running_timer_keeps_rung_hot_until_it_settles():
+    start = Contact("Start")
+    timer = OnDelayTimer("TON", PT=2)
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, timer, Output("Done")]))
+    scanner = ladder.enable_incremental()
+    ladder.scan_once()
+
+    start.activate()
+    ladder.scan_once()
+    ladder.scan_once()
+    assert timer.ET == 2
+    assert ladder.scan_once() is True
+    assert timer.ET == 3
+    assert scanner.last_evaluated == 1
+
+    start.deactivate()
+    assert ladder.scan_once() is False
+    assert ladder.scan_once() is False
+    assert scanner.last_evaluated == 1
+    ladder.scan_once()
+    assert scanner.last_evaluated == 0
+
+
+def test_add_rung_rebuilds_dependency_index():
+    start = Contact("Start")
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, Output("A")]))
+    ladder.enable_incremental()
+    ladder.scan_once()
+
+    lamp = Output("B")
+    ladder.add_rung(Rung([start, lamp]))
+    start.activate()
+
+    assert ladder.scan_once() is True
+    assert lamp.state is True
+
+
+def test_latch_set_again_after_a_reset_matches_full_scan():
+    def build():
+        ladder = Ladder()
+        latch = RetentiveOutput("M")
+        ladder.add_rung(Rung([Contact("S"), latch]))
+        ladder.add_rung(Rung([Contact("R"), ResetOutput(latch)]))
+        return ladder
+
+    full, incremental = build(), build()
+    incremental.enable_incremental()
+    for set_input, reset_input in [(1, 0), (1, 1), (1, 0), (0, 0), (0, 1), (1, 1), (1, 0)]:
+        for ladder in (full, incremental):
+            ladder.rungs[0].components[0].state = bool(set_input)
+            ladder.rungs[1].components[0].state = bool(reset_input)
+        assert incremental.scan_once() == full.scan_once()
+        assert incremental.rungs[0].output.state == full.rungs[0].output.state
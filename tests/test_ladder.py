@@ -95,3 +95,17 @@ def test_rung_scans_falling_edge_contact_even_when_upstream_is_false():
     assert rung.evaluate() is False
     one_shot.deactivate()
     assert rung.evaluate() is True
+
+
+def test_component_lookup_by_name():
+    start = Contact("Start")
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, Output("Motor")]))
+    ladder.add_rung(Rung([start, Contact("Lamp"), Output("Lamp")]))
+
+    assert ladder.component("Start") is start
+    assert [len(found) for found in ladder.components_by_name().values()] == [1, 1, 2]
+    with pytest.raises(KeyError):
+        ladder.component("Missing")
+    with pytest.raises(ValueError):
+        ladder.component("Lamp")
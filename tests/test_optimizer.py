@@ -0,0 +1,111 @@
+import pytest
+
+from pyladdersim.branches import Parallel
+from pyladdersim.components import (
+    Contact,
+    CounterDown,
+    CounterUp,
+    InvertedContact,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    RisingEdgeContact,
+)
+from pyladdersim.ladder import Ladder, Rung
+
+
+def build_ladder():
+    start, jog = Contact("Start"), Contact("Jog")
+    maintenance, bypass = Contact("Maintenance"), InvertedContact("Bypass")
+    counter = CounterUp("Parts", preset=3)
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, bypass, Output("Motor")]))
+    ladder.add_rung(Rung([maintenance, Contact("Door"), jog, Output("Service")]))
+    ladder.add_rung(Rung([maintenance, start, OnDelayTimer("TON", PT=2), Output("Delay")]))
+    ladder.add_rung(Rung([jog, Contact("Aux"), Output("Debug")]))
+    ladder.add_rung(Rung([RisingEdgeContact("Eye"), counter, Output("Batch")]))
+    ladder.add_rung(Rung([start, counter, Output("Spare")]))
+    return ladder
+
+
+def test_folding_and_dead_rungs_are_reported():
+    optimized, report = build_ladder().optimize(
+        inputs=["Start", "Jog", "Eye"], outputs=["Motor", "Service", "Delay", "Batch"]
+    )
+
+    assert report.constant_contacts == {"Bypass": True, "Maintenance": False, "Door": False, "Aux": False}
+    # Debug is unobserved; Spare is unobserved but shares the counter with Batch.
+    assert report.dead_rungs == [3]
+    assert report.short_circuited_rungs == [1, 2]
+    assert [len(rung.components) for rung in optimized.rungs] == [2, 2, 3, 3, 3]
+    assert [rung.output.name for rung in optimized.rungs] == ["Motor", "Service", "Delay", "Batch", "Spare"]
+    assert report.elements_after < report.elements_before
+    assert "dead rungs: [3]" in str(report)
+
+    with pytest.raises(KeyError):
+        build_ladder().optimize(inputs=["Missing"])
+    with pytest.raises(KeyError):
+        build_ladder().optimize(outputs=["Start"])
+
+
+def test_optimized_program_matches_observable_outputs():
+    observed = ["Motor", "Service", "Delay", "Batch", "Spare"]
+    reference = build_ladder()
+    source = build_ladder()
+    optimized, _ = source.optimize(inputs=["Start", "Jog", "Eye"], outputs=observed)
+    # The optimized rungs share component objects with the source ladder.
+    inputs = {component.name: component for component in source.components()}
+
+    for scan in range(30):
+        vector = {"Start": scan % 4 != 0, "Jog": scan % 3 == 0, "Eye": scan % 2 == 0}
+        expected = next(iter(reference.run_stimulus([vector], outputs=observed)))
+        for name, value in vector.items():
+            inputs[name].activate() if value else inputs[name].deactivate()
+        optimized.scan_once()
+        assert {name: inputs[name].state for name in observed} == expected
+        assert inputs["TON"].ET == reference.rungs[2].components[2].ET
+
+
+def test_without_hints_the_program_is_unchanged():
+    ladder = build_ladder()
+    optimized, report = ladder.optimize()
+
+    assert report.constant_contacts == {} and report.dead_rungs == []
+    assert [rung.components for rung in optimized.rungs] == [rung.components for rung in ladder.rungs]
+
+
+@pytest.mark.parametrize(
+    "block",
+    [lambda: CounterDown("CTD", preset=0), lambda: OffDelayTimer("TOF", PT=2), lambda: CounterUp("CTU", preset=0)],
+)
+def test_contacts_after_a_block_are_kept_when_power_is_constant_false(block):
+    def build():
+        idle, x = Contact("Idle"), Contact("X")
+        ladder = Ladder()
+        ladder.add_rung(Rung([idle, block(), x, Output("Y")]))
+        return ladder, x
+
+    reference, reference_x = build()
+    source, x = build()
+    optimized, _ = source.optimize(inputs=["X"])
+    assert any(component is x for component in optimized.rungs[0].components)
+
+    for scan in range(8):
+        value = scan % 3 == 0
+        reference_x.state = x.state = value
+        assert optimized.scan_once() == reference.scan_once()
+
+
+def test_contacts_inside_branch_networks_stay_live():
+    mode, enable = Contact("Mode"), Contact("Enable")
+    enable.activate()
+    ladder = Ladder()
+    ladder.add_rung(Rung([Parallel(mode, Contact("Start")), enable, Output("Y")]))
+
+    optimized, report = ladder.optimize(inputs=["Start"])
+
+    # Mode is not an input but sits in a network, so it is neither folded nor reported.
+    assert report.constant_contacts == {"Enable": True}
+    assert optimized.scan_once() is False
+    mode.activate()
+    assert optimized.scan_once() is True
@@ -0,0 +1,67 @@
+import pytest
+
+from pyladdersim.components import (
+    Contact,
+    CounterUp,
+    OnDelayTimer,
+    Output,
+    ResetOutput,
+    RetentiveOutput,
+    RisingEdgeContact,
+)
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.parallel import partition_rungs
+
+
+def build_ladder(shared):
+    ladder = Ladder()
+    ladder.add_rung(Rung([shared, OnDelayTimer("T1", PT=3), Output("A")]))
+    ladder.add_rung(Rung([shared, Contact("B_in"), Output("B")]))
+    counter = CounterUp("CTU", preset=2)
+    ladder.add_rung(Rung([RisingEdgeContact("Pulse"), counter, Output("C")]))
+    ladder.add_rung(Rung([Contact("Reset"), counter, Output("D")]))
+    return ladder
+
+
+def test_rungs_sharing_written_components_stay_together():
+    ladder = build_ladder(Contact("Start"))
+    # Plain contacts are only read, so rungs 0 and 1 are independent.
+    assert sorted(partition_rungs(ladder.rungs)) == [[0], [1], [2, 3]]
+
+
+def test_set_and_reset_coils_of_one_latch_stay_together():
+    latch = RetentiveOutput("M")
+    rungs = [Rung([Contact("S"), latch]), Rung([Contact("X"), Output("Y")]), Rung([Contact("R"), ResetOutput(latch)])]
+    assert sorted(partition_rungs(rungs)) == [[0, 2], [1]]
+
+
+def test_parallel_scan_matches_serial_scan():
+    serial = build_ladder(Contact("Start"))
+    parallel = build_ladder(Contact("Start"))
+    parallel.enable_parallel(workers=3)
+    extra = Rung([Contact("Late"), Output("E")])
+    parallel.add_rung(extra)
+    serial.add_rung(Rung([Contact("Late"), Output("E")]))
+
+    try:
+        for scan in range(12):
+            for ladder in (serial, parallel):
+                for rung in ladder.rungs:
+                    for component in rung.components:
+                        if isinstance(component, Contact) and not isinstance(component, RisingEdgeContact):
+                            component.state = scan % 3 != 0
+                        elif isinstance(component, RisingEdgeContact):
+                            component.state = scan % 2 == 0
+            assert parallel.scan_once() == serial.scan_once()
+            assert [c.state for c in parallel.components()] == [c.state for c in serial.components()]
+        assert parallel.rungs[2].components[1].CV == serial.rungs[2].components[1].CV
+    finally:
+        parallel.disable_parallel()
+    assert parallel.parallel is None
+
+
+def test_worker_count_must_be_positive():
+    ladder = build_ladder(Contact("Start"))
+    with pytest.raises(ValueError):
+        ladder.enable_parallel(workers=0)
+    assert ladder.parallel is None
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from pyladdersim.components import Contact, CounterUp, Output, RisingEdgeContact
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.plant import PlantRunner
+
+
+def relay(input_name, output_name):
+    ladder = Ladder()
+    ladder.add_rung(Rung([Contact(input_name), Output(output_name)]))
+    return ladder
+
+
+def build_plant(workers=2, synchronized=True):
+    plant = PlantRunner(workers=workers, synchronized=synchronized)
+    first = relay("Start", "Motor")
+    first.rungs[0].components[0].activate()
+    plant.add("plc1", first)
+    plant.add("plc2", relay("Feedback", "Lamp"))
+    plant.add("plc3", relay("Lamp", "Horn"))
+    plant.link("plc1.Motor", "plc2.Feedback")
+    plant.link("plc2.Lamp", "plc3.Lamp")
+    return plant
+
+
+def output(plant, ladder_name):
+    return plant.ladders[ladder_name].rungs[0].output.state
+
+
+@pytest.mark.parametrize("scans, lamp, horn", [(1, False, False), (2, True, False), (3, True, True)])
+def test_synchronized_links_carry_last_cycle_outputs(scans, lamp, horn):
+    plant = build_plant()
+
+    statistics = plant.run(scans)
+
+    assert output(plant, "plc1") is True
+    assert output(plant, "plc2") is lamp
+    assert output(plant, "plc3") is horn
+    assert list(statistics) == ["plc1", "plc2", "plc3"]
+    assert all(stats.scans == scans for stats in statistics.values())
+    assert plant.ladders["plc2"].scan_count == scans
+    assert len(plant.worker_statistics) == 2
+
+
+def test_free_running_workers_with_a_cycle_time():
+    plant = build_plant(workers=3, synchronized=False)
+    counter = Ladder()
+    counter.add_rung(Rung([RisingEdgeContact("Pulse"), CounterUp("CTU", preset=100), Output("Full")]))
+    plant.add("plc4", counter)
+    plant.link("plc1.Motor", "plc4.Pulse")
+
+    plant.run(5, cycle_time=0.001)
+
+    assert output(plant, "plc1") is True
+    assert plant.ladders["plc4"].rungs[0].components[1].CV == 1
+    assert sum(stats.scans for stats in plant.worker_statistics) == 15
+
+
+def test_links_are_validated():
+    plant = build_plant()
+    with pytest.raises(KeyError):
+        plant.link("plc9.Motor", "plc2.Feedback")
+    with pytest.raises(KeyError):
+        plant.link("plc1.Missing", "plc2.Feedback")
+    with pytest.raises(TypeError):
+        plant.link("plc1.Start", "plc2.Lamp")
+    with pytest.raises(ValueError):
+        plant.add("plc1", Ladder())
+
+
+class Crash(Contact):
+    __slots__ = ()
+
+    def evaluate(self):
+        os._exit(3)
+
+
+@pytest.mark.parametrize("synchronized", [True, False])
+def test_crashed_worker_is_reported(synchronized):
+    plant = build_plant(workers=2, synchronized=synchronized)
+    broken = Ladder()
+    broken.add_rung(Rung([Crash("Boom"), Output("Never")]))
+    plant.add("plc0", broken)
+    with pytest.raises(RuntimeError, match="exited with code 3"):
+        plant.run(5)
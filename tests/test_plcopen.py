@@ -0,0 +1,191 @@
+import io
+
+import pytest
+
+from pyladdersim.branches import Parallel, SharedNetwork
+from pyladdersim.components import (
+    CoilContact,
+    Contact,
+    CounterUp,
+    InvertedContact,
+    OnDelayTimer,
+    ResetOutput,
+    RetentiveOutput,
+    RisingEdgeContact,
+)
+from pyladdersim.ladder import Ladder
+
+HEADER = '<?xml version="1.0"?><project xmlns="http://www.plcopen.org/xml/tc6_0201"><types><pous>'
+FOOTER = "</pous></types></project>"
+
+
+def link(*refs):
+    connections = "".join(
+        f'<connection refLocalId="{ref}"/>' if isinstance(ref, int) else
+        f'<connection refLocalId="{ref[0]}" formalParameter="{ref[1]}"/>'
+        for ref in refs
+    )
+    return f"<connectionPointIn>{connections}</connectionPointIn>"
+
+
+def contact(local_id, variable, *refs, **attributes):
+    extra = "".join(f' {key}="{value}"' for key, value in attributes.items())
+    return f'<contact localId="{local_id}"{extra}>{link(*refs)}<connectionPointOut/><variable>{variable}</variable></contact>'
+
+
+def coil(local_id, variable, *refs, **attributes):
+    extra = "".join(f' {key}="{value}"' for key, value in attributes.items())
+    return f'<coil localId="{local_id}"{extra}>{link(*refs)}<connectionPointOut/><variable>{variable}</variable></coil>'
+
+
+def block(local_id, type_name, instance, pins):
+    inputs = "".join(f'<variable formalParameter="{pin}">{link(ref)}</variable>' for pin, ref in pins.items())
+    return (
+        f'<block localId="{local_id}" typeName="{type_name}" instanceName="{instance}">'
+        f'<inputVariables>{inputs}</inputVariables><inOutVariables/>'
+        f'<outputVariables><variable formalParameter="Q"><connectionPointOut/></variable></outputVariables></block>'
+    )
+
+
+def literal(local_id, text):
+    return f'<inVariable localId="{local_id}"><connectionPointOut/><expression>{text}</expression></inVariable>'
+
+
+def pou(name, *elements, body="LD"):
+    return (
+        f'<pou name="{name}" pouType="program"><interface><localVars><variable name="x"><type><BOOL/></type></variable>'
+        f'</localVars></interface><body><{body}><leftPowerRail localId="1"><connectionPointOut/></leftPowerRail>'
+        f'{"".join(elements)}</{body}></body></pou>'
+    )
+
+
+def document(*pous):
+    return (HEADER + "".join(pous) + FOOTER).encode("utf-8")
+
+
+MAIN = pou(
+    "Main",
+    contact(2, "Start", 1),
+    contact(3, "Stop", 2, negated="true"),
+    contact(4, "Jog", 1),
+    coil(5, "Motor", 3, 4),
+    block(6, "TON", "Delay", {"IN": 3, "PT": 7}),
+    literal(7, "T#2500ms"),
+    coil(8, "Alarm", (6, "Q")),
+    coil(9, "Horn", (6, "Q")),
+    contact(10, "Eye", 1, edge="rising"),
+    block(11, "CTU", "Parts", {"CU": 10, "PV": 12, "R": 13}),
+    literal(12, "INT#2"),
+    literal(13, "FALSE"),
+    coil(14, "Full", (11, "Q"), storage="set"),
+    contact(15, "Ack", 1),
+    coil(16, "Full", 15, storage="reset"),
+)
+
+
+def by_name(ladder):
+    return {component.name: component for component in ladder.components()}
+
+
+def test_imports_ld_elements_onto_components(tmp_path):
+    path = tmp_path / "export.xml"
+    path.write_bytes(document(MAIN, pou("Other", contact(2, "Other", 1), coil(3, "Spare", 2))))
+
+    ladder = Ladder.from_plcopen(path, pou="Main", cycle_time=0.5)
+    assert [rung.output.name for rung in ladder.rungs] == ["Motor", "Alarm", "Horn", "Full", "Full.R"]
+    components = by_name(ladder)
+    assert isinstance(ladder.rungs[0].components[0], Parallel)
+    assert type(components["Stop"]) is InvertedContact
+    assert isinstance(components["Eye"], RisingEdgeContact)
+    assert isinstance(components["Delay"], OnDelayTimer) and components["Delay"].PT == 5
+    assert isinstance(components["Parts"], CounterUp) and components["Parts"].PV == 2
+    assert isinstance(ladder.rungs[3].output, RetentiveOutput)
+    assert isinstance(ladder.rungs[4].output, ResetOutput)
+    assert ladder.rungs[4].output.latch is ladder.rungs[3].output
+    # The timer feeds two coils but is evaluated once per scan.
+    assert isinstance(ladder.rungs[2].components[0], SharedNetwork)
+
+    components["Start"].activate()
+    for _ in range(4):
+        ladder.scan_once()
+    assert components["Motor"].state and not components["Alarm"].state
+    ladder.scan_once()
+    assert components["Alarm"].state and components["Horn"].state and components["Delay"].ET == 5
+
+    eye = components["Eye"]
+    for state in (True, False, True):
+        eye.state = state
+        ladder.scan_once()
+    assert ladder.rungs[3].output.state
+    components["Ack"].activate()
+    ladder.scan_once()
+    assert not ladder.rungs[3].output.state
+
+
+def test_reads_file_objects_and_skips_other_bodies():
+    source = document(pou("Text", "<ST/>", body="ST"), pou("Main", contact(2, "A", 1), coil(3, "Y", 2)))
+    ladder = Ladder.from_plcopen(io.BytesIO(source))
+    assert [type(component) for component in ladder.components()] == [Contact, type(ladder.rungs[0].output)]
+
+    with pytest.raises(KeyError):
+        Ladder.from_plcopen(io.BytesIO(source), pou="Missing")
+
+
+SEAL_IN = pou(
+    "Main",
+    contact(2, "Start", 1),
+    contact(3, "Motor", 1),
+    contact(4, "Stop", 2, 3, negated="true"),
+    coil(5, "Motor", 4),
+    contact(6, "Motor", 1, negated="true"),
+    coil(7, "Idle", 6),
+)
+
+
+@pytest.mark.parametrize("engine", ["interpreted", "compiled", "incremental"])
+def test_seal_in_contact_holds_its_coil(tmp_path, engine):
+    ladder = Ladder.from_plcopen(io.BytesIO(document(SEAL_IN)))
+    if engine == "compiled":
+        ladder.compile()
+    elif engine == "incremental":
+        ladder.enable_incremental()
+    hold = ladder.rungs[0].components[0].elements[1]
+    assert isinstance(hold, CoilContact) and hold.coil is ladder.rungs[0].output
+    assert ladder.rungs[1].components[0].inverted
+    assert ladder.component("Motor") is ladder.rungs[0].output
+
+    steps = [{"Start": True}, {"Start": False}, {}, {"Stop": True}, {"Stop": False}]
+    run = ladder.run_stimulus(steps, outputs=["Motor", "Idle"])
+    # Idle reads Motor from the rung above in the same scan.
+    assert [scan["Motor"] for scan in run] == [True, True, True, False, False]
+    assert ladder.rungs[1].output.state is True
+
+    ladder.run_stimulus([{"Start": True}, {"Start": False}]).run()
+    ladder.save(tmp_path / "seal.plsprog")
+    loaded = Ladder.load(tmp_path / "seal.plsprog")
+    assert loaded.rungs[0].components[0].elements[1].coil is loaded.rungs[0].output
+    assert [scan["Motor"] for scan in loaded.run_stimulus([{}, {"Stop": True}])] == [True, False]
+
+
+@pytest.mark.parametrize(
+    "elements",
+    [
+        (contact(2, "A", 1), coil(3, "Y", 2, negated="true")),
+        (block(2, "TON", "T", {"IN": 1, "PT": 3}), literal(3, "Preset"), coil(4, "Y", (2, "Q"))),
+        (block(2, "MOVE", "M", {"EN": 1}), coil(3, "Y", (2, "Q"))),
+        (contact(2, "A", 3), contact(3, "B", 2), coil(4, "Y", 3)),
+        (contact(2, "Y", 1, edge="rising"), coil(3, "Y", 2)),
+    ],
+)
+def test_rejects_unsupported_networks(elements):
+    with pytest.raises(ValueError):
+        Ladder.from_plcopen(io.BytesIO(document(pou("Main", *elements))))
+
+
+def test_contacts_before_the_body_driving_their_coil_are_rejected():
+    first = pou("First", contact(2, "Motor", 1), coil(3, "Lamp", 2))
+    second = pou("Second", contact(2, "Start", 1), coil(3, "Motor", 2))
+    with pytest.raises(ValueError, match="before the body"):
+        Ladder.from_plcopen(io.BytesIO(document(first, second)))
+    ladder = Ladder.from_plcopen(io.BytesIO(document(second, first)))
+    assert isinstance(ladder.rungs[1].components[0], CoilContact)
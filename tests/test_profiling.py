@@ -0,0 +1,64 @@
+import json
+
+from pyladdersim.components import Contact, CounterUp, OnDelayTimer, Output
+from pyladdersim.ladder import Ladder, Rung
+
+
+def build_ladder():
+    start = Contact("Start")
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, OnDelayTimer("TON", PT=2), Output("A")]))
+    ladder.add_rung(Rung([start, CounterUp("CTU", preset=1), Output("B")]))
+    return ladder, start
+
+
+def test_profiling_records_rung_and_block_timings():
+    ladder, start = build_ladder()
+    profiler = ladder.enable_profiling()
+    start.activate()
+
+    results = [ladder.scan_once() for _ in range(5)]
+
+    assert results == [False, True, True, True, True]
+    assert profiler.scan_stats.calls == 5
+    assert [row["calls"] for row in profiler.rung_summary()] == [5, 5]
+    blocks = {row["name"]: row for row in profiler.block_summary()}
+    assert set(blocks) == {"TON", "CTU"}
+    assert blocks["TON"]["min"] <= blocks["TON"]["p99"] <= blocks["TON"]["max"]
+
+
+def test_profiled_scan_matches_plain_scan():
+    plain, plain_start = build_ladder()
+    profiled, profiled_start = build_ladder()
+    profiled.enable_profiling()
+
+    for active in (True, True, False, True, True, True):
+        for contact in (plain_start, profiled_start):
+            contact.activate() if active else contact.deactivate()
+        assert profiled.scan_once() is plain.scan_once()
+
+
+def test_disable_profiling_restores_previous_engine():
+    ladder, _ = build_ladder()
+    program = ladder.compile()
+    ladder.enable_profiling()
+    assert ladder._scan == ladder.profiler.scan
+
+    profiler = ladder.disable_profiling()
+    assert profiler is not None
+    assert ladder._scan == program.scan
+
+
+def test_export_chrome_trace(tmp_path):
+    ladder, _ = build_ladder()
+    profiler = ladder.enable_profiling(trace_limit=4)
+    for _ in range(3):
+        ladder.scan_once()
+
+    path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(path)
+    events = json.loads(path.read_text())["traceEvents"]
+
+    assert len(events) == 4
+    assert [event["name"] for event in events[:3]] == ["rung 0", "rung 1", "scan"]
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
@@ -0,0 +1,111 @@
+import pytest
+
+from pyladdersim.branches import Parallel, Series, SharedNetwork
+from pyladdersim.components import (
+    Component,
+    Contact,
+    CounterDown,
+    CounterUp,
+    FallingEdgeContact,
+    InvertedContact,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    PulseTimer,
+    ResetOutput,
+    RetentiveOutput,
+    RisingEdgeContact,
+)
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.tags import TagTable
+
+
+def build_ladder():
+    start, stop, jog = Contact("Start"), InvertedContact("Stop"), Contact("Jog")
+    ladder = Ladder()
+    ladder.add_rung(Rung([Parallel(Series(start, stop), jog), OnDelayTimer("TON", PT=3), Output("Run")], short_circuit=True))
+    ladder.add_rung(Rung([Parallel(Series(start, stop), jog), OffDelayTimer("TOF", PT=2), Output("Fan")]))
+    full = RetentiveOutput("Full")
+    ladder.add_rung(Rung([RisingEdgeContact("Eye"), CounterUp("CTU", preset=2), full]))
+    ladder.add_rung(Rung([Contact("Ack"), ResetOutput(full)]))
+    ladder.add_rung(Rung([FallingEdgeContact("Drop"), PulseTimer("TP", PT=2), CounterDown("CTD", preset=3), Output("Low")]))
+    return ladder
+
+
+def drive(ladder, scans):
+    for scan in range(scans):
+        vector = {"Start": scan % 5 < 3, "Jog": scan % 7 == 0, "Eye": scan % 2 == 0, "Drop": scan % 3 == 0, "Ack": scan % 6 == 5}
+        ladder.run_stimulus([vector]).run()
+
+
+def state(ladder):
+    fields = ("state", "ET", "CV", "PT", "PV", "_previous_in", "_previous_state")
+    return [
+        (type(component).__name__, component.name) + tuple(getattr(component, field, None) for field in fields)
+        for component in ladder.components()
+    ]
+
+
+@pytest.mark.parametrize("compile", [False, True])
+def test_round_trip_keeps_program_and_state(tmp_path, compile):
+    original = build_ladder()
+    drive(original, 4)
+    original.save(tmp_path / "line.plsprog")
+
+    loaded = Ladder.load(tmp_path / "line.plsprog", compile=compile)
+
+    assert state(loaded) == state(original)
+    assert loaded.scan_count == original.scan_count
+    assert (loaded.compiled is not None) is compile
+    assert isinstance(loaded.rungs[1].components[0], SharedNetwork)
+    assert loaded.rungs[3].output.latch is loaded.rungs[2].output
+    assert [rung.short_circuit for rung in loaded.rungs] == [True, False, False, False, False]
+
+    drive(original, 20)
+    drive(loaded, 20)
+    assert state(loaded) == state(original)
+
+
+def test_load_defers_planning_and_bytecode_to_the_first_scan(tmp_path):
+    build_ladder().save(tmp_path / "line.plsprog")
+    loaded = Ladder.load(tmp_path / "line.plsprog", compile=True)
+    chunks = loaded.compiled.scan.__globals__
+    assert chunks["_scan_chunk_0"].__name__ == "run_chunk"
+    assert all(rung._plan is None for rung in loaded.rungs)
+
+    loaded.scan_once()
+    assert chunks["_scan_chunk_0"].__name__ == "_scan_chunk_0"
+    loaded.decompile()
+    loaded.scan_once()
+    # Only the short-circuit rung needs a plan.
+    assert [rung._plan is not None for rung in loaded.rungs] == [True, False, False, False, False]
+
+
+def test_load_builds_the_calling_class(tmp_path):
+    class Line(Ladder):
+        pass
+
+    build_ladder().save(tmp_path / "line.plsprog")
+    loaded = Line.load(tmp_path / "line.plsprog")
+    assert type(loaded) is Line
+    assert loaded.scan_once() is False
+
+
+def test_bound_components_save_and_custom_ones_are_rejected(tmp_path):
+    ladder = build_ladder()
+    drive(ladder, 3)
+    expected = state(ladder)
+    table = TagTable.from_ladder(ladder)
+    ladder.save(tmp_path / "bound.plsprog")
+    table.release()
+    assert state(Ladder.load(tmp_path / "bound.plsprog")) == expected
+
+    class Custom(Component):
+        __slots__ = ()
+
+    ladder.add_rung(Rung([Custom("X"), Output("Y")]))
+    with pytest.raises(TypeError):
+        ladder.save(tmp_path / "custom.plsprog")
+    (tmp_path / "bad.plsprog").write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        Ladder.load(tmp_path / "bad.plsprog")
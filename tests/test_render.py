@@ -0,0 +1,48 @@
+import pytest
+
+from pyladdersim.components import Contact, OnDelayTimer, Output
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.render import SnapshotChannel
+
+
+def build_ladder():
+    start = Contact("Start")
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, OnDelayTimer("TON", PT=2), Output("Done")]))
+    return ladder, start
+
+
+def test_channel_keeps_only_the_newest_immutable_snapshot():
+    ladder, start = build_ladder()
+    channel = SnapshotChannel(ladder)
+    start.activate()
+
+    channel.publish(ladder.scan_once())
+    first = channel.latest
+    channel.publish(ladder.scan_once())
+
+    assert first.scan == 1 and first.states == (True, False, False)
+    assert channel.latest.scan == 2
+    assert channel.latest.output is True
+    assert channel.latest.states == (True, True, True)
+
+
+def test_toggles_are_applied_at_the_next_cycle_boundary():
+    ladder, start = build_ladder()
+    channel = SnapshotChannel(ladder)
+
+    channel.request_toggle(start)
+    channel.request_toggle(start)
+    channel.request_toggle(start)
+    assert start.state is False
+
+    assert channel.apply_toggles() == 3
+    assert start.state is True
+    assert channel.apply_toggles() == 0
+
+
+def test_run_rejects_non_positive_frame_rate():
+    ladder, _ = build_ladder()
+
+    with pytest.raises(ValueError, match="frame_rate"):
+        ladder.run(visualize=True, frame_rate=0)
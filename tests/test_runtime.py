@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+import pytest
+
+from pyladdersim.components import Contact, InvertedContact, OnDelayTimer, Output
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.runtime import AsyncLadderRuntime
+
+
+def build_ladder():
+    ladder = Ladder()
+    ladder.add_rung(Rung([Contact("Start"), InvertedContact("Stop"), Output("Motor")]))
+    ladder.add_rung(Rung([Contact("Run"), OnDelayTimer("TON", PT=2), Output("Done")]))
+    return ladder
+
+
+def test_inputs_and_snapshots_are_exchanged_at_scan_boundaries():
+    ladder = build_ladder()
+    runtime = AsyncLadderRuntime(ladder, cycle_time=0.001)
+    seen = []
+
+    async def adapter():
+        async for snapshot in runtime.snapshots(maxsize=10):
+            seen.append(snapshot)
+            if snapshot.scan == 1:
+                runtime.set_input("Start", True)
+                runtime.set_input("Stop", False)
+            elif snapshot.scan == 2:
+                runtime.set_input("Stop", True)
+
+    async def main():
+        consumer = asyncio.create_task(adapter())
+        await asyncio.sleep(0)
+        stats = await runtime.run(max_scans=4)
+        await consumer
+        return stats
+
+    stats = asyncio.run(main())
+
+    assert stats.scans == 4
+    assert [snapshot.output for snapshot in seen] == [False, False, False, False]
+    motor = [snapshot.states[2] for snapshot in seen]
+    assert motor == [False, True, False, False]
+    assert ladder.running is False
+    with pytest.raises(KeyError):
+        runtime.set_input("Missing", True)
+    with pytest.raises(TypeError):
+        runtime.set_input("Motor", True)
+
+
+def test_stop_wakes_the_loop_before_the_cycle_ends():
+    ladder = build_ladder()
+
+    async def main():
+        task = asyncio.create_task(ladder.run_async(cycle_time=10.0))
+        await asyncio.sleep(0.05)
+        started = time.monotonic()
+        ladder.stop()
+        stats = await task
+        return stats, time.monotonic() - started
+
+    stats, latency = asyncio.run(main())
+
+    assert stats.scans == 1
+    assert latency < 1.0
+    assert ladder.scan_statistics is stats
+
+
+def test_cancelling_the_task_ends_the_run_cleanly():
+    ladder = build_ladder()
+    runtime = AsyncLadderRuntime(ladder, cycle_time=10.0)
+    queue = runtime.subscribe(maxsize=5)
+
+    async def main():
+        task = asyncio.create_task(runtime.run())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    assert ladder.running is False
+    assert queue.get_nowait().scan == 1
+    assert queue.get_nowait() is None
+
+
+def test_slow_subscribers_only_keep_the_newest_snapshot():
+    ladder = build_ladder()
+    runtime = AsyncLadderRuntime(ladder, cycle_time=0.001)
+    queue = runtime.subscribe()
+
+    asyncio.run(runtime.run(max_scans=5))
+
+    assert queue.qsize() == 1
+    assert queue.get_nowait() is None
@@ -0,0 +1,71 @@
+import pytest
+
+from pyladdersim.ladder import Ladder
+from pyladdersim.scheduler import ScanScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_scheduler(policy, scan_times, period=1.0):
+    clock = FakeClock()
+    starts = []
+    durations = iter(scan_times)
+
+    def scan():
+        starts.append(clock.now)
+        clock.now += next(durations)
+
+    scheduler = ScanScheduler(period, policy=policy, clock=clock, sleep=clock.sleep)
+    return scheduler, scan, starts
+
+
+def test_scheduler_keeps_absolute_deadlines():
+    scheduler, scan, starts = make_scheduler("skip", [0.3, 0.6, 0.1, 0.9])
+    stats = scheduler.run(scan, max_scans=4)
+
+    assert starts == [0.0, 1.0, 2.0, 3.0]
+    assert stats.overruns == 0
+    assert stats.max_scan_time == pytest.approx(0.9)
+    assert stats.max_jitter == 0.0
+
+
+def test_scheduler_skip_policy_drops_missed_cycles():
+    scheduler, scan, starts = make_scheduler("skip", [2.5, 0.1, 0.1])
+    stats = scheduler.run(scan, max_scans=3)
+
+    assert starts == [0.0, 3.0, 4.0]
+    assert stats.overruns == 1
+    assert stats.skipped_cycles == 2
+
+
+def test_scheduler_catch_up_policy_runs_missed_cycles_back_to_back():
+    scheduler, scan, starts = make_scheduler("catch_up", [2.5, 0.1, 0.1, 0.1])
+    stats = scheduler.run(scan, max_scans=4)
+
+    assert starts == pytest.approx([0.0, 2.5, 2.6, 3.0])
+    # The first catch-up scan also finishes after its next deadline.
+    assert stats.overruns == 2
+    assert stats.skipped_cycles == 0
+    assert stats.max_jitter == pytest.approx(1.5)
+
+
+def test_scheduler_rejects_unknown_policy():
+    with pytest.raises(ValueError, match="policy"):
+        ScanScheduler(1.0, policy="later")
+
+
+def test_ladder_run_rejects_unknown_overrun_policy():
+    ladder = Ladder()
+
+    with pytest.raises(ValueError, match="policy"):
+        ladder.run(cycle_time=0.1, overrun_policy="later")
+    assert ladder.scan_statistics is None
@@ -0,0 +1,102 @@
+import multiprocessing
+
+import pytest
+
+from pyladdersim.components import Contact, InvertedContact, Output, ResetOutput, RetentiveOutput
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.sharedimage import ProcessImageClient
+
+
+def build_ladder():
+    ladder = Ladder()
+    ladder.add_rung(Rung([Contact("Start"), InvertedContact("Stop"), Output("Motor")]))
+    ladder.add_rung(Rung([Contact("Motor_fb"), Output("Lamp")]))
+    return ladder
+
+
+def drive_start(name):
+    with ProcessImageClient(name) as client:
+        client.set_input("Start", True)
+
+
+def test_inputs_latch_at_scan_start_and_outputs_commit_at_scan_end():
+    ladder = build_ladder()
+    image = ladder.enable_process_image()
+    try:
+        with ProcessImageClient(image.name) as client:
+            assert client.inputs == ["Start", "Stop", "Motor_fb"]
+            assert client.outputs == ["Motor", "Lamp"]
+            assert client.read_outputs() == (0, {"Motor": False, "Lamp": False})
+
+            client.set_input("Start", True)
+            assert client.read_outputs()[1]["Motor"] is False
+            ladder.scan_once()
+            assert client.read_outputs() == (1, {"Motor": True, "Lamp": False})
+
+            # A normally-closed contact opens when its input signal is 1.
+            client.write_inputs([1, 1, 1])
+            ladder.scan_once()
+            assert client.read_output_bytes() == (2, b"\x00\x01")
+
+            with pytest.raises(KeyError):
+                client.set_input("Missing", True)
+            with pytest.raises(ValueError):
+                client.write_inputs([1])
+    finally:
+        ladder.disable_process_image()
+    assert ladder.process_image is None
+
+
+def test_another_process_can_drive_inputs():
+    ladder = build_ladder()
+    image = ladder.enable_process_image()
+    try:
+        process = multiprocessing.Process(target=drive_start, args=(image.name,))
+        process.start()
+        process.join()
+        ladder.scan_once()
+        assert ladder.rungs[0].output.state is True
+    finally:
+        ladder.disable_process_image()
+
+
+def test_duplicate_tag_names_are_rejected():
+    ladder = build_ladder()
+    ladder.add_rung(Rung([Contact("Start"), Output("Other")]))
+    with pytest.raises(ValueError):
+        ladder.enable_process_image()
+
+
+def test_set_and_reset_coils_get_their_own_tags():
+    ladder = Ladder()
+    latch = RetentiveOutput("M")
+    ladder.add_rung(Rung([Contact("S"), latch]))
+    ladder.add_rung(Rung([Contact("R"), ResetOutput(latch)]))
+    image = ladder.enable_process_image()
+    try:
+        with ProcessImageClient(image.name) as client:
+            assert client.outputs == ["M", "M.R"]
+            client.set_input("S", True)
+            ladder.scan_once()
+            assert client.read_outputs()[1] == {"M": True, "M.R": True}
+            client.write_inputs([0, 1])
+            ladder.scan_once()
+            assert client.read_outputs()[1] == {"M": False, "M.R": False}
+    finally:
+        ladder.disable_process_image()
+
+
+def test_local_contact_changes_are_overwritten_by_the_image():
+    ladder = build_ladder()
+    image = ladder.enable_process_image()
+    try:
+        with ProcessImageClient(image.name) as client:
+            client.set_input("Start", True)
+            ladder.scan_once()
+            start = ladder.rungs[0].components[0]
+            start.deactivate()
+            ladder.scan_once()
+            assert start.state is True
+            assert client.read_outputs()[1]["Motor"] is True
+    finally:
+        ladder.disable_process_image()
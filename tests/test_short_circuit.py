@@ -0,0 +1,95 @@
+from pyladdersim.components import (
+    Contact,
+    CounterDown,
+    CounterUp,
+    FallingEdgeContact,
+    InvertedContact,
+    OffDelayTimer,
+    OnDelayTimer,
+    Output,
+    PulseTimer,
+    RetentiveOutput,
+    RisingEdgeContact,
+    is_stateful,
+)
+from pyladdersim.ladder import Ladder, Rung
+
+
+class CountingContact(Contact):
+    """Plain contact that counts how often its state is read."""
+
+    __slots__ = ("reads", "_value")
+
+    def __init__(self, name):
+        self.reads = 0
+        self._value = False
+        super().__init__(name)
+
+    @property
+    def state(self):
+        self.reads += 1
+        return self._value
+
+    @state.setter
+    def state(self, value):
+        self._value = value
+
+
+def build_ladder(short_circuit):
+    contacts = [Contact(f"C{i}") for i in range(4)]
+    ladder = Ladder()
+    for rung in (
+        [contacts[0], contacts[1], OnDelayTimer("TON", PT=3), contacts[2], Output("Y0")],
+        [contacts[1], RisingEdgeContact("R"), contacts[3], CounterUp("CTU", preset=2), Output("Y1")],
+        [contacts[2], InvertedContact("N"), FallingEdgeContact("F"), OffDelayTimer("TOF", PT=2), Output("Y2")],
+        [contacts[3], PulseTimer("TP", PT=2), CounterDown("CTD", preset=3), RetentiveOutput("Y3")],
+        [contacts[0], contacts[2], contacts[3], Output("Y4")],
+    ):
+        ladder.add_rung(Rung(rung, short_circuit=short_circuit))
+    return ladder
+
+
+def snapshot(ladder):
+    return [
+        tuple(getattr(component, field, None) for field in ("state", "ET", "CV", "_previous_in", "_previous_state"))
+        for component in ladder.components()
+    ]
+
+
+def test_short_circuit_matches_full_evaluation():
+    fast, full = build_ladder(True), build_ladder(False)
+    for scan in range(200):
+        vector = {name: (scan * (index + 3)) % (index + 5) < 2 for index, name in enumerate(["C0", "C1", "C2", "C3", "R", "N", "F"])}
+        for ladder in (fast, full):
+            ladder.run_stimulus([vector]).run()
+        assert snapshot(fast) == snapshot(full)
+
+
+def test_plain_contacts_are_not_read_after_power_is_lost():
+    first, rest = CountingContact("First"), [CountingContact(f"C{i}") for i in range(5)]
+    edge, timer = RisingEdgeContact("Edge"), OnDelayTimer("TON", PT=2)
+    rung = Rung([first, *rest[:2], edge, timer, *rest[2:], Output("Y")], short_circuit=True)
+
+    rung.evaluate()
+
+    assert first.reads == 1
+    assert [contact.reads for contact in rest] == [0, 0, 0, 0, 0]
+    assert timer.ET == 0 and not is_stateful(first) and is_stateful(edge)
+
+    rung.short_circuit = False
+    rung.evaluate()
+    assert [contact.reads for contact in rest] == [1, 1, 1, 1, 1]
+
+
+def test_components_edited_after_the_first_scan():
+    start, extra = Contact("Start"), Contact("Extra")
+    start.activate()
+    default, fast = Rung([start, Output("A")]), Rung([start, Output("B")], short_circuit=True)
+    assert default.evaluate() is True and fast.evaluate() is True
+
+    # A full evaluation reads the edited list; a short-circuited rung needs validate_rung().
+    for rung in (default, fast):
+        rung.components.insert(1, extra)
+    assert default.evaluate() is False
+    fast.validate_rung()
+    assert fast.evaluate() is False
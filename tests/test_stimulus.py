@@ -0,0 +1,67 @@
+import pytest
+
+from pyladdersim.components import Contact, InvertedContact, OnDelayTimer, Output
+from pyladdersim.ladder import Ladder, Rung
+
+
+def build_ladder():
+    ladder = Ladder()
+    start = Contact("Start")
+    stop = InvertedContact("Stop")
+    ladder.add_rung(Rung([start, stop, Output("Run")]))
+    ladder.add_rung(Rung([start, OnDelayTimer("TON", PT=2), Output("Done")]))
+    return ladder
+
+
+def test_run_stimulus_streams_outputs():
+    ladder = build_ladder()
+    vectors = [{"Start": True}, {}, {"Stop": True}, {"Start": False, "Stop": False}]
+
+    outputs = list(ladder.run_stimulus(vectors))
+
+    assert outputs == [
+        {"Run": True, "Done": False},
+        {"Run": True, "Done": True},
+        {"Run": False, "Done": True},
+        {"Run": False, "Done": False},
+    ]
+    assert ladder.scan_count == 4
+
+
+def test_run_stimulus_reads_and_writes_files(tmp_path):
+    ladder = build_ladder()
+    stimulus = tmp_path / "inputs.csv"
+    stimulus.write_text("Start,Stop\n1,0\n1,0\n0,1\n")
+    results = tmp_path / "outputs.csv"
+
+    run = ladder.run_stimulus(stimulus, outputs=["Done"], output_path=results).run()
+
+    assert run.scans == 3
+    assert results.read_text().splitlines() == ["scan,Done", "0,0", "1,1", "2,0"]
+
+
+def test_run_stimulus_reports_first_divergent_scan(tmp_path):
+    ladder = build_ladder()
+    golden = tmp_path / "golden.jsonl"
+    golden.write_text('{"Done": false}\n{"Done": false}\n{"Done": true}\n')
+
+    run = ladder.run_stimulus([{"Start": True}] * 3, golden=golden).run()
+
+    assert run.divergence == (1, {"Done": False}, {"Done": True})
+
+
+def test_golden_scan_numbers_are_not_compared():
+    golden = [{"scan": index, **outputs} for index, outputs in enumerate(build_ladder().run_stimulus([{"Start": True}] * 3))]
+
+    run = build_ladder().run_stimulus([{"Start": True}] * 3, golden=golden).run()
+
+    assert run.divergence is None and run.scans == 3
+
+
+def test_run_stimulus_rejects_unknown_and_non_contact_names():
+    ladder = build_ladder()
+
+    with pytest.raises(KeyError, match="Missing"):
+        ladder.run_stimulus([{"Missing": True}]).run()
+    with pytest.raises(TypeError, match="not a contact"):
+        ladder.run_stimulus([{"TON": True}]).run()
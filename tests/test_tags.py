@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+from pyladdersim.components import Contact, CounterUp, FunctionBlock, InvertedContact, OnDelayTimer, Output
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.tags import TagTable
+from pyladdersim.timerwheel import WallClockOnDelayTimer
+from tests.ladders import build_mixed_ladder, snapshot
+
+
+def test_bound_components_behave_like_plain_components():
+    plain, plain_inputs = build_mixed_ladder()
+    bound, bound_inputs = build_mixed_ladder()
+    TagTable.from_ladder(bound)
+    rng = random.Random(5)
+
+    for _ in range(200):
+        for index in range(len(plain_inputs)):
+            if rng.random() < 0.3:
+                active = rng.random() < 0.5
+                for contact in (plain_inputs[index], bound_inputs[index]):
+                    contact.activate() if active else contact.deactivate()
+        assert bound.scan_once() is plain.scan_once()
+        assert snapshot(bound) == snapshot(plain)
+
+
+def test_bound_components_keep_public_api():
+    timer = OnDelayTimer("TON", PT=1)
+    stop = InvertedContact("Stop")
+    table = TagTable([timer, stop])
+
+    assert isinstance(timer, OnDelayTimer)
+    assert type(timer).__name__ == "OnDelayTimer"
+    assert stop.state is True
+    stop.activate()
+    assert stop.state is False
+
+    assert timer.evaluate(True) is True
+    assert timer.state is True and timer.Q is True
+    timer.state = False
+    assert timer.Q is False
+    assert table.bools[0] == 0
+
+
+def test_snapshot_restore_and_digest():
+    ladder, inputs = build_mixed_ladder()
+    table = TagTable.from_ladder(ladder)
+    start = inputs[0]
+    timer = ladder.rungs[0].components[2]
+
+    image = table.snapshot()
+    digest = table.digest()
+    start.activate()
+    ladder.scan_once()
+    ladder.scan_once()
+    assert timer.Q is True
+    assert table.digest() != digest
+
+    changes = {(component.name, field) for component, field, _, _ in table.diff(image)}
+    assert ("Start", "state") in changes
+    assert ("TON", "ET") in changes
+    # Both images are decoded from their bytes; the live image is untouched.
+    live = table.snapshot()
+    assert (start, "state", True, False) in table.diff(live, image)
+    assert table.snapshot() == live
+
+    table.restore(image)
+    assert table.digest() == digest
+    assert start.state is False
+    assert timer.ET == 0 and timer.Q is False
+
+
+def test_release_copies_state_back():
+    counter = CounterUp("CTU", preset=1)
+    table = TagTable([counter])
+    counter.evaluate(True)
+
+    table.release()
+
+    assert type(counter) is CounterUp
+    assert counter.CV == 1 and counter.Q is True
+    counter.evaluate(False)
+    assert counter.CV == 1
+
+
+class Inv(FunctionBlock):
+    __slots__ = ()
+
+    def evaluate(self, IN):
+        self.state = not IN
+        return self.state
+
+
+class Memo(FunctionBlock):
+    def evaluate(self, IN):
+        self.last = IN
+        return IN
+
+
+def test_custom_function_blocks_bind_only_when_their_state_fits():
+    start = Contact("Start")
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, Inv("NOT"), Output("Y")]))
+    table = TagTable.from_ladder(ladder)
+    assert ladder.scan_once() is True
+    start.activate()
+    assert ladder.scan_once() is False
+    assert len(table.snapshot()) == 3
+
+    for block in (Memo("M"), WallClockOnDelayTimer("T", PT=5)):
+        with pytest.raises(TypeError, match="cannot hold"):
+            TagTable([block])
@@ -0,0 +1,144 @@
+import random
+
+import pytest
+
+from pyladdersim.components import Contact, Output
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.timerwheel import (
+    TimerWheel,
+    WallClockOffDelayTimer,
+    WallClockOnDelayTimer,
+    WallClockPulseTimer,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.ms = 0
+
+    def __call__(self):
+        return self.ms / 1000
+
+
+class Probe:
+    def __init__(self):
+        self._deadline = self._slot = None
+        self._level = 0
+        self.expired_at = None
+
+    def _expire(self):
+        self.expired_at = wheel_now[0]
+
+
+wheel_now = [0]
+
+
+@pytest.mark.parametrize("slot_bits,levels", [(8, 4), (2, 2), (8, 1), (2, 1)])
+def test_timers_expire_exactly_when_due(slot_bits, levels):
+    clock = FakeClock()
+    wheel = TimerWheel(clock=clock, slot_bits=slot_bits, levels=levels)
+    rng = random.Random(7)
+    probes = {}
+    for _ in range(300):
+        probe = Probe()
+        wheel.schedule(probe, rng.choice([1, 2, 5, 17, 255, 256, 1000, 70_000, rng.randint(1, 200_000)]))
+        probes[probe] = probe._deadline
+    cancelled = list(probes)[:20]
+    for probe in cancelled:
+        wheel.cancel(probe)
+    assert len(wheel) == 280
+
+    while clock.ms < 210_000:
+        clock.ms += rng.choice([1, 3, 40, 999, 5000])
+        wheel_now[0] = clock.ms
+        fired = wheel.advance()
+        assert all(probes[probe] <= clock.ms for probe in fired)
+    for probe, deadline in probes.items():
+        if probe in cancelled:
+            assert probe.expired_at is None
+        else:
+            assert probe.expired_at is not None and probe.expired_at >= deadline
+            assert probe.expired_at - deadline < 5000
+    assert len(wheel) == 0
+
+
+def test_wall_clock_timers_follow_the_clock():
+    clock = FakeClock()
+    start = Contact("Start")
+    ton, tof, tp = WallClockOnDelayTimer("TON", PT=250), WallClockOffDelayTimer("TOF", PT=100), WallClockPulseTimer("TP", PT=50)
+    ladder = Ladder()
+    for timer in (ton, tof, tp):
+        ladder.add_rung(Rung([start, timer, Output(f"{timer.name}_Q")]))
+    ladder.enable_timer_wheel(TimerWheel(clock=clock))
+    assert ton.wheel is ladder.timer_wheel
+
+    def scan_at(ms):
+        clock.ms = ms
+        ladder.scan_once()
+        return ton.Q, tof.Q, tp.Q
+
+    assert scan_at(10) == (False, False, False)
+    start.activate()
+    assert scan_at(20) == (False, True, True)
+    assert (ton.ET, tp.ET) == (0, 0)
+    clock.ms = 120
+    ladder.timer_wheel.advance()
+    assert (ton.ET, tp.ET) == (100, 50) and ton.running
+    assert scan_at(269) == (False, True, False)
+    assert scan_at(270) == (True, True, False)
+    assert ton.ET == 250 and not ton.running
+    start.deactivate()
+    assert scan_at(300) == (False, True, False)
+    # TP keeps ET at PT after its pulse, like the scan-counted PulseTimer.
+    assert (ton.ET, tof.ET, tp.ET) == (0, 0, 50)
+    assert scan_at(399) == (False, True, False)
+    assert scan_at(450) == (False, False, False) and tof.ET == 100
+
+
+def test_pulse_restarts_on_every_rising_edge():
+    clock = FakeClock()
+    wheel = TimerWheel(clock=clock)
+    tp = WallClockPulseTimer("TP", PT=50, wheel=wheel)
+
+    def evaluate_at(ms, IN):
+        clock.ms = ms
+        wheel.advance()
+        return tp.evaluate(IN)
+
+    assert evaluate_at(0, True) is True
+    assert evaluate_at(30, False) is True
+    assert evaluate_at(40, True) is True and tp.ET == 0
+    assert evaluate_at(85, True) is True and tp.ET == 45
+    assert evaluate_at(90, True) is False and tp.ET == 50
+
+
+def test_incremental_scans_timer_rungs_only_when_they_fire():
+    clock = FakeClock()
+    contacts = [Contact(f"S{index}") for index in range(50)]
+    timers = [WallClockOnDelayTimer(f"T{index}", PT=10 * (index + 1)) for index in range(50)]
+    ladder = Ladder()
+    for contact, timer in zip(contacts, timers):
+        contact.activate()
+        ladder.add_rung(Rung([contact, timer, Output(f"Y{contact.name}")]))
+    ladder.enable_timer_wheel(TimerWheel(clock=clock))
+    scanner = ladder.enable_incremental()
+
+    ladder.scan_once()
+    ladder.scan_once()
+    evaluated = []
+    for ms in range(1, 501):
+        clock.ms = ms
+        ladder.scan_once()
+        evaluated.append(scanner.last_evaluated)
+    assert [timer.Q for timer in timers] == [True] * 50
+    # One rung evaluation per expiring timer; running timers cost nothing.
+    assert sum(evaluated) == 50
+    assert ladder.scan_once() is True
+
+
+def test_timers_need_a_wheel():
+    timer = WallClockOnDelayTimer("TON", PT=5)
+    with pytest.raises(ValueError):
+        timer.evaluate(IN=True)
+    with pytest.raises(ValueError):
+        WallClockOffDelayTimer("TOF", PT=-1)
@@ -0,0 +1,77 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from pyladdersim.components import Contact, CounterUp, OnDelayTimer, Output, RisingEdgeContact
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.timerwheel import TimerWheel, WallClockOnDelayTimer
+from pyladdersim.trace import TraceReader, TraceRecorder
+
+
+def build_ladder():
+    start = Contact("Start")
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, OnDelayTimer("TON", PT=3), Output("Done")]))
+    ladder.add_rung(Rung([RisingEdgeContact("ONS"), CounterUp("CTU", preset=2), Output("Count")]))
+    return ladder, start
+
+
+def test_recorded_history_matches_scans(tmp_path):
+    ladder, start = build_ladder()
+    timer = ladder.rungs[0].components[1]
+    path = tmp_path / "run.trace"
+    expected_done, expected_et, expected_start = [], [], []
+
+    with TraceRecorder(ladder, path, block_scans=16):
+        for scan in range(50):
+            if scan % 7 == 0:
+                start.deactivate() if start.state else start.activate()
+            ladder.scan_once()
+            expected_start.append(start.state)
+            expected_done.append(ladder.rungs[0].output.state)
+            expected_et.append(timer.ET)
+
+    with TraceReader(path) as reader:
+        assert reader.blocks == 4
+        assert "TON.ET" in reader.tags and "CTU.CV" in reader.tags
+        assert list(reader.scans()) == list(range(1, 51))
+        assert list(reader.history("Start.state")) == expected_start
+        assert list(reader.history("Done.state")) == expected_done
+        assert list(reader.history("TON.ET")) == expected_et
+
+
+def test_wall_clock_timer_et_is_recorded(tmp_path):
+    now = [0]
+    start, timer = Contact("Start"), WallClockOnDelayTimer("TON", PT=30)
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, timer, Output("Done")]))
+    ladder.enable_timer_wheel(TimerWheel(clock=lambda: now[0] / 1000))
+    start.activate()
+
+    with TraceRecorder(ladder, tmp_path / "run.trace", block_scans=8):
+        for ms in (0, 10, 20, 30, 40):
+            now[0] = ms
+            ladder.scan_once()
+
+    with TraceReader(tmp_path / "run.trace") as reader:
+        assert list(reader.history("TON.ET")) == [0, 10, 20, 30, 30]
+        assert list(reader.history("Done.state")) == [False, False, False, True, True]
+
+
+def test_recorder_detaches_on_close(tmp_path):
+    ladder, _ = build_ladder()
+    recorder = TraceRecorder(ladder, tmp_path / "run.trace", block_scans=8)
+    ladder.scan_once()
+    recorder.close()
+    ladder.scan_once()
+
+    with TraceReader(tmp_path / "run.trace") as reader:
+        assert list(reader.scans()) == [1]
+
+
+def test_reader_rejects_unknown_files(tmp_path):
+    path = tmp_path / "bogus.trace"
+    path.write_bytes(b"not a trace file")
+
+    with pytest.raises(ValueError, match="trace file"):
+        TraceReader(path)
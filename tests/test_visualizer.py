@@ -0,0 +1,113 @@
+import pytest
+
+pytest.importorskip("tkinter")
+
+from pyladdersim.components import Contact, InvertedContact, OnDelayTimer, Output
+from pyladdersim.ladder import Ladder, Rung
+from pyladdersim.visualize_shapes import OFF_COLOR, ON_COLOR, LadderCanvas
+
+
+class FakeCanvas:
+    def __init__(self):
+        self.items = {}
+        self.bindings = {}
+        self.created = 0
+        self.recolored = []
+
+    def _create(self, kind, *args, **options):
+        self.created += 1
+        self.items[self.created] = dict(options, kind=kind)
+        return self.created
+
+    def create_line(self, *args, **options):
+        return self._create("line", *args, **options)
+
+    def create_oval(self, *args, **options):
+        return self._create("oval", *args, **options)
+
+    def create_rectangle(self, *args, **options):
+        return self._create("rectangle", *args, **options)
+
+    def create_text(self, *args, **options):
+        return self._create("text", *args, **options)
+
+    def delete(self, tag):
+        self.items.clear()
+
+    def tag_bind(self, item, event, callback):
+        self.bindings[item] = callback
+
+    def itemconfig(self, item, **options):
+        self.items[item].update(options)
+        self.recolored.append(item)
+
+
+def build_ladder():
+    start = Contact("Start")
+    stop = InvertedContact("Stop")
+    timer = OnDelayTimer("TON", PT=2)
+    ladder = Ladder()
+    ladder.add_rung(Rung([start, stop, timer, Output("Lamp")]))
+    return ladder, start, timer
+
+
+def test_refresh_only_recolors_changed_components():
+    ladder, start, _ = build_ladder()
+    canvas = FakeCanvas()
+    view = LadderCanvas(canvas, ladder)
+    view.build()
+    created = canvas.created
+
+    # Only the normally-closed contact starts out TRUE.
+    assert view.refresh() == 1
+    assert view.refresh() == 0
+
+    start.activate()
+    assert view.refresh() == 1
+    assert canvas.created == created
+
+    contact_items = [item for item, options in canvas.items.items() if options.get("text") == "Start"]
+    assert canvas.items[contact_items[0]]["fill"] == ON_COLOR
+
+
+def test_refresh_reads_state_without_evaluating_the_ladder():
+    ladder, start, timer = build_ladder()
+    view = LadderCanvas(FakeCanvas(), ladder)
+    start.activate()
+    ladder.scan_once()
+
+    view.refresh()
+    view.refresh()
+
+    assert timer.ET == 1
+    assert ladder.rungs[0].output.state is False
+
+
+def test_layout_change_triggers_rebuild_and_clicks_toggle():
+    ladder, start, _ = build_ladder()
+    canvas = FakeCanvas()
+    toggled = []
+    view = LadderCanvas(canvas, ladder, on_toggle=toggled.append)
+    view.refresh()
+
+    extra = Contact("Extra")
+    ladder.add_rung(Rung([extra, Output("Other")]))
+    view.refresh()
+
+    assert extra in view.contact_buttons
+    canvas.bindings[view.contact_buttons[extra]](None)
+    assert toggled == [extra]
+    assert all(options.get("fill") in (OFF_COLOR, ON_COLOR, "black", "") for options in canvas.items.values())
+
+
+def test_refresh_can_draw_from_snapshot_states():
+    ladder, start, timer = build_ladder()
+    canvas = FakeCanvas()
+    view = LadderCanvas(canvas, ladder)
+    view.build()
+    states = [False] * len(view.components)
+    states[view.components.index(timer)] = True
+
+    assert view.refresh(states) == 1
+    assert start.state is False
+    assert view.refresh(states[:-1]) == 0